@@ -0,0 +1,715 @@
+"""
+Regex/label extraction kernel for expanded contract pages.
+
+Pure functions over page HTML and label->value results, kept free of GUI and
+browser state so they can run in worker processes and be compiled with mypyc
+(``mypyc extraction.py``); the compiled extension is picked up by the normal
+``import extraction`` when present.
+"""
+import re
+import bisect
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+try:
+    import re2  # type: ignore  # google-re2: linear-time matching, no backtracking on large HTML
+except ImportError:
+    re2 = None
+try:
+    from selectolax.lexbor import LexborHTMLParser  # C-level HTML5 parser for the full-HTML fallback
+except ImportError:
+    LexborHTMLParser = None  # type: ignore
+
+def _compile(pattern, flags=0):
+    """Compile with RE2 when installed, falling back to stdlib re for patterns RE2 rejects."""
+    if re2 is not None:
+        options = re2.Options()
+        options.log_errors = False
+        options.case_sensitive = not flags & re.IGNORECASE
+        options.dot_nl = bool(flags & re.DOTALL)
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+# "$0.07 × 1,062" bid/ask size format - first hit is the bid, second is the ask
+_BIDASK_CROSS_RE = _compile(r'\$(\d+\.\d{2,4})\s*×\s*(\d+)')
+
+def _compile_all(patterns, flags=0):
+    """Compile a list of regex strings with shared flags."""
+    return tuple(_compile(pattern, flags) for pattern in patterns)
+
+# Special patterns for Robinhood's HTML structure where label and value are separated
+# Pattern: <label>Last trade</label>...<value>$0.08</value>
+_SPECIAL_PATTERNS = (
+    (_compile(r'Last trade</div></span><div[^>]*></div><span[^>]*><div[^>]*>\$?(\d+\.\d{2})</div>'), 'current_price'),
+    (_compile(r'Low</div></span><div[^>]*></div><span[^>]*><div[^>]*>\$?(\d+\.\d{2})</div>'), 'low'),
+    (_compile(r'Implied volatility</div></span><div[^>]*></div><span[^>]*><div[^>]*>(\d+\.\d{2})%</div>'), 'iv'),
+)
+
+# Field -> fallback patterns (lowercase, matched against content.lower()), tried in order until one matches
+_FIELD_PATTERNS = {
+    'current_price': _compile_all([
+        r'last trade[:\s]*\$?(0?\.\d{2})',  # Last trade with 2 decimal places
+        r'last trade[:\s]*\$?(\d{1,2}\.\d{2})',  # Allow up to 2 digits
+        r'mark[:\s]*\$?(0?\.\d{2,4})',  # Mark price for options
+        r'(?:last|price|mark|current)[:\s]+\$?(0?\.\d{2,4})',  # Option prices < $1
+        r'premium[:\s]+\$?(0?\.\d{2,4})', 
+        r'\$(0?\.\d{2,4})\s*(?:last|current)',
+    ]),
+    'bid': _compile_all([
+        r'bid[:\s]+\$?(\d+\.\d{2,4})',
+        r'bid\s*\$?(\d+\.\d{2,4})',
+        r'bid[:\s]*\$?(\d+\.\d{2,4})',
+        r'bid[:\s]*(\d+\.\d{2,4})',  # Robinhood format
+        r'bid.*?\$(\d+\.\d{2,4})',  # Match Bid followed by $price
+    ]),
+    'ask': _compile_all([
+        r'ask[:\s]+\$?(\d+\.\d{2,4})',
+        r'ask\s*\$?(\d+\.\d{2,4})',
+        r'ask[:\s]*\$?(\d+\.\d{2,4})',
+        r'ask[:\s]*(\d+\.\d{2,4})',  # Robinhood format
+        r'ask.*?\$(\d+\.\d{2,4})',  # Match Ask followed by $price
+    ]),
+    'volume': _compile_all([
+        r'volume[:\s]+(\d+(?:,\d+)*)',
+        r'vol[:\s]+(\d+(?:,\d+)*)',
+        r'volume[:\s]*(\d+(?:,\d+)*)',
+        r'volume[:\s]*(\d{1,3}(?:,\d{3})*)',  # 14,029 format
+        r'volume[:\s]*(\d+)',  # Simple format
+        r'volume.*?(\d{1,3}(?:,\d{3})*)',  # Match Volume followed by number
+    ]),
+    'open_interest': _compile_all([
+        r'open interest[:\s]+(\d+(?:,\d+)*)',
+        r'oi[:\s]+(\d+(?:,\d+)*)',
+        r'open interest[:\s]*(\d+(?:,\d+)*)',
+        r'open interest[:\s]*(\d{1,3}(?:,\d{3})*)',  # 3,726 format
+        r'open interest[:\s]*(\d+)',  # Simple format
+        r'open interest.*?(\d+)',  # Match Open interest followed by number
+    ]),
+    'theta': _compile_all([
+        r'theta[:\s]+(-?\d+\.\d{2,4})',
+        r'θ[:\s]+(-?\d+\.\d{2,4})',
+        r'theta[:\s]*(-?\d+\.\d+)',  # More flexible
+        r'θ[:\s]*(-?\d+\.\d+)',
+        r'theta[:\s]*(-?\d+\.\d{4})',  # 4 decimal places
+        r'theta[:\s]*(\d+\.\d{4})',  # Positive format
+        r'theta[:\s]*(-?\d+\.\d{4})',  # -0.1305 format
+        r'theta[:\s]*(-?\d+\.\d{2,4})',  # Robinhood format
+        r'theta.*?(-?\d+\.\d{4})',  # Match Theta followed by number
+    ]),
+    'gamma': _compile_all([
+        r'gamma[:\s]+(\d+\.\d{2,4})',
+        r'γ[:\s]+(\d+\.\d{2,4})',
+        r'gamma[:\s]*(\d+\.\d+)',  # More flexible
+        r'γ[:\s]*(\d+\.\d+)',
+        r'gamma[:\s]*(\d+\.\d{4})',  # 4 decimal places
+        r'gamma[:\s]*(\d+\.\d{2,4})',  # Robinhood format
+        r'gamma.*?(\d+\.\d{4})',  # Match Gamma followed by number
+    ]),
+    'delta': _compile_all([
+        r'delta[:\s]+(-?\d+\.\d{2,4})',
+        r'δ[:\s]+(-?\d+\.\d{2,4})',
+        r'delta[:\s]*(-?\d+\.\d+)',  # More flexible
+        r'δ[:\s]*(-?\d+\.\d+)',
+        r'delta[:\s]*(-?\d+\.\d{4})',  # 4 decimal places
+        r'delta[:\s]*(-?\d+\.\d{2,4})',  # Robinhood format
+        r'delta.*?(\d+\.\d{4})',  # Match Delta followed by number
+    ]),
+    'vega': _compile_all([
+        r'vega[:\s]*(\d+\.\d{4})',
+        r'vega[:\s]*\$?(\d+\.\d{4})',
+        r'vega\s*(\d+\.\d{4})',
+        r'vega.*?(\d+\.\d{4})',
+    ]),
+    'high': _compile_all([
+        r'high[:\s]*\$?(\d+\.\d{2,4})',
+        r'high\s*\$?(\d+\.\d{2,4})',
+        r'day high[:\s]*\$?(\d+\.\d{2,4})',
+        r'daily high[:\s]*\$?(\d+\.\d{2,4})',
+        r'high.*?\$(\d+\.\d{2,4})',
+        r'(\d+\.\d{2,4})\s*high',  # Price followed by "High"
+    ]),
+    'low': _compile_all([
+        r'low[\s\n]*\$?(0?\.\d{2})',  # Low with newline/space then price
+        r'low[:\s]*\$?(0?\.\d{2})',  # Look for prices starting with 0. or just .
+        r'low\s*\$?(0?\.\d{2})',
+        r'day low[:\s]*\$?(0?\.\d{2,4})',
+        r'daily low[:\s]*\$?(0?\.\d{2,4})',
+        r'low.*?\$(0?\.\d{2})',
+        r'(0?\.\d{2})\s*low',  # Price followed by "Low"
+        # Special pattern to get the second price after High (which should be Low)
+        r'high[:\s]*\$?0?\.\d{2,4}[^\d]+(0?\.\d{2})',
+        # Look for Low in a table/list structure after High
+        r'high.*?</?\w+>.*?low.*?(0?\.\d{2})',
+        # Look for pattern where Low value might be in next element/line
+        r'low[^0-9\$]{0,20}(0?\.\d{2})',
+        # Fallback patterns that look for any decimal under 10
+        r'low[:\s]*\$?(\d{1}\.\d{2})',  # Single digit prices
+        r'low.*?\$(\d{1}\.\d{2})',
+        # Last resort - any price after High that's under 10
+        r'high[:\s]*\$?\d+\.\d{2,4}[^\d]+(\d{1,2}\.\d{2})',
+    ]),
+    'iv': _compile_all([
+        r'implied volatility[\s\n]*(\d+\.\d+)%',  # Implied volatility with newline
+        r'implied volatility[:\s]*(\d+\.\d+)%?',
+        r'implied volatility[:\s]*(\d{2}\.\d{2})%?',  # XX.XX format specifically
+        r'(?:implied\s+)?(?:vol|volatility)[:\s]+(\d+\.\d+)%?',
+        r'iv[:\s]+(\d+\.\d+)%?',
+        r'(\d{2}\.\d{2})%',  # XX.XX format specifically
+    ]),
+    'strike': _compile_all([
+        r'\$(\d{3,4})\s+call',  # $635 Call format
+        r'\$(\d{3,4})\s+put',   # $635 Put format
+        r'spy\s+\$(\d{3,4})',   # SPY $635 format
+        r'strike[:\s]+\$?(\d+)',
+        r'strike\s+price[:\s]+\$?(\d+)',
+        r'strike[:\s]*\$?(\d+)',  # Robinhood format
+    ]),
+    'expiration': _compile_all([
+        r'call\s+(\d{1,2}/\d{1,2})',  # Call 8/4 format
+        r'put\s+(\d{1,2}/\d{1,2})',   # Put 8/4 format
+        r'(\d{1,2}/\d{1,2})$',         # Date at end of title
+        r'(?:exp|expires?)[:\s]+(\d{1,2}/\d{1,2}(?:/\d{2,4})?)',
+        r'expiration[:\s]+(\d{1,2}/\d{1,2}(?:/\d{2,4})?)',
+        r'expires[:\s]*(\d{1,2}/\d{1,2}(?:/\d{2,4})?)',  # Robinhood format
+    ]),
+}
+
+# Field -> literal keywords at least one of which every pattern for that field needs;
+# a plain substring check rules the whole pattern list out before any regex runs
+_FIELD_KEYWORDS = {
+    'current_price': ('last', 'price', 'mark', 'current', 'premium'),
+    'volume': ('vol',),
+    'open_interest': ('open interest', 'oi'),
+    'theta': ('theta', 'θ'),
+    'gamma': ('gamma', 'γ'),
+    'delta': ('delta', 'δ'),
+    'vega': ('vega',),
+    'high': ('high',),
+    'low': ('low', 'high'),
+}
+
+# Direct text matching fallbacks
+_VOLUME_RE = _compile(r'Volume[:\s]*(\d{1,3}(?:,\d{3})*)')
+_OPEN_INTEREST_RE = _compile(r'Open interest[:\s]*(\d{1,3}(?:,\d{3})*)')
+_HIGH_RE = _compile(r'High[:\s]*\$?(\d+\.\d{2,4})')
+# Alternative high/low shapes, tried in priority order: an explicit "Day High" anywhere on the
+# page beats a looser shape that happens to match earlier (e.g. inside CSS). Each entry is
+# (pattern, group holding the value)
+_HIGH_ALT_RES = (
+    (_compile(r'Day High[:\s]*\$?(\d+\.\d{2,4})'), 1),
+    (_compile(r'Daily High[:\s]*\$?(\d+\.\d{2,4})'), 1),
+    (_compile(r'High.*?\$(\d+\.\d{2,4})'), 1),
+    (_compile(r'(\d+\.\d{2,4})\s*High'), 1),
+)
+_HIGH_LOW_RE = _compile(r'high[:\s]*\$?(\d+\.\d{2,4}).*?low[:\s]*\$?(\d+\.\d{2,4})', re.DOTALL)
+_LOW_HIGH_RE = _compile(r'low[:\s]*\$?(\d+\.\d{2,4}).*?high[:\s]*\$?(\d+\.\d{2,4})', re.DOTALL)
+_LOW_RE = _compile(r'Low[:\s]*\$?(\d+\.\d{2,4})')
+# Lowercase, matched against content.lower()
+_LOW_ALT_RES = tuple((_compile(pattern, re.DOTALL), group) for pattern, group in (
+    (r'day low[:\s]*\$?(\d+\.\d{2,4})', 1),
+    (r'daily low[:\s]*\$?(\d+\.\d{2,4})', 1),
+    (r'low.*?\$(\d+\.\d{2,4})', 1),
+    (r'(\d+\.\d{2,4})\s*low', 1),
+    # Low value that appears after high in the same context
+    (r'high.*?(\d+\.\d{2,4}).*?low.*?(\d+\.\d{2,4})', 2),
+    # Any price near "Low" text, including one split from its label by tags
+    (r'low[:\s]*(\d+\.\d{2,4})', 1),
+    (r'(\d+\.\d{2,4})[^0-9]*low', 1),
+))
+
+def _first_alternate(patterns, content):
+    """Value and pattern index of the first alternate, in priority order, that matches content."""
+    for index, (pattern, group) in enumerate(patterns):
+        match = pattern.search(content)
+        if match:
+            return match.group(group), index
+    return None, None
+_GREEK_RES = {
+    'delta': _compile(r'Delta[:\s]*(-?\d+\.\d{4})'),
+    'gamma': _compile(r'Gamma[:\s]*(\d+\.\d{4})'),
+    'theta': _compile(r'Theta[:\s]*(-?\d+\.\d{4})'),
+    'vega': _compile(r'Vega[:\s]*(\d+\.\d{4})'),
+}
+
+# Debug/context logging
+_LAST_TRADE_RE = _compile(r'last trade')
+_LOW_WORD_RE = _compile(r'\blow\b')
+_TAG_RE = _compile(r'<[^>]+>')
+_WHITESPACE_RE = _compile(r'\s+')
+_OPTION_PRICE_RE = _compile(r'\$?0\.\d{2}')
+_DECIMAL_RE = _compile(r'\d+\.\d+')
+# Data words and high/low words in one pass; lastgroup says which kind matched
+_DEBUG_WORD_RE = _compile(
+    r'(?P<data>theta|gamma|delta|vega|volume|open interest|implied volatility)'
+    r'|(?P<high_low>high|low|day high|day low|daily high|daily low)'
+)
+_HIGH_LOW_NUMBER_RE = _compile(r'(\d+\.\d{2,4})\s*(?:high|low)')
+_HIGH_LOW_CONTEXT_RE = _compile(r'(?:high|low)[:\s]*\$?(\d+\.\d{2,4})')
+# Known values from a reference contract, found in one alternation pass instead of one scan each
+_KNOWN_VALUES = (
+    ('bid price', '0.08'),
+    ('ask price', '0.09'),
+    ('volume', '9,778'),
+    ('open interest', '1,863'),
+    ('theta', '0.1401'),
+    ('gamma', '0.0116'),
+    ('delta', '0.0347'),
+    ('vega', '0.0339'),
+)
+_KNOWN_VALUES_RE = _compile('|'.join(re.escape(value).replace(',', ',?') for _, value in _KNOWN_VALUES))
+_LOW_AGGRESSIVE_RES = _compile_all([
+    # Look for any number within 100 chars after "low"
+    r'low.{0,100}?(\d+\.\d{2,4})',
+    # Look for any number within 100 chars before "low"
+    r'(\d+\.\d{2,4}).{0,100}?low',
+    # Look for "Low" followed by any non-digit chars then a number
+    r'low[^\d]{0,50}(\d+\.\d{2,4})',
+    # Look for numbers between High and next section
+    r'high[:\s]*\$?(\d+\.\d{2,4})[^0-9]+(\d+\.\d{2,4})',
+    # Look for second number after High
+    r'high.*?(\d+\.\d{2,4}).*?(\d+\.\d{2,4})',
+], re.DOTALL)
+
+# Visible label -> data field, for reading values straight out of the expanded contract DOM
+DOM_LABELS = {
+    'Last trade': 'current_price',
+    'Bid': 'bid',
+    'Ask': 'ask',
+    'Volume': 'volume',
+    'Open interest': 'open_interest',
+    'Delta': 'delta',
+    'Gamma': 'gamma',
+    'Theta': 'theta',
+    'Vega': 'vega',
+    'High': 'high',
+    'Low': 'low',
+    'Implied volatility': 'iv',
+}
+
+_DOM_NUMBER_RE = _compile(r'-?(?:\d[\d,]*)?\.?\d+')
+
+def _html_value_after(node):
+    """Text of the first non-empty element after node, or after one of its two nearest ancestors."""
+    for _ in range(3):
+        if node is None:
+            break
+        sibling = node.next
+        while sibling is not None:
+            if sibling.tag != '-text':
+                text = sibling.text(strip=True)
+                if text:
+                    return text
+            sibling = sibling.next
+        node = node.parent
+    return None
+
+def _label_values_from_html(content):
+    """Parse HTML once and pair label leaves with their values, like the in-page DOM read. None without selectolax."""
+    if LexborHTMLParser is None:
+        return None
+    tree = LexborHTMLParser(content)
+    found = {}
+    for node in tree.css('div, span, dt, th, td, label, p'):
+        if next(node.iter(), None) is not None:
+            continue  # Labels are leaf elements
+        field = DOM_LABELS.get(node.text(strip=True))
+        value = field and _html_value_after(node)
+        if value:
+            found.setdefault(field, []).append(value)
+    title = tree.css_first('title')
+    return {'fields': found, 'title': title.text() if title else ''}
+
+def _parse_price(text):
+    """Parse a regex-captured decimal like '0.08' or '.08'; None for anything else."""
+    if not text or text.count('.') != 1:
+        return None
+    whole, frac = text.split('.')
+    if (whole and not whole.isdigit()) or not frac.isdigit():
+        return None
+    return float(text)
+
+def dom_result_to_data(result: Dict[str, Any], price_cents: int, option_type: str,
+                       log: Callable[[str], None]) -> Tuple[Dict[str, Any], int]:
+    """Turn the {fields, title} object from _DOM_EXTRACT_JS into a data dict. Returns (data, extracted_fields)."""
+    data = {
+        'type': option_type,
+        'price_cents': price_cents,
+        'price_text': f"$0.{price_cents:02d}",
+        'symbol': 'SPY',
+        'timestamp': datetime.now().isoformat()
+    }
+    extracted_fields = 0
+    for field, values in result.get('fields', {}).items():
+        for value in values:
+            number = _DOM_NUMBER_RE.search(value)
+            if not number:
+                continue
+            number = number.group().replace(',', '')
+            # The stock's own High/Low are labelled the same - skip stock-sized values
+            if field in ('high', 'low') and (_parse_price(number) or 0) > 50:
+                continue
+            data[field] = number
+            extracted_fields += 1
+            break
+
+    # Strike and expiration come from the page title ("SPY $635 Call 8/4")
+    title = result.get('title', '').lower()
+    for field in ('strike', 'expiration'):
+        for pattern in _FIELD_PATTERNS[field]:
+            match = pattern.search(title)
+            if match:
+                data[field] = match.group(1)
+                extracted_fields += 1
+                break
+
+    extracted_fields = validate_high_low(data, extracted_fields, log)
+    log(f"  📊 Extracted {extracted_fields} data fields from labelled elements")
+    return data, extracted_fields
+
+def extract_regex(content: str, price_cents: int, option_type: str,
+                  log: Callable[[str], None]) -> Tuple[Dict[str, Any], int]:
+    """Run the regex extraction over fetched HTML. Returns (data, extracted_fields)."""
+    # Keyword patterns are lowercase and run case-sensitively against this, instead of
+    # paying for IGNORECASE case folding on every step of every search
+    content_lower = content.lower()
+    # Check if contract is actually expanded
+    expansion_indicators = ['theta', 'gamma', 'delta', 'vega', 'volume', 'open interest', 'implied volatility']
+    found_indicators = sum(1 for indicator in expansion_indicators if indicator in content_lower)
+
+    log(f"  🔍 Found {found_indicators}/{len(expansion_indicators)} expansion indicators in page content")
+
+    if found_indicators < 2:
+        log(f"  ⚠️ Contract may not be properly expanded - only {found_indicators} indicators found")
+        log(f"  🔍 Looking for: {expansion_indicators}")
+        log(f"  📜 Page contains: {[ind for ind in expansion_indicators if ind in content_lower]}")
+
+    data = {
+        'type': option_type,
+        'price_cents': price_cents,
+        'price_text': f"$0.{price_cents:02d}",
+        'symbol': 'SPY',
+        'timestamp': datetime.now().isoformat()
+    }
+
+    # DEBUG: Log specific text we're looking for
+    # Save debug HTML for analysis
+    try:
+        debug_html_path = f"screenshots/debug_extraction_{price_cents}.html"
+        with open(debug_html_path, 'w') as f:
+            f.write(content)
+        log(f"  💾 Saved debug HTML to {debug_html_path}")
+    except:
+        pass
+
+    # Parse once and read the labelled values directly; the regex battery below only
+    # runs when that comes up short
+    label_result = _label_values_from_html(content)
+    if label_result is not None:
+        parsed, parsed_fields = dom_result_to_data(label_result, price_cents, option_type, log)
+        if parsed_fields > 3:
+            # Strike/expiration aren't labelled - fall back to their patterns if the title lacked them
+            for field in ('strike', 'expiration'):
+                if field not in parsed:
+                    for pattern in _FIELD_PATTERNS[field]:
+                        match = pattern.search(content_lower)
+                        if match:
+                            parsed[field] = match.group(1)
+                            parsed_fields += 1
+                            break
+            return parsed, parsed_fields
+
+    if "Last trade" in content:
+        # Find all occurrences of "Last trade" with context
+        last_trade_contexts = []
+        for match in _LAST_TRADE_RE.finditer(content_lower):
+            start = max(0, match.start() - 50)
+            end = min(len(content_lower), match.end() + 100)
+            context = content_lower[start:end]
+            last_trade_contexts.append(context)
+
+        if last_trade_contexts:
+            log(f"  🔍 DEBUG: Found {len(last_trade_contexts)} 'Last trade' occurrences:")
+            for i, ctx in enumerate(last_trade_contexts[:3]):
+                # Clean up HTML tags for readability
+                clean_ctx = _TAG_RE.sub(' ', ctx)
+                clean_ctx = _WHITESPACE_RE.sub(' ', clean_ctx)
+                log(f"    Context {i+1}: {clean_ctx.strip()}")
+
+    # Also look for any text containing prices
+    price_patterns = _OPTION_PRICE_RE.findall(content)
+    if price_patterns:
+        log(f"  🔍 DEBUG: Found {len(price_patterns)} option prices: {price_patterns[:10]}")
+
+    # Look for Low specifically
+    if "Low" in content:
+        low_contexts = []
+        for match in _LOW_WORD_RE.finditer(content_lower):
+            start = max(0, match.start() - 50)
+            end = min(len(content_lower), match.end() + 100)
+            context = content_lower[start:end]
+            low_contexts.append(context)
+
+        if low_contexts:
+            log(f"  🔍 DEBUG: Found {len(low_contexts)} 'Low' occurrences:")
+            for i, ctx in enumerate(low_contexts[:3]):
+                # Clean up HTML tags for readability
+                clean_ctx = _TAG_RE.sub(' ', ctx)
+                clean_ctx = _WHITESPACE_RE.sub(' ', clean_ctx)
+                log(f"    Low context {i+1}: {clean_ctx.strip()}")
+
+    # Try special patterns first
+    for pattern, field in _SPECIAL_PATTERNS:
+        if field not in data:
+            match = pattern.search(content)
+            if match:
+                data[field] = match.group(1)
+                log(f"    ✅ {field}: {match.group(1)} (special HTML pattern)")
+
+    # Bid and ask both render as "$price × size" - bid comes first in DOM order, ask second
+    if "×" in content:
+        crosses = _BIDASK_CROSS_RE.findall(content)
+        if len(crosses) >= 2:
+            for field, (price, _size) in zip(('bid', 'ask'), crosses):
+                if field not in data:
+                    data[field] = price
+                    log(f"    ✅ {field}: {price} (price × size)")
+
+    extracted_fields = 0
+    for field, pattern_list in _FIELD_PATTERNS.items():
+        # Skip if we already have this field from special patterns
+        if field in data:
+            extracted_fields += 1
+            continue
+        keywords = _FIELD_KEYWORDS.get(field)
+        if keywords and not any(keyword in content_lower for keyword in keywords):
+            continue
+
+        for pattern in pattern_list:
+            match = pattern.search(content_lower)
+            if match:
+                value = match.group(1).replace(',', '').strip()
+                data[field] = value
+                extracted_fields += 1
+                log(f"    ✅ {field}: {value} (pattern: {pattern.pattern[:30]}...)")
+                break  # Found match, move to next field
+
+    # If we didn't extract enough data, try direct text matching
+    if extracted_fields < 5:
+        log(f"    🔍 Trying direct text matching...")
+
+        # Look for specific text patterns in the HTML
+        try:
+            if "Volume" in content:
+                vol_match = _VOLUME_RE.search(content)
+                if vol_match and 'volume' not in data:
+                    data['volume'] = vol_match.group(1).replace(',', '')
+                    extracted_fields += 1
+                    log(f"    ✅ volume: {vol_match.group(1)} (direct match)")
+
+            if "Open interest" in content:
+                oi_match = _OPEN_INTEREST_RE.search(content)
+                if oi_match and 'open_interest' not in data:
+                    data['open_interest'] = oi_match.group(1).replace(',', '')
+                    extracted_fields += 1
+                    log(f"    ✅ open_interest: {oi_match.group(1)} (direct match)")
+
+            # Look for High/Low data
+            if "High" in content:
+                high_match = _HIGH_RE.search(content)
+                if high_match and 'high' not in data:
+                    data['high'] = high_match.group(1)
+                    extracted_fields += 1
+                    log(f"    ✅ high: {high_match.group(1)} (direct match)")
+                else:
+                    # Try alternative patterns
+                    high, alternate = _first_alternate(_HIGH_ALT_RES, content)
+                    if high and 'high' not in data:
+                        data['high'] = high
+                        extracted_fields += 1
+                        log(f"    ✅ high: {high} (alternate #{alternate + 1})")
+
+            # Try to extract High and Low together since they appear in proximity
+            has_high_and_low = 'high' in content_lower and 'low' in content_lower
+            high_low_match = has_high_and_low and _HIGH_LOW_RE.search(content_lower)
+            if high_low_match:
+                if 'high' not in data:
+                    data['high'] = high_low_match.group(1)
+                    extracted_fields += 1
+                    log(f"    ✅ high: {high_low_match.group(1)} (high-low pair)")
+                if 'low' not in data:
+                    data['low'] = high_low_match.group(2)
+                    extracted_fields += 1
+                    log(f"    ✅ low: {high_low_match.group(2)} (high-low pair)")
+
+            # Also try reverse pattern (Low before High)
+            low_high_match = has_high_and_low and _LOW_HIGH_RE.search(content_lower)
+            if low_high_match:
+                if 'low' not in data:
+                    data['low'] = low_high_match.group(1)
+                    extracted_fields += 1
+                    log(f"    ✅ low: {low_high_match.group(1)} (low-high pair)")
+                if 'high' not in data:
+                    data['high'] = low_high_match.group(2)
+                    extracted_fields += 1
+                    log(f"    ✅ high: {low_high_match.group(2)} (low-high pair)")
+
+            if "Low" in content:
+                low_match = _LOW_RE.search(content)
+                if low_match and 'low' not in data:
+                    data['low'] = low_match.group(1)
+                    extracted_fields += 1
+                    log(f"    ✅ low: {low_match.group(1)} (direct match)")
+                else:
+                    # Try alternative patterns
+                    low, alternate = _first_alternate(_LOW_ALT_RES, content_lower)
+                    if low and 'low' not in data:
+                        data['low'] = low
+                        extracted_fields += 1
+                        log(f"    ✅ low: {low} (alternate #{alternate + 1})")
+
+            # Look for Greeks with more flexible patterns
+            for greek, pattern in _GREEK_RES.items():
+                if greek not in data and greek in content_lower:
+                    greek_match = pattern.search(content)
+                    if greek_match:
+                        data[greek] = greek_match.group(1)
+                        extracted_fields += 1
+                        log(f"    ✅ {greek}: {greek_match.group(1)} (direct match)")
+        except Exception as direct_error:
+            log(f"    ⚠️ Direct matching failed: {direct_error}")
+
+    log(f"  📊 Extracted {extracted_fields} data fields from expanded contract")
+
+    # Debug: Show what was extracted
+    if extracted_fields > 0:
+        log(f"  🔍 Extracted data: {list(data.keys())}")
+        for key, value in data.items():
+            if key not in ['type', 'price_cents', 'price_text', 'symbol', 'timestamp']:
+                log(f"    {key}: {value}")
+    else:
+        log(f"  ❌ No data fields extracted!")
+        log(f"  🔍 Page content sample: {content[:1000]}...")
+
+        # Look for any numbers that might be our data
+        log(f"  🔍 Searching for potential data patterns...")
+        try:
+            # Walk the page once for decimals and once for keywords; later lookups index into these
+            decimals = [(m.start(), m.group()) for m in _DECIMAL_RE.finditer(content_lower)]
+            decimal_starts = [start for start, _ in decimals]
+            greek_words = []
+            high_low_content = []
+            low_indices = []
+            for match in _DEBUG_WORD_RE.finditer(content_lower):
+                word = match.group()
+                if match.lastgroup == 'data':
+                    greek_words.append(word)
+                else:
+                    high_low_content.append(word)
+                    if word.endswith('low'):
+                        low_indices.append(match.end() - 3)
+
+            all_numbers = [number for _, number in decimals]
+            log(f"  📊 Found {len(all_numbers)} decimal numbers: {all_numbers[:10]}")
+
+            # Look for Greek letters or words
+            log(f"  📊 Found {len(greek_words)} Greek/data words: {greek_words[:10]}")
+
+            # Look for high/low specific content
+            log(f"  📊 Found {len(high_low_content)} high/low references: {high_low_content[:10]}")
+
+            # Look for specific values we know should be there
+            log(f"  🔍 Looking for specific known values...")
+            found_values = {value.replace(',', '') for value in _KNOWN_VALUES_RE.findall(content)}
+            for label, value in _KNOWN_VALUES:
+                if value.replace(',', '') in found_values:
+                    log(f"    ✅ Found {label}: {value}")
+
+            # Special debugging for Low extraction since it's failing
+            if 'low' not in data:
+                log(f"  🔍 DEBUG: Low value not found, investigating...")
+
+                log(f"  📍 Found {len(low_indices)} occurrences of 'low' in content")
+
+                # Look at context around each "low" occurrence
+                for idx, pos in enumerate(low_indices[:5]):  # Check first 5 occurrences
+                    context_start = max(0, pos - 50)
+                    context_end = min(len(content_lower), pos + 50)
+                    context = content_lower[context_start:context_end]
+                    log(f"  📍 Low context {idx + 1}: ...{context}...")
+
+                    # Try to extract any numbers near this "low" - price-shaped decimals inside the window
+                    window = decimals[bisect.bisect_left(decimal_starts, context_start):
+                                      bisect.bisect_left(decimal_starts, context_end)]
+                    numbers_near = [number[:number.index('.') + 5] for start, number in window
+                                    if start + len(number) <= context_end and len(number) - number.index('.') > 2]
+                    if numbers_near:
+                        log(f"    💡 Numbers near 'low': {numbers_near}")
+
+                # Try more aggressive patterns
+
+                for pattern in _LOW_AGGRESSIVE_RES:
+                    matches = pattern.findall(content_lower)
+                    if matches:
+                        log(f"  🎯 Aggressive pattern '{pattern.pattern[:30]}...' found: {matches}")
+                        if isinstance(matches[0], tuple) and len(matches[0]) > 1:
+                            # For patterns with multiple groups, try the second one as low
+                            potential_low = matches[0][1]
+                            log(f"  💡 Potential low value from tuple: {potential_low}")
+                        elif isinstance(matches[0], str):
+                            potential_low = matches[0]
+                            log(f"  💡 Potential low value: {potential_low}")
+
+            # Look for high/low values specifically
+            high_low_numbers = _HIGH_LOW_NUMBER_RE.findall(content_lower)
+            if high_low_numbers:
+                log(f"    ✅ Found high/low numbers: {high_low_numbers}")
+
+            # Look for any price-like numbers near "high" or "low" words
+            high_low_context = _HIGH_LOW_CONTEXT_RE.findall(content_lower)
+            if high_low_context:
+                log(f"    ✅ Found high/low context: {high_low_context}")
+
+        except Exception as debug_error:
+            log(f"  ⚠️ Debug search failed: {debug_error}")
+
+        # Save the HTML content for debugging
+        try:
+            html_debug_file = f"screenshots/debug_html_{option_type}_{price_cents:02d}.html"
+            with open(html_debug_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+            log(f"  📄 HTML content saved to: {html_debug_file}")
+        except:
+            pass
+
+    return data, validate_high_low(data, extracted_fields, log)
+
+def validate_high_low(data: Dict[str, Any], extracted_fields: int, log: Callable[[str], None]) -> int:
+    """Drop stock-sized high/low values and swap an inverted pair. Returns the adjusted field count."""
+    high_val = _parse_price(data.get('high'))
+    # If high is > 50, it's probably a stock price, not option price
+    if high_val is not None and high_val > 50:
+        log(f"  ⚠️ High value {high_val} seems like stock price, removing")
+        del data['high']
+        extracted_fields -= 1
+        high_val = None
+
+    low_val = _parse_price(data.get('low'))
+    # If low is > 50, it's probably a stock price, not option price
+    if low_val is not None and low_val > 50:
+        log(f"  ⚠️ Low value {low_val} seems like stock price, removing")
+        del data['low']
+        extracted_fields -= 1
+    # Also check if low is greater than high (if we have both)
+    elif low_val is not None and high_val is not None and low_val > high_val > 0:
+        log(f"  ⚠️ Low {low_val} > High {high_val}, swapping")
+        data['high'], data['low'] = data['low'], data['high']
+
+    return extracted_fields
+
+def extract_from_content(content: str, price_cents: int, option_type: str) -> Tuple[Dict[str, Any], int, List[str]]:
+    """Process-pool entry point for extract_regex - log lines are returned for the caller to replay."""
+    log_lines: List[str] = []
+    data, extracted_fields = extract_regex(content, price_cents, option_type, log_lines.append)
+    return data, extracted_fields, log_lines
@@ -10,24 +10,104 @@ Follows a systematic approach for same-day SPY options trading:
 6. Provide trading signals
 """
 import asyncio
+import itertools
 import json
+import os
+import re
 import time
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from src.robinhood_automation import RobinhoodAutomation, AuthConfig
+try:
+    import re2  # google-re2: linear-time matching over scraped row text
+except ImportError:
+    re2 = None
+try:
+    import orjson  # C JSON encoder for the session snapshots
+except ImportError:
+    orjson = None
+try:
+    import uvloop  # libuv event loop: cheaper scheduling for the CDP socket traffic
+except ImportError:
+    uvloop = None
+
+_compile = re2.compile if re2 is not None else re.compile
+
+# Compiled once and reused every scan cycle
+_STRIKE_RE = _compile(r'\$(\d+\.?\d*)')
+_VOLUME_RE = _compile(r'(?i)Vol:?\s*(\d+)')
+
+# Requests the bot never needs once logged in. Stylesheets still load - the same
+# window is left open for manual trading
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+_BLOCKED_HOSTS = ("google-analytics", "segment.io", "datadog", "sentry", "branch.io")
+
+# Debug screenshots cost a full-page encode each; only take them when DEBUG_SCREENSHOTS is set
+_DEBUG_SCREENSHOTS = bool(os.environ.get("DEBUG_SCREENSHOTS"))
+
+# Monitor poll interval (seconds): starts short, doubles while SPY's price is unchanged
+# and drops back as soon as it moves; the cap is the longest a quiet market goes unchecked
+_MONITOR_MIN_INTERVAL = 10
+_MONITOR_MAX_INTERVAL = 60
+
+# Runs inside the page with the expiration date formats: clicks the first element showing
+# one of them (formats in order, buttons before generic containers) and returns that format
+_CLICK_EXPIRATION_JS = """formats => {
+    const groups = ['button, [role="button"]', '[data-testid*="expiration"]', 'li', 'span', 'div'].map(
+        selector => Array.from(document.querySelectorAll(selector))
+            .map(el => [el, (el.innerText || '').trim().toLowerCase()])
+            .filter(([, text]) => text && text.length <= 40));  // skip whole-page containers
+    for (const format of formats) {
+        const needle = format.toLowerCase();
+        for (const group of groups) {
+            const hit = group.find(([, text]) => text.includes(needle));
+            if (hit) { hit[0].click(); return format; }
+        }
+    }
+    return null;
+}"""
+
+# Option chain rows, for the load waits below and _SCAN_ROWS_JS
+_ROW_SELECTOR = 'tr, [role="row"]'
+
+# Runs inside the page: sample of $0.xx prices on the page, plus every table row
+# carrying a price in the 8-16 cent range (with those prices and its leading text)
+# quote is the row's first option price - the one price recorded per row per scan, so bid/mark/ask
+# of one row never compete as separate observations. allRows also returns rows that have left the
+# 8-16 cent range, for monitoring tracked options
+_SCAN_ROWS_JS = """(allRows) => {
+    const prices = (document.body.innerText.match(/\\$0\\.\\d{2}/g) || []).slice(0, 10);
+    const rows = [];
+    const rowEls = document.querySelectorAll('tr, [role="row"]');  // _ROW_SELECTOR
+    for (const row of rowEls) {
+        const text = row.innerText || '';
+        const inRange = text.match(/\\$0\\.(?:0[89]|1[0-6])/g);
+        const quote = text.match(/\\$0\\.\\d{2}/);
+        if (inRange || (allRows && quote)) rows.push({prices: inRange || [], quote: quote[0], text: text.slice(0, 200)});
+    }
+    return {prices, rows, rowCount: rowEls.length};
+}"""
 
 class SPYDayTrader:
     def __init__(self, automation):
         self.automation = automation
-        self.tracked_options = []
+        self.tracked_options = {}  # (type, strike) -> latest option data; re-scans overwrite
         self.price_history = {}
-        self.daily_lows = {}
+        self.daily_lows = {}  # (type, strike) -> lowest price seen this session
+        self._new_lows = []  # Options that set a new daily low since the last signal check
         self.trading_data = {
             "session_start": datetime.now().isoformat(),
             "spy_price_history": [],
             "tracked_options": [],
             "trading_signals": []
         }
+        self._data_dirty = True  # trading_data changed since the last save
+        # (time.time(), price) per SPY sample, parsed once at collection for signal analysis;
+        # trading_data keeps the text form for the saved session
+        self._spy_prices = deque(maxlen=1024)
+        self._today_formats = (None, ())  # (date, expiration label formats for that date)
+        self._spy_page = None  # Second tab parked on /stocks/SPY, opened on first price read
         
     async def initialize_session(self):
         """Initialize trading session with manual login."""
@@ -44,7 +124,7 @@ class SPYDayTrader:
         print("=" * 50)
         
         # Navigate to login page first
-        await self.automation.page.goto("https://robinhood.com/login", wait_until="networkidle")
+        await self.automation.page.goto("https://robinhood.com/login", wait_until="domcontentloaded")
         
         # Set zoom for better visibility
         await self.automation.page.evaluate("document.body.style.zoom = '0.5'")
@@ -54,30 +134,46 @@ class SPYDayTrader:
         print("⏳ Waiting for you to complete login...")
         
         # Wait for login completion
-        await self.wait_for_login()
+        if await self.wait_for_login():
+            # Login pages can render normally; from here on skip images, fonts, media and trackers
+            await self.automation.page.route("**/*", self._block_heavy_resources)
+        
+    async def _block_heavy_resources(self, route):
+        """Route handler: abort non-essential requests, let everything else through."""
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(host in request.url for host in _BLOCKED_HOSTS):
+            await route.abort()
+        else:
+            await route.continue_()
         
     async def wait_for_login(self):
         """Wait for manual login completion."""
         print("⏳ Monitoring for successful login...")
         
-        for i in range(300):  # Wait up to 5 minutes
-            try:
-                # Check if we're authenticated
+        page = self.automation.page
+        deadline = time.monotonic() + 300  # 5 minutes for the whole login
+        try:
+            # Browser-side wait for the redirect away from the login page
+            await page.wait_for_function(
+                "() => !location.href.toLowerCase().includes('login')", timeout=300000, polling=1000)
+            print(f"🔄 Page changed to: {page.url}")
+            await page.wait_for_load_state("domcontentloaded")
+            
+            # The navbar/account elements can render well after the redirect - keep waiting for them
+            selectors = self.automation.selectors
+            authenticated = ", ".join(selectors[key] for key in ("account_menu", "portfolio_value", "navbar"))
+            while time.monotonic() < deadline:
                 if await self.automation._is_authenticated():
                     print("✅ Login successful! Proceeding to options chain...")
                     return True
-                    
-                # Check current URL to see progress
-                current_url = self.automation.page.url
-                if "login" not in current_url.lower():
-                    print(f"🔄 Page changed to: {current_url}")
-                
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                await asyncio.sleep(1)
-                continue
-                
+                try:
+                    remaining_ms = max(1, (deadline - time.monotonic()) * 1000)
+                    await page.wait_for_selector(authenticated, state="attached", timeout=min(5000, remaining_ms))
+                except Exception:
+                    pass
+        except Exception:
+            pass
+            
         print("⏰ Login timeout - please ensure you're logged in")
         return False
         
@@ -85,67 +181,47 @@ class SPYDayTrader:
         """Navigate to same-day SPY options chain."""
         print("\n📊 Navigating to SPY options chain...")
         
-        # Get today's date for same-day options
-        today = datetime.now()
-        
         # Try the direct options chain URL
         spy_options_url = "https://robinhood.com/options/chains/SPY"
         
         try:
-            await self.automation.page.goto(spy_options_url, wait_until="networkidle", timeout=30000)
-            await asyncio.sleep(5)
+            await self.automation.page.goto(spy_options_url, wait_until="domcontentloaded", timeout=30000)
+            await self._wait_for_rows(timeout=10000)
             
             print(f"✅ Navigated to: {spy_options_url}")
             print("🔄 Scrolling to load options data...")
             
             # Scroll down to load more options data
+            rows = await self._row_count()
             await self.automation.page.evaluate("window.scrollTo(0, document.body.scrollHeight/2)")
-            await asyncio.sleep(2)
+            await self._wait_for_rows(rows, timeout=2000)
+            rows = await self._row_count()
             await self.automation.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(3)
+            await self._wait_for_rows(rows)
             
             print("🔍 Looking for same-day expiration options...")
             
             # Look for today's expiration date in various formats
-            today_formats = [
-                today.strftime("%m/%d"),
-                today.strftime("%m/%d/%Y"), 
-                today.strftime("%m/%d/%y"),
-                today.strftime("%-m/%-d"),  # No leading zeros
-                "Today",
-                today.strftime("%B %d")  # Full month name
-            ]
+            today_formats = self._get_today_formats()
             
             print(f"🎯 Searching for expiration dates: {today_formats}")
             
-            # Try to find and click today's expiration
+            # One in-page pass gathers the short-text candidates once, then clicks the first match
+            # in format order (preferring buttons, like the old text=/has-text selector ladder)
             expiration_found = False
-            for date_format in today_formats:
-                if expiration_found:
-                    break
-                    
-                date_selectors = [
-                    f'text="{date_format}"',
-                    f'button:has-text("{date_format}")',
-                    f'[data-testid*="expiration"]:has-text("{date_format}")',
-                    f'div:has-text("{date_format}")',
-                    f'span:has-text("{date_format}")',
-                    f'li:has-text("{date_format}")'
-                ]
-                
-                for selector in date_selectors:
+            try:
+                date_format = await self.automation.page.evaluate(_CLICK_EXPIRATION_JS, today_formats)
+                if date_format:
+                    print(f"📅 Found expiration '{date_format}'")
+                    # The old rows stay in the DOM, so wait for the new chain's fetch to settle instead
                     try:
-                        elements = self.automation.page.locator(selector)
-                        count = await elements.count()
-                        if count > 0:
-                            print(f"📅 Found expiration '{date_format}' with selector: {selector}")
-                            await elements.first.click()
-                            await asyncio.sleep(3)
-                            print("✅ Selected same-day expiration")
-                            expiration_found = True
-                            break
-                    except Exception as e:
-                        continue
+                        await self.automation.page.wait_for_load_state("networkidle", timeout=3000)
+                    except Exception:
+                        pass
+                    print("✅ Selected same-day expiration")
+                    expiration_found = True
+            except Exception:
+                pass
             
             if not expiration_found:
                 print("⚠️ Could not find today's expiration - using default view")
@@ -153,8 +229,9 @@ class SPYDayTrader:
             # Scroll to see more options
             print("📜 Scrolling to load all option chains...")
             for i in range(3):
+                rows = await self._row_count()
                 await self.automation.page.evaluate("window.scrollBy(0, 500)")
-                await asyncio.sleep(1)
+                await self._wait_for_rows(rows, timeout=1000)
             
             # Look for and expand option chains if needed
             expand_selectors = [
@@ -164,24 +241,24 @@ class SPYDayTrader:
                 'button:has-text("+")'
             ]
             
-            for selector in expand_selectors:
+            for selector, count in zip(expand_selectors, await self._count_all(expand_selectors)):
                 try:
                     elements = self.automation.page.locator(selector)
-                    count = await elements.count()
                     if count > 0:
                         print(f"🔄 Found {count} expand buttons, clicking them...")
                         for i in range(min(count, 5)):  # Click first 5
+                            rows = await self._row_count()
                             await elements.nth(i).click()
-                            await asyncio.sleep(1)
+                            await self._wait_for_rows(rows, timeout=1000)
                 except Exception:
                     continue
             
             # Final scroll to see all loaded data
             await self.automation.page.evaluate("window.scrollTo(0, 0)")
-            await asyncio.sleep(1)
             
-            # Take screenshot of options chain
-            await self.automation._take_screenshot("spy_options_chain_loaded")
+            # Take screenshot of options chain (opt-in, see _DEBUG_SCREENSHOTS)
+            if _DEBUG_SCREENSHOTS:
+                await self.automation._take_screenshot("spy_options_chain_loaded")
             
             print("✅ Options chain loaded and ready for scanning")
             return True
@@ -190,6 +267,40 @@ class SPYDayTrader:
             print(f"❌ Error navigating to options: {e}")
             return False
             
+    def _get_today_formats(self):
+        """Expiration labels today's chain may use, built once per day without duplicates."""
+        today = datetime.now().date()
+        if self._today_formats[0] != today:
+            formats = (
+                today.strftime("%m/%d"),
+                today.strftime("%m/%d/%Y"),
+                today.strftime("%m/%d/%y"),
+                today.strftime("%-m/%-d"),  # No leading zeros - same as %m/%d from October on
+                "Today",
+                today.strftime("%B %d")  # Full month name
+            )
+            self._today_formats = (today, list(dict.fromkeys(formats)))
+        return self._today_formats[1]
+        
+    async def _count_all(self, selectors):
+        """Count matches for all selectors concurrently; a selector that errors counts as 0."""
+        page = self.automation.page
+        counts = await asyncio.gather(*(page.locator(selector).count() for selector in selectors),
+                                      return_exceptions=True)
+        return [count if isinstance(count, int) else 0 for count in counts]
+        
+    async def _row_count(self):
+        """Number of option chain rows currently in the DOM."""
+        return await self.automation.page.evaluate(f"() => document.querySelectorAll({_ROW_SELECTOR!r}).length")
+        
+    async def _wait_for_rows(self, more_than=0, timeout=3000):
+        """Wait until the chain has more than more_than rows, or give up quietly after timeout ms."""
+        try:
+            await self.automation.page.wait_for_function(
+                f"n => document.querySelectorAll({_ROW_SELECTOR!r}).length > n", arg=more_than, timeout=timeout)
+        except Exception:
+            pass
+            
     async def scan_options_in_range(self):
         """Scan for options in the 8-16 cent price range."""
         print("\n🎯 Scanning for options in 8-16 cent range...")
@@ -198,107 +309,45 @@ class SPYDayTrader:
         
         try:
             # Wait for options data to load
-            await asyncio.sleep(3)
+            await self._wait_for_rows()
             
-            # First, let's get all text content to see what's available
+            # One in-browser pass over every chain row instead of a CDP round trip per
+            # selector/element: returns a page-wide price sample and the in-range rows
             print("🔍 Analyzing page content...")
-            page_text = await self.automation.page.text_content('body')
+            scan = await self.automation.page.evaluate(_SCAN_ROWS_JS, False)
             
-            # Look for option price patterns in the text
-            import re
-            price_patterns = re.findall(r'\$0\.\d{2}', page_text)
+            price_patterns = scan['prices']
             if price_patterns:
                 print(f"📊 Found price patterns: {price_patterns[:10]}...")
             
-            # Look for option price elements with broader selectors
-            price_selectors = [
-                'span:has-text("$0.")',
-                'div:has-text("$0.")',
-                'td:has-text("$0.")',
-                '[class*="price"]:has-text("$")',
-                '[data-testid*="price"]',
-                'span:text-matches(r"^\\$0\\.\\d+$")',
-                '*:has-text("$"):text-matches(r"\\$0\\.(0[8-9]|1[0-6])")'
-            ]
-            
-            print("🔍 Scanning option prices with multiple selectors...")
-            
-            for i, selector in enumerate(price_selectors):
-                try:
-                    elements = self.automation.page.locator(selector)
-                    count = await elements.count()
-                    
-                    if count > 0:
-                        print(f"📊 Selector {i+1}: Found {count} elements with '{selector[:30]}...'")
-                        
-                        for j in range(min(count, 20)):  # Check first 20 elements
-                            try:
-                                element = elements.nth(j)
-                                price_text = await element.text_content()
-                                
-                                if price_text and price_text.strip():
-                                    print(f"   Price text {j+1}: '{price_text.strip()}'")
-                                    
-                                    if self.is_in_target_range(price_text):
-                                        # Found option in target range
-                                        option_data = await self.extract_option_details(element)
-                                        if option_data:
-                                            target_options.append(option_data)
-                                            print(f"🎯 FOUND TARGET: {option_data['type']} {option_data['strike']} @ {option_data['price']}")
-                                        
-                            except Exception as e:
-                                continue
-                                
-                        # If we found some options with this selector, stop trying others
-                        if target_options:
-                            break
-                            
-                except Exception as e:
-                    print(f"⚠️ Error with selector '{selector[:30]}...': {e}")
-                    continue
-            
-            # Alternative approach: scan all table rows
-            if not target_options:
-                print("🔄 Trying table-based scanning...")
-                table_elements = self.automation.page.locator('tr, div[role="row"]')
-                table_count = await table_elements.count()
+            print(f"📊 Scanned {scan['rowCount']} table rows")
+            scan_time = datetime.now().isoformat()  # Shared by every option found in this scan
+            for row in scan['rows']:
+                row_text = row['text']
+                print(f"   Row: {row_text[:100]}...")
                 
-                if table_count > 0:
-                    print(f"📊 Found {table_count} table rows to scan")
-                    
-                    for i in range(min(table_count, 50)):
-                        try:
-                            row = table_elements.nth(i)
-                            row_text = await row.text_content()
-                            
-                            if row_text and '$0.' in row_text:
-                                print(f"   Row {i}: {row_text[:100]}...")
-                                
-                                # Extract prices from the row text
-                                row_prices = re.findall(r'\$0\.\d{2}', row_text)
-                                for price in row_prices:
-                                    if self.is_in_target_range(price):
-                                        option_data = {
-                                            "timestamp": datetime.now().isoformat(),
-                                            "price": price,
-                                            "full_text": row_text[:200],
-                                            "type": "CALL" if "Call" in row_text else "PUT" if "Put" in row_text else "UNKNOWN",
-                                            "strike": self.extract_strike_price(row_text),
-                                            "volume": self.extract_volume(row_text),
-                                            "source": "table_scan"
-                                        }
-                                        target_options.append(option_data)
-                                        print(f"🎯 TABLE FOUND: {option_data['type']} {option_data['strike']} @ {option_data['price']}")
-                                        
-                        except Exception as e:
-                            continue
-            
-            self.tracked_options = target_options
+                key = self._row_key(row_text)
+                option_data = {
+                    "timestamp": scan_time,
+                    "price": row['quote'],
+                    "full_text": row_text,
+                    "type": key[0],
+                    "strike": key[1],
+                    "volume": self.extract_volume(row_text),
+                    "source": "table_scan"
+                }
+                target_options.append(option_data)
+                self.tracked_options[key] = option_data
+                # The scan only sets the baseline; new lows come from the monitoring cycles
+                self._update_daily_low(key, row['quote'])
+                print(f"🎯 TABLE FOUND: {option_data['type']} {option_data['strike']} @ {option_data['price']}")
+            
             print(f"\n✅ Found {len(target_options)} options in 8-16¢ range")
             
             # Save initial scan results
             if target_options:
-                self.trading_data["tracked_options"] = target_options
+                self.trading_data["tracked_options"] = list(self.tracked_options.values())
+                self._data_dirty = True
                 await self.save_trading_data()
             
             return target_options
@@ -309,6 +358,10 @@ class SPYDayTrader:
             
     def is_in_target_range(self, price_text):
         """Check if price is in 8-16 cent range."""
+        # Fast path for the usual exact "$0.NN" form: compare the cents digits directly
+        if len(price_text) == 5 and price_text.startswith('$0.') and price_text[3:].isdigit():
+            return 8 <= int(price_text[3:]) <= 16
+        
         try:
             # Extract numeric value from price text
             price_text = price_text.replace('$', '').replace('¢', '')
@@ -326,50 +379,25 @@ class SPYDayTrader:
         except:
             return False
             
-    async def extract_option_details(self, element):
-        """Extract detailed information about an option."""
-        try:
-            # Get parent container to find strike, type, etc.
-            parent = element.locator('xpath=ancestor::tr | xpath=ancestor::div[contains(@class,"option")]')
-            
-            if await parent.count() > 0:
-                parent_text = await parent.first.text_content()
-                
-                # Extract details from text
-                option_data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "price": await element.text_content(),
-                    "full_text": parent_text,
-                    "type": "CALL" if "Call" in parent_text or "C" in parent_text else "PUT",
-                    "strike": self.extract_strike_price(parent_text),
-                    "volume": self.extract_volume(parent_text),
-                    "bid": None,
-                    "ask": None
-                }
-                
-                return option_data
-                
-        except Exception as e:
-            print(f"⚠️ Error extracting option details: {e}")
-            
-        return None
+    def _row_key(self, row_text):
+        """(type, strike) key a chain row is tracked under."""
+        option_type = "CALL" if "Call" in row_text else "PUT" if "Put" in row_text else "UNKNOWN"
+        return option_type, self.extract_strike_price(row_text)
         
     def extract_strike_price(self, text):
         """Extract strike price from option text."""
-        import re
-        # Look for dollar amounts that could be strikes
-        strikes = re.findall(r'\$(\d+\.?\d*)', text)
-        if strikes:
-            return f"${strikes[0]}"
+        # Look for dollar amounts that could be strikes - only the first is used
+        match = _STRIKE_RE.search(text)
+        if match:
+            return f"${match.group(1)}"
         return "Unknown"
         
     def extract_volume(self, text):
         """Extract volume from option text."""
-        import re
         # Look for volume indicators
-        volumes = re.findall(r'Vol:?\s*(\d+)', text, re.IGNORECASE)
-        if volumes:
-            return volumes[0]
+        match = _VOLUME_RE.search(text)
+        if match:
+            return match.group(1)
         return "0"
         
     async def monitor_price_movement(self):
@@ -379,23 +407,32 @@ class SPYDayTrader:
         print("⏸️  Press Ctrl+C to stop monitoring and get trading signals")
         
         monitoring_count = 0
+        # One long-lived quote task feeds every cycle; maxsize=1 keeps it from running ahead
+        # of a slow cycle (saves, signal output) with stale quotes
+        quotes = asyncio.Queue(maxsize=1)
+        quote_task = asyncio.create_task(self._quote_loop(quotes))
         
         try:
             while True:
+                cycle_time, spy_price = await quotes.get()
                 monitoring_count += 1
-                print(f"\n📊 Monitoring cycle #{monitoring_count} - {datetime.now().strftime('%H:%M:%S')}")
+                print(f"\n📊 Monitoring cycle #{monitoring_count} - {cycle_time.strftime('%H:%M:%S')}")
                 
                 # Update SPY current price
-                spy_price = await self.get_current_spy_price()
                 if spy_price:
                     self.trading_data["spy_price_history"].append({
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": cycle_time.isoformat(),
                         "price": spy_price
                     })
+                    self._data_dirty = True
+                    try:
+                        self._spy_prices.append((time.time(), float(spy_price.replace("$", "").replace(",", ""))))
+                    except ValueError:
+                        pass
                     print(f"📈 SPY: {spy_price}")
                 
-                # Update tracked options prices
-                updated_options = await self.update_tracked_options()
+                # Update tracked options prices (and their daily lows)
+                updated_options = await self.update_tracked_options(cycle_time)
                 
                 # Analyze for daily lows and signals
                 signals = self.analyze_for_signals()
@@ -408,21 +445,33 @@ class SPYDayTrader:
                 if monitoring_count % 5 == 0:
                     await self.save_trading_data()
                 
-                # Wait before next cycle
-                await asyncio.sleep(30)  # Check every 30 seconds
-                
         except KeyboardInterrupt:
             print("\n🛑 Monitoring stopped by user")
             return await self.generate_final_signals()
+        finally:
+            quote_task.cancel()
+            
+    async def _quote_loop(self, quotes):
+        """Pull SPY quotes for the monitor, backing off while the price sits still."""
+        sleep_for = _MONITOR_MIN_INTERVAL
+        last_spy_price = None
+        while True:
+            cycle_time = datetime.now()  # One clock read stamps everything this cycle records
+            spy_price = await self.get_current_spy_price()
+            await quotes.put((cycle_time, spy_price))
+            
+            if spy_price and spy_price != last_spy_price:
+                sleep_for = _MONITOR_MIN_INTERVAL
+            else:
+                sleep_for = min(2 * sleep_for, _MONITOR_MAX_INTERVAL)
+            last_spy_price = spy_price or last_spy_price
+            await asyncio.sleep(sleep_for)
             
     async def get_current_spy_price(self):
         """Get current SPY price."""
         try:
-            # Navigate to SPY if not already there
-            current_url = self.automation.page.url
-            if "SPY" not in current_url:
-                await self.automation.page.goto("https://robinhood.com/stocks/SPY", wait_until="networkidle")
-                await asyncio.sleep(2)
+            # Read from the dedicated quote tab so the options chain page is never navigated away
+            page = await self._get_spy_page()
             
             # Look for price elements
             price_selectors = [
@@ -432,38 +481,93 @@ class SPYDayTrader:
                 'div:has-text("$"):text-matches(r"\\$\\d+\\.\\d+")'
             ]
             
+            # all_text_contents() returns [] straight away when nothing matches, so one read per
+            # selector replaces the separate count and first-match text passes. Selectors run in
+            # order and stop at the first hit - the broad div:has-text fallback matches every
+            # ancestor holding a "$" and would ship most of the page's text on each poll
             for selector in price_selectors:
-                elements = self.automation.page.locator(selector)
-                if await elements.count() > 0:
-                    price_text = await elements.first.text_content()
-                    if price_text and "$" in price_text:
-                        return price_text.strip()
+                try:
+                    texts = await page.locator(selector).all_text_contents()
+                except Exception:
+                    continue
+                if texts and "$" in texts[0]:
+                    return texts[0].strip()
                         
         except Exception as e:
             print(f"⚠️ Error getting SPY price: {e}")
             
         return None
         
-    async def update_tracked_options(self):
-        """Update prices for tracked options."""
-        # This would require navigating back to options chain
-        # For now, return placeholder
+    async def _get_spy_page(self):
+        """Quote tab for SPY, opened in the same (logged-in) browser context on first use."""
+        if self._spy_page is None or self._spy_page.is_closed():
+            page = await self.automation.page.context.new_page()
+            await page.route("**/*", self._block_heavy_resources)
+            await page.goto("https://robinhood.com/stocks/SPY", wait_until="domcontentloaded")
+            try:
+                await page.wait_for_selector('[data-testid="stock-price"], .stock-price', timeout=5000)
+            except Exception:
+                pass
+            self._spy_page = page
+        return self._spy_page
+        
+    async def update_tracked_options(self, cycle_time):
+        """Re-read tracked options' prices from the chain page and record any new daily lows."""
         print("🔄 Updating tracked options prices...")
-        return self.tracked_options
+        updated = []
+        try:
+            # The chain stays open on the main page - SPY quotes come from their own tab
+            scan = await self.automation.page.evaluate(_SCAN_ROWS_JS, True)
+        except Exception as e:
+            print(f"⚠️ Error updating tracked options: {e}")
+            return updated
+        
+        seen = set()
+        for row in scan['rows']:
+            key = self._row_key(row['text'])
+            option = self.tracked_options.get(key)
+            if option is None or key in seen:
+                continue  # Untracked, or a second row under the same key this cycle
+            seen.add(key)
+            option.update(timestamp=cycle_time.isoformat(), price=row['quote'], full_text=row['text'])
+            if self._update_daily_low(key, row['quote']):
+                self._new_lows.append(dict(option))
+            updated.append(option)
+        
+        if updated:
+            self._data_dirty = True
+        return updated
+        
+    def _update_daily_low(self, key, price_text):
+        """Record a price for an option; True if it undercuts an earlier daily low."""
+        try:
+            price = float(price_text.replace("$", ""))
+        except ValueError:
+            return False
+        low = self.daily_lows.get(key)
+        if low is None or price < low:
+            self.daily_lows[key] = price
+            return low is not None
+        return False
         
     def analyze_for_signals(self):
         """Analyze current data for trading signals."""
         signals = []
         
         # Check for daily lows
-        if len(self.trading_data["spy_price_history"]) > 10:
-            recent_prices = [float(p["price"].replace("$", "")) for p in self.trading_data["spy_price_history"][-10:]]
+        if len(self._spy_prices) > 10:
+            recent_prices = [price for _, price in itertools.islice(self._spy_prices, len(self._spy_prices) - 10, None)]
             current_price = recent_prices[-1]
             min_price = min(recent_prices)
             
             if current_price == min_price:
                 signals.append(f"🔴 SPY at potential daily low: ${current_price}")
                 
+        # Options that undercut their own earlier low
+        for option in self._new_lows:
+            signals.append(f"🟢 {option['type']} {option['strike']} at new daily low: {option['price']}")
+        self._new_lows.clear()
+        
         # Add more signal logic here (RSI, volume, etc.)
         
         return signals
@@ -480,7 +584,7 @@ class SPYDayTrader:
         # Show tracked options
         if self.tracked_options:
             print("\n🎯 OPTIONS IN 8-16¢ RANGE:")
-            for option in self.tracked_options[:10]:
+            for option in itertools.islice(self.tracked_options.values(), 10):
                 print(f"   {option['type']} {option['strike']} @ {option['price']}")
         
         # Generate recommendations
@@ -500,27 +604,39 @@ class SPYDayTrader:
         
     async def save_trading_data(self):
         """Save trading session data."""
+        if not self._data_dirty:
+            return
         try:
             data_dir = Path("data")
             data_dir.mkdir(exist_ok=True)
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
-            # Save session data
-            session_file = data_dir / f"spy_trading_session_{timestamp}.json"
-            with open(session_file, 'w') as f:
-                json.dump(self.trading_data, f, indent=2)
+            # Serialize once for both files
+            if orjson is not None:
+                payload = orjson.dumps(self.trading_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.trading_data, indent=2).encode()
             
-            # Save as latest
+            # Save session data, then as latest
+            session_file = data_dir / f"spy_trading_session_{timestamp}.json"
             latest_file = data_dir / "spy_trading_latest.json"
-            with open(latest_file, 'w') as f:
-                json.dump(self.trading_data, f, indent=2)
+            for path in (session_file, latest_file):
+                self._write_atomic(path, payload)
+            self._data_dirty = False
                 
             print(f"💾 Trading data saved: {session_file.name}")
             
         except Exception as e:
             print(f"⚠️ Error saving data: {e}")
 
+    def _write_atomic(self, path, payload):
+        """Write bytes to a temp file and rename it over path, so readers never see a partial file."""
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
 async def main():
     """Main SPY day trading function."""
     print("🚀 SPY Options Day Trader")
@@ -565,4 +681,6 @@ async def main():
         await automation.close()
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
\ No newline at end of file
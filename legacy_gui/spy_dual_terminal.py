@@ -4,12 +4,15 @@ SPY Options Dual Terminal - Separate windows for Puts and Calls
 """
 import asyncio
 import json
+import os
 import yfinance as yf
 import pandas as pd
 import numpy as np
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import threading
+import queue
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from playwright.async_api import async_playwright
@@ -19,13 +22,154 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import time
+import traceback
+try:
+    import re2  # google-re2: linear-time automaton for the combined field scan
+except ImportError:
+    re2 = None
+try:
+    import uvloop  # libuv event loop: cheaper scheduling for the CDP-heavy shared loop
+except ImportError:
+    uvloop = None
+
+# Per-second monitoring screenshots are opt-in (DEBUG_SCREENSHOTS=1): a full-page encode
+# and file write every tick otherwise dominates the monitoring loop
+_DEBUG_SCREENSHOTS = bool(os.environ.get("DEBUG_SCREENSHOTS"))
+_MONITOR_SCREENSHOT_SLOTS = 200
+
+# Tk redraw cadence (~30 Hz): log lines, status and contract refreshes queued from the
+# analysis loop are applied together on the Tk thread at most this often
+_UI_FLUSH_INTERVAL_MS = 33
+
+# Charts redraw on every Nth monitoring tick (adjustable from the controls bar); every tick is
+# still recorded, so only render cost - not data - scales down with N
+_CHART_DISP_SKIP = 5
+
+# PW_INSPECT_STACK=0 skips Playwright's per-call caller-stack capture (an inspect frame walk
+# plus traceback.extract_stack) on the monitoring task. Its errors then lose the call site, and
+# the Playwright API name: they read "SPYTerminal.monitoring_loop: <message>"
+_PW_INSPECT_STACK = os.environ.get("PW_INSPECT_STACK") != "0"
+
+# Contract detail fields scraped from the page; each value is captured in a group named after its field
+_CONTRACT_FIELD_PATTERNS = {
+    'current_price': r'(?:Last|Price|Mark)[:\s]+\$?(?P<current_price>\d+\.\d{2,4})',
+    'bid': r'Bid[:\s]+\$?(?P<bid>\d+\.\d{2,4})',
+    'ask': r'Ask[:\s]+\$?(?P<ask>\d+\.\d{2,4})',
+    'volume': r'Volume[:\s]+(?P<volume>\d+(?:,\d+)*)',
+    'open_interest': r'Open Interest[:\s]+(?P<open_interest>\d+(?:,\d+)*)',
+    'strike': r'Strike[:\s]+\$?(?P<strike>\d+)',
+    'theta': r'Theta[:\s]+(?P<theta>-?\d+\.\d{2,4})',
+    'gamma': r'Gamma[:\s]+(?P<gamma>\d+\.\d{2,4})',
+    'delta': r'Delta[:\s]+(?P<delta>-?\d+\.\d{2,4})',
+    'vega': r'Vega[:\s]+(?P<vega>\d+\.\d{2,4})',
+    'high': r'(?:Day\s+)?High[:\s]+\$?(?P<high>\d+\.\d{2,4})',
+    'low': r'(?:Day\s+)?Low[:\s]+\$?(?P<low>\d+\.\d{2,4})',
+    'iv': r'(?:Implied\s+)?(?:Vol|Volatility)[:\s]+(?P<iv>\d+\.\d+)%?',
+    'expiration': r'(?:Exp|Expires?)[:\s]+(?P<expiration>\d{1,2}/\d{1,2}(?:/\d{2,4})?)',
+}
+
+# Cents of every $0.08-$0.16 price; the 8-16¢ range check is part of the pattern
+_PRICE_IN_RANGE_RE = re.compile(r'\$0\.(0[89]|1[0-6])')
+
+# JS regex literal for greek labels, which only an expanded contract shows
+_GREEKS_TEXT_JS = "/theta|gamma|delta/i"
+
+# Any of these words in the page means a contract's detail view is open
+_EXPANDED_INDICATORS_RE = re.compile(r'theta|gamma|delta|bid|ask|volume|open interest', re.IGNORECASE)
+
+_LIVE_FIELDS = ('current_price', 'bid', 'ask', 'volume', 'theta', 'gamma', 'high', 'low')
+
+# Charted fields, parsed to numbers once as each data point arrives (one ContractTracker.series row each)
+_CHART_FIELDS = ('current_price', 'volume', 'theta', 'gamma', 'bid', 'ask')
+_HISTORY_LENGTH = 100
+
+def _compile_fields(fields):
+    """One case-insensitive alternation over the given fields, so a page is scanned once for all of them."""
+    pattern = '(?i)' + '|'.join(f'(?:{_CONTRACT_FIELD_PATTERNS[field]})' for field in fields)
+    return re2.compile(pattern) if re2 is not None else re.compile(pattern)
+
+_CONTRACT_FIELDS_RE = _compile_fields(_CONTRACT_FIELD_PATTERNS)
+_LIVE_FIELDS_RE = _compile_fields(_LIVE_FIELDS)
+
+def _find_fields(fields_re, content):
+    """First value of each field in content (field -> raw text), in a single pass."""
+    found = {}
+    for match in fields_re.finditer(content):
+        found.setdefault(match.lastgroup, match.group(match.lastgroup))
+        if len(found) == fields_re.groups:
+            break
+    return found
+
+_shared_loop = None
+_shared_loop_lock = threading.Lock()
+
+def get_shared_loop():
+    """Event loop shared by every terminal in this process, running in one daemon thread."""
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            _shared_loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            threading.Thread(target=_shared_loop.run_forever, daemon=True).start()
+        return _shared_loop
+
+class _InfoFields(dict):
+    """Contract data for the info panel template; missing fields render as N/A."""
+    def __missing__(self, key):
+        return 'N/A'
+
+# Info panel layout, filled in by format_map on every refresh
+_INFO_TEMPLATE = """
+🎯 CONTRACT: {key_upper}
+==================================================
+Type: {type_upper}
+Price: {price_text}
+Strike: ${strike}
+Expiration: {expiration}
+
+📊 MARKET DATA
+Current: ${current_price}
+Bid: ${bid}
+Ask: ${ask}
+Volume: {volume}
+Open Interest: {open_interest}
+
+🏷️ GREEKS
+Delta: {delta}
+Gamma: {gamma}
+Theta: {theta}
+Vega: {vega}
+
+📈 DAY RANGE
+High: ${high}
+Low: ${low}
+IV: {iv}%
+
+⏰ Last Update: {last_update}
+📊 Data Points: {data_points}
+            """
 
 class ContractTracker:
     def __init__(self, contract_key):
         self.contract_key = contract_key  # e.g., "call_09" or "put_12"
-        self.data_history = []
+        self.data_history = deque(maxlen=_HISTORY_LENGTH)  # Last 100 data points; the oldest drops off on append
+        # Numeric ring buffer alongside data_history: one row per _CHART_FIELDS entry, NaN where a
+        # point lacked that field; head is the next slot to write
+        self.series = np.full((len(_CHART_FIELDS), _HISTORY_LENGTH), np.nan)
+        self.head = 0
+        self.count = 0
         self.current_data = {}
         self.last_update = None
+        # Chart artists, set up once by SPYTerminal.create_contract_charts
+        self.figure = None
+        self.axes = None
+        self.canvas = None
+        self.lines = None
+        self.volume_bars = None
+        self.placeholders = None
+        # Per-axes animated artists and the static background each is blitted over
+        self.chart_artists = None
+        self.backgrounds = None
+        self.tick_count = 0  # Monitoring ticks with new data; charts redraw every disp_skip-th
         
     def add_data_point(self, data):
         """Add timestamped data point."""
@@ -34,25 +178,46 @@ class ContractTracker:
         self.current_data = data
         self.last_update = datetime.now()
         
-        # Keep only last 100 data points to prevent memory issues
-        if len(self.data_history) > 100:
-            self.data_history = self.data_history[-100:]
+        for row, field in enumerate(_CHART_FIELDS):
+            value = data.get(field)
+            try:
+                self.series[row, self.head] = float(value.replace(',', '')) if value else np.nan
+            except (AttributeError, ValueError):
+                self.series[row, self.head] = np.nan
+        self.head = (self.head + 1) % _HISTORY_LENGTH
+        self.count = min(self.count + 1, _HISTORY_LENGTH)
+    
+    def chart_series(self):
+        """Each chart field's values across the history, oldest first, skipping points without it."""
+        # The whole buffer is put in time order in one pass, not once per field
+        window = np.roll(self.series, -self.head, axis=1) if self.count == _HISTORY_LENGTH else self.series[:, :self.count]
+        return {field: row[~np.isnan(row)] for field, row in zip(_CHART_FIELDS, window)}
 
 class SPYTerminal:
-    def __init__(self, option_type, window_title):
+    def __init__(self, option_type, window_title, master=None):
         self.option_type = option_type.lower()  # 'call' or 'put'
         self.window_title = window_title
+        self.master = master  # Existing Tk/Toplevel window to build into; a new Tk() if None
         self.contracts = {}  # contract_key -> ContractTracker
         self.contract_tabs = {}
         self.page = None
-        self.monitoring_active = True
+        self._stop_event = asyncio.Event()  # Set on window close; wakes the monitoring loop at once
+        self.monitor_task = None
+        self._live_fields_text = None  # Page text last scanned by extract_live_data, and its fields
+        self._live_fields = {}
+        self._analysis_finished = False  # Set off the Tk thread; _flush_ui re-enables the start button
+        self._log_queue = queue.Queue()
+        self._refresh_queue = queue.Queue()  # Contract keys with new data, coalesced per flush
+        self._new_tab_queue = queue.Queue()  # Newly tracked contract keys still waiting for their tab
+        self._pending_status = None
+        self._shown_status = None
         
         # Create GUI
         self.setup_gui()
         
     def setup_gui(self):
         """Setup GUI for this terminal."""
-        self.root = tk.Tk()
+        self.root = self.master if self.master is not None else tk.Tk()
         self.root.title(f"🚀 SPY {self.option_type.upper()} Options Terminal")
         self.root.geometry("1600x900")
         self.root.configure(bg='#0d1117')
@@ -63,6 +228,8 @@ class SPYTerminal:
         else:
             self.root.geometry("1600x900+1700+50")
         
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         self.root.lift()
         self.root.focus_force()
         
@@ -93,6 +260,13 @@ class SPYTerminal:
                                     font=('SF Mono', 11), fg=title_color, bg='#161b22')
         self.status_label.pack(side=tk.LEFT, padx=20)
         
+        # Render rate: trade chart latency for CPU
+        self.disp_skip = tk.Scale(controls_frame, from_=1, to=10, orient=tk.HORIZONTAL,
+                                  label="Chart every N ticks", font=('SF Mono', 9),
+                                  fg='white', bg='#161b22', highlightthickness=0, length=160)
+        self.disp_skip.set(_CHART_DISP_SKIP)
+        self.disp_skip.pack(side=tk.RIGHT, padx=10)
+        
         # Content area
         content_frame = tk.Frame(main_frame, bg='#0d1117')
         content_frame.pack(fill=tk.BOTH, expand=True)
@@ -124,6 +298,7 @@ class SPYTerminal:
         self.log(f"🎯 {self.option_type.upper()} Options Terminal Ready")
         self.log("📋 Will track contracts in 8-16¢ range")
         self.log("🔍 Click start to begin analysis")
+        self._flush_ui()
         
     def clear_screenshots(self):
         """Clear screenshots for this option type."""
@@ -147,34 +322,69 @@ class SPYTerminal:
             self.log(f"❌ Error clearing screenshots: {e}")
     
     def log(self, message):
-        """Add message to terminal."""
+        """Queue a message for the terminal; safe to call from any thread."""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.terminal.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.terminal.see(tk.END)
-        self.root.update()
+        self._log_queue.put(f"[{timestamp}] {message}\n")
     
     def update_status(self, status):
-        """Update status display."""
-        self.status_label.config(text=f"Status: {status}")
-        self.root.update()
+        """Update status display (applied on the next UI flush)."""
+        self._pending_status = status
+    
+    def _flush_ui(self):
+        """Tk-thread: apply queued log lines, status, contract refreshes and button state, then reschedule."""
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self.terminal.insert(tk.END, ''.join(lines))
+            self.terminal.see(tk.END)
+        
+        status = self._pending_status
+        if status != self._shown_status:
+            self.status_label.config(text=f"Status: {status}")
+            self._shown_status = status
+        
+        # New tabs first, so refreshes queued in the same flush find their widgets
+        try:
+            while True:
+                self.create_contract_tab(self._new_tab_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        dirty = set()
+        try:
+            while True:
+                dirty.add(self._refresh_queue.get_nowait())
+        except queue.Empty:
+            pass
+        for contract_key in dirty:
+            self.update_contract_info(contract_key)
+            self.refresh_contract_charts(contract_key)
+        
+        if self._analysis_finished:
+            self._analysis_finished = False
+            self.start_btn.config(state='normal', text=f'🔄 Start {self.option_type.upper()} Analysis')
+        
+        self.root.after(_UI_FLUSH_INTERVAL_MS, self._flush_ui)
     
     def start_analysis(self):
         """Start contract analysis for this option type."""
         self.start_btn.config(state='disabled', text=f'🔄 Analyzing {self.option_type.upper()}...')
-        thread = threading.Thread(target=self.run_analysis_thread)
-        thread.daemon = True
-        thread.start()
+        # Runs on the shared loop so the page and the monitoring loop stay on the loop that created them
+        future = asyncio.run_coroutine_threadsafe(self.analyze_contracts(), get_shared_loop())
+        future.add_done_callback(self.on_analysis_done)
     
-    def run_analysis_thread(self):
-        """Run analysis in separate thread."""
+    def on_analysis_done(self, future):
+        """Report a failed analysis and re-enable the start button."""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.analyze_contracts())
+            future.result()
         except Exception as e:
             self.log(f"❌ Analysis error: {e}")
         finally:
-            self.root.after(0, lambda: self.start_btn.config(state='normal', text=f'🔄 Start {self.option_type.upper()} Analysis'))
+            self._analysis_finished = True
     
     async def analyze_contracts(self):
         """Main analysis function."""
@@ -229,6 +439,12 @@ class SPYTerminal:
         except Exception as e:
             self.log(f"❌ Analysis error: {e}")
         finally:
+            # Monitoring reads through this connection, so keep it open until monitoring ends
+            if self.monitor_task:
+                try:
+                    await self.monitor_task
+                except Exception:
+                    pass
             if playwright:
                 await playwright.stop()
             self.update_status("Analysis complete")
@@ -243,17 +459,9 @@ class SPYTerminal:
             # Find contracts in 8-16¢ range
             contracts_found = {}  # price_cents -> contract_data to avoid duplicates
             
-            # Get page content and look for prices
-            content = await self.page.content()
-            price_matches = re.finditer(r'\$0\.(\d{2})', content)
-            
-            target_prices = []
-            for match in price_matches:
-                price_cents = int(match.group(1))
-                if 8 <= price_cents <= 16:
-                    target_prices.append(price_cents)
-            
-            unique_prices = sorted(list(set(target_prices)))
+            # Get page text and look for prices
+            content = await self.page_text()
+            unique_prices = sorted({int(cents) for cents in _PRICE_IN_RANGE_RE.findall(content)})
             self.log(f"🎯 Found prices in range: {unique_prices}")
             
             # For each unique price, try to find and click the contract
@@ -268,11 +476,11 @@ class SPYTerminal:
                     self.log(f"🔍 Looking for {self.option_type.upper()} $0.{price_cents:02d} contract...")
                     
                     # Try to find and click this specific contract
-                    success = await self.find_and_click_contract(price_cents)
+                    success, content = await self.find_and_click_contract(price_cents)
                     
                     if success:
-                        # Extract data from expanded contract
-                        contract_data = await self.extract_contract_data(price_cents)
+                        # Extract data from expanded contract, reusing the text the expansion check fetched
+                        contract_data = await self.extract_contract_data(price_cents, content)
                         
                         if not contract_data:
                             # Create basic data if extraction failed
@@ -284,13 +492,18 @@ class SPYTerminal:
                                 'status': 'Found but data extraction failed'
                             }
                         
-                        # Create contract tracker and tab
-                        self.create_contract_tab(contract_key, contract_data)
+                        # Create contract tracker; its tab follows on the Tk thread
+                        self.track_contract(contract_key, contract_data)
                         contracts_found[price_cents] = contract_data
                         
                         # Close any expanded views
                         await self.page.keyboard.press('Escape')
-                        await asyncio.sleep(1)
+                        try:
+                            # Done as soon as the greeks leave the page (at most the old 1s)
+                            await self.page.wait_for_function(
+                                f"() => !{_GREEKS_TEXT_JS}.test(document.body.innerText)", timeout=1000)
+                        except Exception:
+                            pass
                         
                     else:
                         self.log(f"⚠️ Could not click {self.option_type.upper()} $0.{price_cents:02d}")
@@ -308,25 +521,27 @@ class SPYTerminal:
         except Exception as e:
             self.log(f"❌ Error finding contracts: {e}")
     
+    async def page_text(self):
+        """Rendered text of the page - the labels and values the field patterns read, without the markup."""
+        return await self.page.evaluate("() => document.body.innerText")
+    
     async def find_and_click_contract(self, price_cents):
-        """Find and click a specific contract by price."""
+        """Find and click a specific contract by price; returns (expanded, page text after the click)."""
         try:
             price_text = f"$0.{price_cents:02d}"
             
-            # Look for elements containing this exact price
-            price_elements = self.page.locator(f'text="{price_text}"')
-            count = await price_elements.count()
+            # Look for elements containing this exact price - all handles in one query
+            price_elements = await self.page.locator(f'text="{price_text}"').element_handles()
+            count = len(price_elements)
             
             if count == 0:
-                return False
+                return False, None
             
             self.log(f"  Found {count} elements with {price_text}")
             
             # Try clicking each element until we find one that expands
-            for i in range(min(count, 3)):
+            for i, element in enumerate(price_elements[:3]):
                 try:
-                    element = price_elements.nth(i)
-                    
                     # Get bounding box and click 50px to the left
                     box = await element.bounding_box()
                     if box:
@@ -340,18 +555,21 @@ class SPYTerminal:
                         
                         # Click
                         await self.page.mouse.click(click_x, click_y)
-                        await asyncio.sleep(3)
+                        try:
+                            # Done as soon as the expanded view shows its greeks (at most the old 3s)
+                            await self.page.wait_for_selector(f"text={_GREEKS_TEXT_JS}", timeout=3000)
+                        except Exception:
+                            pass
                         
                         # Take after screenshot
                         await self.page.screenshot(path=f"screenshots/{self.option_type}_after_click_{price_cents:02d}.png")
                         
                         # Check if contract expanded (look for detailed data)
-                        new_content = await self.page.content()
-                        expanded_indicators = ['theta', 'gamma', 'delta', 'bid', 'ask', 'volume', 'open interest']
+                        new_content = await self.page_text()
                         
-                        if any(indicator.lower() in new_content.lower() for indicator in expanded_indicators):
+                        if _EXPANDED_INDICATORS_RE.search(new_content):
                             self.log(f"  ✅ Contract expanded successfully!")
-                            return True
+                            return True, new_content
                         else:
                             self.log(f"  ⚠️ Click {i+1} - no expansion detected")
                     
@@ -359,21 +577,22 @@ class SPYTerminal:
                     self.log(f"  ❌ Click {i+1} failed: {click_error}")
                     continue
             
-            return False
+            return False, None
             
         except Exception as e:
             self.log(f"❌ Error finding/clicking contract: {e}")
-            return False
+            return False, None
     
-    async def extract_contract_data(self, price_cents):
-        """Extract detailed contract data from expanded view."""
+    async def extract_contract_data(self, price_cents, content=None):
+        """Extract detailed contract data from expanded view (content: page text already fetched)."""
         try:
             self.log(f"📊 Extracting data for $0.{price_cents:02d}...")
             
-            # Wait for data to load
-            await asyncio.sleep(2)
-            
-            content = await self.page.content()
+            if content is None:
+                # Wait for data to load
+                await asyncio.sleep(2)
+                
+                content = await self.page_text()
             
             contract_data = {
                 'type': self.option_type,
@@ -383,30 +602,14 @@ class SPYTerminal:
                 'timestamp': datetime.now().isoformat()
             }
             
-            # Enhanced data extraction patterns
-            patterns = {
-                'current_price': r'(?:Last|Price|Mark)[:\s]+\$?(\d+\.\d{2,4})',
-                'bid': r'Bid[:\s]+\$?(\d+\.\d{2,4})',
-                'ask': r'Ask[:\s]+\$?(\d+\.\d{2,4})',
-                'volume': r'Volume[:\s]+(\d+(?:,\d+)*)',
-                'open_interest': r'Open Interest[:\s]+(\d+(?:,\d+)*)',
-                'strike': r'Strike[:\s]+\$?(\d+)',
-                'theta': r'Theta[:\s]+(-?\d+\.\d{2,4})',
-                'gamma': r'Gamma[:\s]+(\d+\.\d{2,4})',
-                'delta': r'Delta[:\s]+(-?\d+\.\d{2,4})',
-                'vega': r'Vega[:\s]+(\d+\.\d{2,4})',
-                'high': r'(?:Day\s+)?High[:\s]+\$?(\d+\.\d{2,4})',
-                'low': r'(?:Day\s+)?Low[:\s]+\$?(\d+\.\d{2,4})',
-                'iv': r'(?:Implied\s+)?(?:Vol|Volatility)[:\s]+(\d+\.\d+)%?',
-                'expiration': r'(?:Exp|Expires?)[:\s]+(\d{1,2}/\d{1,2}(?:/\d{2,4})?)',
-            }
+            # Enhanced data extraction - every field in one scan of the page
+            found = _find_fields(_CONTRACT_FIELDS_RE, content)
             
             extracted_count = 0
-            for key, pattern in patterns.items():
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
+            for key in _CONTRACT_FIELD_PATTERNS:
+                if key in found:
                     # Use the first match and clean it
-                    value = matches[0].replace(',', '').strip()
+                    value = found[key].replace(',', '').strip()
                     contract_data[key] = value
                     extracted_count += 1
                     self.log(f"   {key.replace('_', ' ').title()}: {value}")
@@ -422,17 +625,21 @@ class SPYTerminal:
             self.log(f"❌ Error extracting contract data: {e}")
             return None
     
-    def create_contract_tab(self, contract_key, contract_data):
-        """Create a tab for tracking this contract."""
+    def track_contract(self, contract_key, contract_data):
+        """Start tracking a contract; its tab is built on the Tk thread at the next UI flush."""
+        tracker = ContractTracker(contract_key)
+        tracker.add_data_point(contract_data)
+        self.contracts[contract_key] = tracker
+        self._new_tab_queue.put(contract_key)
+    
+    def create_contract_tab(self, contract_key):
+        """Tk-thread: create a tab for a tracked contract."""
         try:
-            # Create contract tracker
-            tracker = ContractTracker(contract_key)
-            tracker.add_data_point(contract_data)
-            self.contracts[contract_key] = tracker
+            tracker = self.contracts[contract_key]
             
             # Create tab
             tab_frame = tk.Frame(self.notebook, bg='#0d1117')
-            price_text = contract_data.get('price_text', 'N/A')
+            price_text = tracker.current_data.get('price_text', 'N/A')
             
             self.notebook.add(tab_frame, text=price_text)
             self.contract_tabs[contract_key] = tab_frame
@@ -481,35 +688,14 @@ class SPYTerminal:
             tracker = self.contracts[contract_key]
             data = tracker.current_data
             
-            info = f"""
-🎯 CONTRACT: {contract_key.upper()}
-{'='*50}
-Type: {data.get('type', 'N/A').upper()}
-Price: {data.get('price_text', 'N/A')}
-Strike: ${data.get('strike', 'N/A')}
-Expiration: {data.get('expiration', 'N/A')}
-
-📊 MARKET DATA
-Current: ${data.get('current_price', 'N/A')}
-Bid: ${data.get('bid', 'N/A')}
-Ask: ${data.get('ask', 'N/A')}
-Volume: {data.get('volume', 'N/A')}
-Open Interest: {data.get('open_interest', 'N/A')}
-
-🏷️ GREEKS
-Delta: {data.get('delta', 'N/A')}
-Gamma: {data.get('gamma', 'N/A')}
-Theta: {data.get('theta', 'N/A')}
-Vega: {data.get('vega', 'N/A')}
-
-📈 DAY RANGE
-High: ${data.get('high', 'N/A')}
-Low: ${data.get('low', 'N/A')}
-IV: {data.get('iv', 'N/A')}%
-
-⏰ Last Update: {tracker.last_update.strftime('%H:%M:%S') if tracker.last_update else 'Never'}
-📊 Data Points: {len(tracker.data_history)}
-            """
+            fields = _InfoFields(data)
+            fields.update(
+                key_upper=contract_key.upper(),
+                type_upper=str(data.get('type', 'N/A')).upper(),
+                last_update=tracker.last_update.strftime('%H:%M:%S') if tracker.last_update else 'Never',
+                data_points=len(tracker.data_history),
+            )
+            info = _INFO_TEMPLATE.format_map(fields)
             
             # Update the info text widget
             if hasattr(self, 'info_text'):
@@ -520,7 +706,7 @@ IV: {data.get('iv', 'N/A')}%
             pass
     
     def create_contract_charts(self, parent_frame, contract_key):
-        """Create charts for contract data."""
+        """Create charts for contract data; refreshes only update these artists."""
         try:
             tracker = self.contracts[contract_key]
             
@@ -538,96 +724,64 @@ IV: {data.get('iv', 'N/A')}%
                 ax.tick_params(colors='white', labelsize=8)
                 for spine in ax.spines.values():
                     spine.set_color('white')
+                ax.grid(True, alpha=0.3)
             
             # Chart 1: Price over time
             ax1.set_title('Price History', color='white', fontsize=10, pad=10)
-            if len(tracker.data_history) > 1:
-                timestamps = [d['timestamp'] for d in tracker.data_history]
-                prices = [float(d.get('current_price', 0)) for d in tracker.data_history if d.get('current_price')]
-                
-                if prices:
-                    ax1.plot(range(len(prices)), prices, color='#7ee787', linewidth=2)
-                    ax1.set_ylabel('Price ($)', color='white', fontsize=8)
-                    ax1.grid(True, alpha=0.3)
-                else:
-                    ax1.text(0.5, 0.5, 'No price data yet', ha='center', va='center', 
-                            transform=ax1.transAxes, color='white')
-            else:
-                ax1.text(0.5, 0.5, 'Collecting data...', ha='center', va='center', 
-                        transform=ax1.transAxes, color='white')
+            ax1.set_ylabel('Price ($)', color='white', fontsize=8)
             
-            # Chart 2: Volume
+            # Chart 2: Volume - one bar per history slot, refreshes only change their heights
             ax2.set_title('Volume', color='white', fontsize=10, pad=10)
-            if len(tracker.data_history) > 1:
-                volumes = [int(d.get('volume', '0').replace(',', '')) for d in tracker.data_history if d.get('volume')]
-                
-                if volumes:
-                    ax2.bar(range(len(volumes)), volumes, color='#58a6ff', alpha=0.7)
-                    ax2.set_ylabel('Volume', color='white', fontsize=8)
-                    ax2.grid(True, alpha=0.3)
-                else:
-                    ax2.text(0.5, 0.5, 'No volume data yet', ha='center', va='center', 
-                            transform=ax2.transAxes, color='white')
-            else:
-                ax2.text(0.5, 0.5, 'Collecting data...', ha='center', va='center', 
-                        transform=ax2.transAxes, color='white')
+            ax2.set_ylabel('Volume', color='white', fontsize=8)
+            tracker.volume_bars = ax2.bar(range(_HISTORY_LENGTH), [0] * _HISTORY_LENGTH, color='#58a6ff', alpha=0.7)
             
             # Chart 3: Greeks
             ax3.set_title('Greeks (Theta/Gamma)', color='white', fontsize=10, pad=10)
-            if len(tracker.data_history) > 1:
-                thetas = [float(d.get('theta', 0)) for d in tracker.data_history if d.get('theta')]
-                gammas = [float(d.get('gamma', 0)) for d in tracker.data_history if d.get('gamma')]
-                
-                if thetas or gammas:
-                    if thetas:
-                        ax3.plot(range(len(thetas)), thetas, color='#ffa657', label='Theta', linewidth=2)
-                    if gammas:
-                        # Scale gamma for display (usually much smaller than theta)
-                        scaled_gammas = [g * 100 for g in gammas]  # Scale up for visibility
-                        ax3.plot(range(len(scaled_gammas)), scaled_gammas, color='#f85149', label='Gamma*100', linewidth=2)
-                    
-                    ax3.legend(fontsize=8)
-                    ax3.grid(True, alpha=0.3)
-                else:
-                    ax3.text(0.5, 0.5, 'No Greeks data yet', ha='center', va='center', 
-                            transform=ax3.transAxes, color='white')
-            else:
-                ax3.text(0.5, 0.5, 'Collecting data...', ha='center', va='center', 
-                        transform=ax3.transAxes, color='white')
             
             # Chart 4: Bid/Ask Spread
             ax4.set_title('Bid/Ask Spread', color='white', fontsize=10, pad=10)
-            if len(tracker.data_history) > 1:
-                bids = [float(d.get('bid', 0)) for d in tracker.data_history if d.get('bid')]
-                asks = [float(d.get('ask', 0)) for d in tracker.data_history if d.get('ask')]
-                
-                if bids or asks:
-                    if bids:
-                        ax4.plot(range(len(bids)), bids, color='#7ee787', label='Bid', linewidth=2)
-                    if asks:
-                        ax4.plot(range(len(asks)), asks, color='#fbb6ce', label='Ask', linewidth=2)
-                    
-                    ax4.legend(fontsize=8)
-                    ax4.set_ylabel('Price ($)', color='white', fontsize=8)
-                    ax4.grid(True, alpha=0.3)
-                else:
-                    ax4.text(0.5, 0.5, 'No bid/ask data yet', ha='center', va='center', 
-                            transform=ax4.transAxes, color='white')
-            else:
-                ax4.text(0.5, 0.5, 'Collecting data...', ha='center', va='center', 
-                        transform=ax4.transAxes, color='white')
+            ax4.set_ylabel('Price ($)', color='white', fontsize=8)
+            
+            tracker.lines = {
+                'price': ax1.plot([], [], color='#7ee787', linewidth=2)[0],
+                'theta': ax3.plot([], [], color='#ffa657', label='Theta', linewidth=2)[0],
+                'gamma': ax3.plot([], [], color='#f85149', label='Gamma*100', linewidth=2)[0],
+                'bid': ax4.plot([], [], color='#7ee787', label='Bid', linewidth=2)[0],
+                'ask': ax4.plot([], [], color='#fbb6ce', label='Ask', linewidth=2)[0],
+            }
+            ax3.legend(fontsize=8)
+            ax4.legend(fontsize=8)
+            
+            tracker.placeholders = [ax.text(0.5, 0.5, 'Collecting data...', ha='center', va='center',
+                                            transform=ax.transAxes, color='white')
+                                    for ax in [ax1, ax2, ax3, ax4]]
+            
+            # Data artists are animated: full draws leave them out of the cached backgrounds
+            tracker.chart_artists = [
+                [tracker.lines['price'], tracker.placeholders[0]],
+                [*tracker.volume_bars, tracker.placeholders[1]],
+                [tracker.lines['theta'], tracker.lines['gamma'], tracker.placeholders[2]],
+                [tracker.lines['bid'], tracker.lines['ask'], tracker.placeholders[3]],
+            ]
+            for artists in tracker.chart_artists:
+                for artist in artists:
+                    artist.set_animated(True)
             
             fig.tight_layout(pad=2.0)
             
             # Embed in tkinter
             canvas = FigureCanvasTkAgg(fig, parent_frame)
             canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            # Every full draw (first map, resize, rescale) re-snapshots the backgrounds
+            canvas.mpl_connect('draw_event', lambda event: self.cache_chart_backgrounds(tracker))
             
             # Store references for updates
             tracker.figure = fig
             tracker.axes = [ax1, ax2, ax3, ax4]
             tracker.canvas = canvas
             
+            self.update_chart_data(tracker)
+            
         except Exception as e:
             self.log(f"❌ Error creating charts: {e}")
     
@@ -636,84 +790,84 @@ IV: {data.get('iv', 'N/A')}%
         try:
             self.log("📹 Starting continuous monitoring for all contracts...")
             
-            def monitor_all_contracts():
-                """Monitor all contracts continuously."""
-                import asyncio
+            # Called from analyze_contracts on the shared loop, so a plain task is enough
+            self.monitor_task = asyncio.get_running_loop().create_task(self.monitoring_loop())
+            
+        except Exception as e:
+            self.log(f"❌ Error starting monitoring: {e}")
+    
+    async def monitoring_loop(self):
+        """Monitor all contracts continuously."""
+        screenshot_count = 0
+        if not _PW_INSPECT_STACK:
+            # Playwright reuses a stack pre-set on the task (as its sync wrapper does) instead of walking frames per call
+            task = asyncio.current_task()
+            # Both must be truthy - Playwright falls back to capturing on an empty value
+            task.__pw_stack__ = {"frames": [], "apiName": "SPYTerminal.monitoring_loop", "title": None}
+            task.__pw_stack_trace__ = traceback.StackSummary.from_list(
+                [(__file__, 0, "monitoring_loop", None)])
+        
+        while not self._stop_event.is_set() and self.contracts:
+            try:
+                screenshot_count += 1
                 
-                async def monitoring_loop():
-                    screenshot_count = 0
+                if self.page:
+                    # Every contract reads the same page, so its text is fetched once per tick
+                    if _DEBUG_SCREENSHOTS:
+                        # Debug page screenshot, overlapped with the text fetch
+                        # Ring of slots overwritten in turn, so the directory stays bounded
+                        slot = screenshot_count % _MONITOR_SCREENSHOT_SLOTS
+                        screenshot_path = f"screenshots/{self.option_type}_monitor_{slot:03d}.jpg"
+                        _, content = await asyncio.gather(
+                            self.page.screenshot(path=screenshot_path, type="jpeg", quality=60),
+                            self.page_text())
+                    else:
+                        content = await self.page_text()
                     
-                    while self.monitoring_active and self.contracts:
+                    # Try to extract current data for all contracts
+                    for contract_key, tracker in self.contracts.items():
                         try:
-                            screenshot_count += 1
-                            timestamp = datetime.now().strftime("%H%M%S")
-                            
-                            # Take page screenshot
-                            if self.page:
-                                screenshot_path = f"screenshots/{self.option_type}_monitor_{timestamp}_{screenshot_count:03d}.png"
-                                await self.page.screenshot(path=screenshot_path)
+                            # Extract current data
+                            current_data = await self.extract_live_data(contract_key, content)
+                            if current_data:
+                                tracker.add_data_point(current_data)
                                 
-                                # Try to extract current data for all contracts
-                                for contract_key, tracker in self.contracts.items():
-                                    try:
-                                        # Extract current data
-                                        current_data = await self.extract_live_data(contract_key)
-                                        if current_data:
-                                            tracker.add_data_point(current_data)
-                                            
-                                            # Update GUI
-                                            self.root.after(0, lambda k=contract_key: self.update_contract_info(k))
-                                            self.root.after(0, lambda k=contract_key: self.refresh_contract_charts(k))
-                                    
-                                    except Exception as contract_error:
-                                        continue
-                            
-                            await asyncio.sleep(1)  # Screenshot every second
-                            
-                        except Exception as e:
-                            self.log(f"❌ Monitoring error: {e}")
-                            await asyncio.sleep(2)
+                                # Update GUI on the next flush
+                                self._refresh_queue.put(contract_key)
+                        
+                        except Exception as contract_error:
+                            continue
                 
-                # Run monitoring loop
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(monitoring_loop())
-            
-            # Start monitoring thread
-            monitor_thread = threading.Thread(target=monitor_all_contracts)
-            monitor_thread.daemon = True
-            monitor_thread.start()
-            
-        except Exception as e:
-            self.log(f"❌ Error starting monitoring: {e}")
+                # Sample every second, or stop right away when the window closes
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=1.0)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+                
+            except Exception as e:
+                self.log(f"❌ Monitoring error: {e}")
+                await asyncio.sleep(2)
     
-    async def extract_live_data(self, contract_key):
-        """Extract live data for a specific contract."""
+    async def extract_live_data(self, contract_key, content=None):
+        """Extract live data for a specific contract (content: page text already fetched)."""
         try:
             # Get current page content
-            content = await self.page.content()
+            if content is None:
+                content = await self.page_text()
             
             # Extract current data
             current_data = {
                 'timestamp': datetime.now().isoformat()
             }
             
-            # Same patterns as before but for live updates
-            patterns = {
-                'current_price': r'(?:Last|Price|Mark)[:\s]+\$?(\d+\.\d{2,4})',
-                'bid': r'Bid[:\s]+\$?(\d+\.\d{2,4})',
-                'ask': r'Ask[:\s]+\$?(\d+\.\d{2,4})',
-                'volume': r'Volume[:\s]+(\d+(?:,\d+)*)',
-                'theta': r'Theta[:\s]+(-?\d+\.\d{2,4})',
-                'gamma': r'Gamma[:\s]+(\d+\.\d{2,4})',
-                'high': r'(?:Day\s+)?High[:\s]+\$?(\d+\.\d{2,4})',
-                'low': r'(?:Day\s+)?Low[:\s]+\$?(\d+\.\d{2,4})',
-            }
-            
-            for key, pattern in patterns.items():
-                match = re.search(pattern, content, re.IGNORECASE)
-                if match:
-                    current_data[key] = match.group(1).replace(',', '')
+            # Same patterns as before but for live updates. Every contract of a tick (and any
+            # tick where the page text did not change) reads the same text - scan it only once
+            if content != self._live_fields_text:
+                self._live_fields = {key: value.replace(',', '')
+                                     for key, value in _find_fields(_LIVE_FIELDS_RE, content).items()}
+                self._live_fields_text = content
+            current_data.update(self._live_fields)
             
             return current_data if len(current_data) > 1 else None
             
@@ -725,81 +879,85 @@ IV: {data.get('iv', 'N/A')}%
         try:
             if contract_key in self.contracts:
                 tracker = self.contracts[contract_key]
+                tracker.tick_count += 1
                 
-                if hasattr(tracker, 'figure') and hasattr(tracker, 'axes'):
-                    # Clear and redraw charts with new data
-                    for ax in tracker.axes:
-                        ax.clear()
+                # The info panel updates every tick; charts only every disp_skip-th
+                if tracker.canvas is not None and tracker.tick_count % self.disp_skip.get() == 0:
+                    # Axis limits moved (or nothing cached yet): ticks need a full redraw
+                    if self.update_chart_data(tracker) or tracker.backgrounds is None:
+                        tracker.canvas.draw_idle()
+                        return
                     
-                    # Recreate charts with updated data
-                    self.update_chart_data(tracker)
-                    
-                    # Refresh canvas
-                    tracker.canvas.draw()
+                    # Otherwise repaint only the data artists over each cached background
+                    canvas = tracker.canvas
+                    for ax, background, artists in zip(tracker.axes, tracker.backgrounds, tracker.chart_artists):
+                        canvas.restore_region(background)
+                        for artist in artists:
+                            ax.draw_artist(artist)
+                        canvas.blit(ax.bbox)
                     
         except Exception as e:
             pass
     
+    def cache_chart_backgrounds(self, tracker):
+        """Snapshot each axes after a full draw and paint the animated artists over it."""
+        canvas = tracker.canvas
+        tracker.backgrounds = [canvas.copy_from_bbox(ax.bbox) for ax in tracker.axes]
+        for ax, artists in zip(tracker.axes, tracker.chart_artists):
+            for artist in artists:
+                ax.draw_artist(artist)
+    
     def update_chart_data(self, tracker):
-        """Update chart data for a tracker."""
+        """Update chart data for a tracker; returns True when any axis limits changed."""
         try:
             ax1, ax2, ax3, ax4 = tracker.axes
-            
-            # Re-style axes
-            for ax in tracker.axes:
-                ax.set_facecolor('#161b22')
-                ax.tick_params(colors='white', labelsize=8)
-                for spine in ax.spines.values():
-                    spine.set_color('white')
-            
-            # Update Price Chart
-            ax1.set_title('Price History', color='white', fontsize=10, pad=10)
-            prices = [float(d.get('current_price', 0)) for d in tracker.data_history if d.get('current_price')]
-            if len(prices) > 1:
-                ax1.plot(range(len(prices)), prices, color='#7ee787', linewidth=2)
-                ax1.set_ylabel('Price ($)', color='white', fontsize=8)
-                ax1.grid(True, alpha=0.3)
-            
-            # Update Volume Chart
-            ax2.set_title('Volume', color='white', fontsize=10, pad=10)
-            volumes = [int(d.get('volume', '0').replace(',', '')) for d in tracker.data_history if d.get('volume')]
-            if len(volumes) > 1:
-                ax2.bar(range(len(volumes)), volumes, color='#58a6ff', alpha=0.7)
-                ax2.set_ylabel('Volume', color='white', fontsize=8)
-                ax2.grid(True, alpha=0.3)
-            
-            # Update Greeks Chart
-            ax3.set_title('Greeks (Theta/Gamma)', color='white', fontsize=10, pad=10)
-            thetas = [float(d.get('theta', 0)) for d in tracker.data_history if d.get('theta')]
-            gammas = [float(d.get('gamma', 0)) for d in tracker.data_history if d.get('gamma')]
-            
-            if thetas:
-                ax3.plot(range(len(thetas)), thetas, color='#ffa657', label='Theta', linewidth=2)
-            if gammas:
-                scaled_gammas = [g * 100 for g in gammas]
-                ax3.plot(range(len(scaled_gammas)), scaled_gammas, color='#f85149', label='Gamma*100', linewidth=2)
-            
-            if thetas or gammas:
-                ax3.legend(fontsize=8)
-                ax3.grid(True, alpha=0.3)
-            
-            # Update Bid/Ask Chart
-            ax4.set_title('Bid/Ask Spread', color='white', fontsize=10, pad=10)
-            bids = [float(d.get('bid', 0)) for d in tracker.data_history if d.get('bid')]
-            asks = [float(d.get('ask', 0)) for d in tracker.data_history if d.get('ask')]
-            
-            if bids:
-                ax4.plot(range(len(bids)), bids, color='#7ee787', label='Bid', linewidth=2)
-            if asks:
-                ax4.plot(range(len(asks)), asks, color='#fbb6ce', label='Ask', linewidth=2)
-            
-            if bids or asks:
-                ax4.legend(fontsize=8)
-                ax4.set_ylabel('Price ($)', color='white', fontsize=8)
-                ax4.grid(True, alpha=0.3)
+            limits = [(ax.get_xlim(), ax.get_ylim()) for ax in tracker.axes]
+            
+            series = tracker.chart_series()
+            prices = series['current_price']
+            volumes = series['volume']
+            thetas = series['theta']
+            # Scale gamma for display (usually much smaller than theta)
+            gammas = series['gamma'] * 100
+            bids = series['bid']
+            asks = series['ask']
+            
+            for key, values in (('price', prices), ('theta', thetas), ('gamma', gammas), ('bid', bids), ('ask', asks)):
+                tracker.lines[key].set_data(range(len(values)), values)
+            for ax in (ax1, ax3, ax4):
+                ax.relim()
+                ax.autoscale_view()
+            
+            for i, bar in enumerate(tracker.volume_bars):
+                bar.set_height(volumes[i] if i < len(volumes) else 0)
+            if volumes.size:
+                ax2.set_xlim(-0.5, len(volumes) - 0.5)
+                ax2.set_ylim(0, volumes.max() * 1.05 or 1)
+            
+            # Placeholder text on any chart that has nothing to show yet
+            collecting = tracker.count <= 1
+            for placeholder, has_data, empty_text in zip(
+                    tracker.placeholders,
+                    (prices.size, volumes.size, thetas.size or gammas.size, bids.size or asks.size),
+                    ('No price data yet', 'No volume data yet', 'No Greeks data yet', 'No bid/ask data yet')):
+                placeholder.set_text('Collecting data...' if collecting else empty_text)
+                placeholder.set_visible(not has_data)
+            
+            return limits != [(ax.get_xlim(), ax.get_ylim()) for ax in tracker.axes]
             
         except Exception as e:
-            pass
+            return True
+    
+    def on_close(self):
+        """Stop monitoring and close the window."""
+        if _shared_loop is not None:
+            _shared_loop.call_soon_threadsafe(self._stop_event.set)
+        self.root.destroy()
+        # Last terminal window of a launch_both_terminals run: take the hidden owner down too
+        if isinstance(self.master, tk.Toplevel):
+            owner = self.master.master
+            if not owner.winfo_children():
+                owner.destroy()
     
     def show(self):
         """Show this terminal window."""
@@ -815,6 +973,16 @@ def launch_puts_terminal():
     puts_terminal = SPYTerminal('put', 'SPY Puts Terminal')
     puts_terminal.show()
 
+def launch_both_terminals():
+    """Run the calls and puts terminals as two windows of one Tk process."""
+    root = tk.Tk()
+    root.withdraw()  # Hidden owner; the terminals live in its Toplevels
+    
+    SPYTerminal('call', 'SPY Calls Terminal', master=tk.Toplevel(root))
+    SPYTerminal('put', 'SPY Puts Terminal', master=tk.Toplevel(root))
+    
+    root.mainloop()
+
 def main():
     """Main launcher - asks user which terminal to launch."""
     print("🚀 SPY Options Dual Terminal System")
@@ -831,24 +999,10 @@ def main():
     elif choice == '2':
         launch_puts_terminal()
     elif choice == '3':
-        # Launch both in separate processes
-        import multiprocessing
-        
-        # Start calls terminal
-        calls_process = multiprocessing.Process(target=launch_calls_terminal)
-        calls_process.start()
-        
-        # Start puts terminal  
-        puts_process = multiprocessing.Process(target=launch_puts_terminal)
-        puts_process.start()
-        
-        print("✅ Both terminals launched!")
+        print("✅ Launching both terminals!")
         print("CALLS terminal should appear on the left")
         print("PUTS terminal should appear on the right")
-        
-        # Wait for both processes
-        calls_process.join()
-        puts_process.join()
+        launch_both_terminals()
     else:
         print("Invalid choice. Launching CALLS terminal by default.")
         launch_calls_terminal()
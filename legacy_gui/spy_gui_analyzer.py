@@ -14,7 +14,6 @@ import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from playwright.async_api import async_playwright
-import talib
 
 class SPYAnalyzerGUI:
     def __init__(self, root):
@@ -28,6 +27,7 @@ class SPYAnalyzerGUI:
         self.options_data = []
         self.recommendations = []
         self.analyzer = None
+        self.rsi_trackers = None  # (1m, 5m) WilderRSI state kept across refreshes
         
         # GUI setup
         self.setup_gui()
@@ -335,8 +335,12 @@ class SPYAnalyzerGUI:
             asyncio.set_event_loop(loop)
             
             # Run the analysis
-            from spy_options_analyzer import SPYOptionsAnalyzer
-            analyzer = SPYOptionsAnalyzer()
+            from spy_options_analyzer import SPYOptionsAnalyzer, WilderRSI
+            # Only the RSI state carries over, so each refresh folds in just the newest bars;
+            # everything else starts fresh with the analyzer
+            if self.rsi_trackers is None:
+                self.rsi_trackers = (WilderRSI(), WilderRSI())
+            analyzer = SPYOptionsAnalyzer(*self.rsi_trackers)
             
             # Schedule updates
             self.root.after(0, lambda: self.update_status("Connecting to browser..."))
@@ -4,21 +4,74 @@ SPY Options Analyzer - Enhanced with RSI analysis and trade recommendations
 """
 import asyncio
 import json
+import math
 import yfinance as yf
 import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
 from playwright.async_api import async_playwright
-import talib
+
+_RSI_PERIOD = 14
+
+class WilderRSI:
+    """Wilder RSI kept as running averages, so each new bar costs O(1) instead of a full recompute."""
+    def __init__(self, period=_RSI_PERIOD):
+        self.period = period
+        self.avg_gain = None
+        self.avg_loss = None
+        self.last_close = None
+        self.last_time = None  # Timestamp of the last completed bar folded into the averages
+        self._seed = []  # (gain, loss) pairs until there are enough for the first simple average
+    
+    def _smooth(self, avg_gain, avg_loss, close):
+        """Averages after one more close (Wilder's smoothing)."""
+        delta = close - self.last_close
+        p = self.period
+        return (avg_gain * (p - 1) + max(delta, 0.0)) / p, (avg_loss * (p - 1) + max(-delta, 0.0)) / p
+    
+    def _fold(self, close):
+        """Commit a completed bar's close to the running state."""
+        if not math.isfinite(close):
+            return  # A missing (NaN) close would otherwise stay in the averages for good
+        if self.avg_gain is not None:
+            self.avg_gain, self.avg_loss = self._smooth(self.avg_gain, self.avg_loss, close)
+        elif self.last_close is not None:
+            delta = close - self.last_close
+            self._seed.append((max(delta, 0.0), max(-delta, 0.0)))
+            if len(self._seed) == self.period:
+                self.avg_gain = sum(gain for gain, _ in self._seed) / self.period
+                self.avg_loss = sum(loss for _, loss in self._seed) / self.period
+                self._seed = []
+        self.last_close = close
+    
+    def update(self, closes):
+        """Fold in bars newer than the last call and return the RSI at the latest close (or None)."""
+        # The last bar is still forming: evaluate it on top of the state without committing it
+        completed = closes.iloc[:-1]
+        if self.last_time is not None:
+            completed = completed[completed.index > self.last_time]
+        for close in completed.values:
+            self._fold(float(close))
+        if len(completed):
+            self.last_time = completed.index[-1]
+        
+        latest = float(closes.iloc[-1])
+        if self.avg_gain is None or not math.isfinite(latest):
+            return None
+        avg_gain, avg_loss = self._smooth(self.avg_gain, self.avg_loss, latest)
+        total = avg_gain + avg_loss
+        return 100.0 * avg_gain / total if total else 0.0
 
 class SPYOptionsAnalyzer:
-    def __init__(self):
+    def __init__(self, rsi_1m=None, rsi_5m=None):
         self.playwright = None
         self.browser = None
         self.page = None
         self.options_data = []
         self.spy_data = None
+        # RSI state per timeframe; pass the previous run's to fold in only the new bars
+        self.rsi_1m = rsi_1m or WilderRSI()
+        self.rsi_5m = rsi_5m or WilderRSI()
         
     async def connect_to_chrome(self):
         """Connect to existing Chrome browser."""
@@ -80,12 +133,10 @@ class SPYOptionsAnalyzer:
                 return None
             
             # Calculate RSI
-            rsi_1m = talib.RSI(spy_1m['Close'].values, timeperiod=14)
-            rsi_5m = talib.RSI(spy_5m['Close'].values, timeperiod=14)
+            current_rsi_1m = self.rsi_1m.update(spy_1m['Close'])
+            current_rsi_5m = self.rsi_5m.update(spy_5m['Close'])
             
             current_price = spy_1m['Close'].iloc[-1]
-            current_rsi_1m = rsi_1m[-1] if not np.isnan(rsi_1m[-1]) else None
-            current_rsi_5m = rsi_5m[-1] if not np.isnan(rsi_5m[-1]) else None
             
             self.spy_data = {
                 'current_price': float(current_price),
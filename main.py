@@ -11,19 +11,90 @@ import numpy as np
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import threading
+import queue
+import logging
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from playwright.async_api import async_playwright
 import talib
-import re
+import hashlib
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import time
 import sqlite3
 import os
-import random
+import glob
+import gc
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from extraction import DOM_LABELS, dom_result_to_data, extract_from_content
 
+# Selectors for the expanded contract container, most specific first
+_EXPANDED_SELECTORS = (
+    '[class*="expanded"]',
+    '[class*="details"]',
+    '[class*="contract"]',
+    '[class*="option"]',
+    '[data-testid*="expanded"]',
+    '[data-testid*="details"]',
+)
+
+# Every leaf element whose text is a known label, paired with the first non-empty
+# element after it (label and value sit in sibling spans, possibly a level or two up)
+_DOM_EXTRACT_JS = """(labels) => {
+    const valueAfter = (el) => {
+        for (let node = el, depth = 0; node && depth < 3; node = node.parentElement, depth++) {
+            for (let sib = node.nextElementSibling; sib; sib = sib.nextElementSibling) {
+                const text = sib.textContent.trim();
+                if (text) return text;
+            }
+        }
+        return null;
+    };
+    const found = {};
+    for (const el of document.querySelectorAll('div, span, dt, th, td, label, p')) {
+        if (el.children.length) continue;
+        const field = labels[el.textContent.trim()];
+        const value = field && valueAfter(el);
+        if (value) (found[field] = found[field] || []).push(value);
+    }
+    return {fields: found, title: document.title};
+}"""
+# Installs a MutationObserver that re-reads the labelled fields (throttled to one read per
+# 100ms burst) and pushes them through the exposed binding whenever they change
+_DOM_OBSERVE_JS = """(labels) => {
+    const read = """ + _DOM_EXTRACT_JS + """;
+    let last = null, pending = false;
+    const push = () => {
+        pending = false;
+        const result = read(labels);
+        const key = JSON.stringify(result);
+        if (key !== last) {
+            last = key;
+            window.pushContractData(result);
+        }
+    };
+    new MutationObserver(() => {
+        if (!pending) {
+            pending = true;
+            setTimeout(push, 100);
+        }
+    }).observe(document.body, {subtree: true, childList: true, characterData: true});
+    push();
+}"""
+# Init-script form of the observer, so every reload/navigation of a monitored page re-installs
+# it (top frame only, once the body exists)
+_DOM_OBSERVE_INIT_JS = """(() => {
+    if (window !== window.top) return;
+    const start = () => (""" + _DOM_OBSERVE_JS + """)(""" + json.dumps(DOM_LABELS) + """);
+    if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', start);
+    else start();
+})()"""
+# Consecutive silent seconds after which a push-driven monitor falls back to polling
+_PUSH_STALL_TICKS = 10
 class DatabaseManager:
     def __init__(self, db_path="data/options_data.db"):
         self.db_path = db_path
@@ -173,12 +244,129 @@ class DatabaseManager:
             print(f"❌ Error getting contract data: {e}")
             return []
 
+# Chart series name -> data field, one row each in ExpandedContractTracker.chart_values
+_CHART_FIELDS = (
+    ('prices', 'current_price'),
+    ('volumes', 'volume'),
+    ('bids', 'bid'),
+    ('asks', 'ask'),
+    ('thetas', 'theta'),
+    ('gammas', 'gamma'),
+    ('highs', 'high'),
+    ('lows', 'low'),
+)
+
+# Charts redraw at most twice a second, however often refreshes are requested
+_CHART_MIN_INTERVAL = 0.5
+
+# Milliseconds between batched flushes of queued log lines into the terminal widget
+_LOG_DRAIN_INTERVAL_MS = 100
+
+# Seconds between the off-thread database readouts for a monitored contract
+_DB_STATUS_INTERVAL = 30
+
+class _InfoFields(dict):
+    """Contract data for the info panel template; missing fields render as N/A."""
+    def __missing__(self, key):
+        return 'N/A'
+
+# Info panel layout, filled in by format_map on every refresh
+_INFO_TEMPLATE = """
+🎯 EXPANDED CONTRACT: {key_upper}
+============================================================
+Status: EXPANDED & MONITORING (Dedicated Tab)
+Type: {type_upper}
+Price: {price_text}
+Strike: ${strike}
+Expiration: {expiration}
+Tab Number: #{tab_number}
+
+📊 LIVE MARKET DATA
+Current Premium: ${current_price}
+Bid: ${bid}
+Ask: ${ask}
+Spread: {spread_str}
+Volume: {volume}
+Open Interest: {open_interest}
+
+🏷️ LIVE GREEKS
+Delta: {delta}
+Gamma: {gamma}
+Theta: {theta}
+Vega: {vega}
+
+📈 DAILY RANGE
+High: ${high}
+Low: ${low}
+Implied Vol: {iv}%
+
+⏰ Live Updates
+Last Update: {last_update}
+Data Points: {data_points}
+Screenshots: Every 1 second
+            """
+
+class BlitManager:
+    """Redraw animated artists over a cached figure background (matplotlib blitting)."""
+    __slots__ = ('canvas', 'background', 'artists', 'cid')
+    
+    def __init__(self, canvas, animated_artists=()):
+        self.canvas = canvas
+        self.background = None
+        self.artists = []
+        for artist in animated_artists:
+            self.add_artist(artist)
+        # Any full draw (first show, resize, axis rescale) re-grabs the static background
+        self.cid = canvas.mpl_connect('draw_event', self.on_draw)
+    
+    def on_draw(self, event):
+        """Cache the freshly drawn background and paint the animated artists on top."""
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_animated()
+    
+    def add_artist(self, artist):
+        """Exclude an artist from full draws so only update() paints it."""
+        artist.set_animated(True)
+        self.artists.append(artist)
+    
+    def _draw_animated(self):
+        figure = self.canvas.figure
+        for artist in self.artists:
+            if artist.get_visible():  # Empty series and unused volume bars cost nothing
+                figure.draw_artist(artist)
+    
+    def update(self):
+        """Restore the cached background, redraw the animated artists and blit."""
+        if self.background is None:
+            self.canvas.draw_idle()  # draw_event fills in the background
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_animated()
+        self.canvas.blit(self.canvas.figure.bbox)
+
 class ExpandedContractTracker:
+    # Fixed attribute set - no per-instance __dict__. figure/axes/canvas and the chart artists
+    # stay unset until create_live_charts builds the widgets, so hasattr() checks keep working
+    __slots__ = (
+        'contract_key', 'option_type', 'price_cents', 'data_history', 'chart_values', 'chart_count', 'chart_head',
+        'current_data', 'last_update', 'db_manager', 'page', 'context', 'is_expanded',
+        'monitoring_active', 'tab_dedicated', 'expanded_locator', 'last_screenshot_hash',
+        'recent_shots', 'push_sink', 'observer_installed', 'refresh_pending', 'chart_redraw_pending',
+        'last_chart_draw', 'last_drawn_update',
+        'db_written_count', 'update_log_prefix',
+        'figure', 'axes', 'canvas', 'lines', 'placeholders', 'blit_manager',
+    )
+    
     def __init__(self, contract_key, option_type, price_cents, db_manager):
         self.contract_key = contract_key  # e.g., "call_09"
         self.option_type = option_type
         self.price_cents = price_cents
-        self.data_history = []
+        self.data_history = deque(maxlen=200)  # Last 200 data points for better graphs
+        # Same window as parallel float arrays (one row per _CHART_FIELDS entry) so charts
+        # plot array slices instead of re-parsing every dict on each redraw
+        self.chart_values = np.zeros((len(_CHART_FIELDS), self.data_history.maxlen))
+        self.chart_count = 0
+        self.chart_head = 0  # Column the next point goes into; wraps around once the window is full
         self.current_data = {}
         self.last_update = None
         self.db_manager = db_manager
@@ -189,40 +377,82 @@ class ExpandedContractTracker:
         self.is_expanded = False
         self.monitoring_active = False
         self.tab_dedicated = False  # Track if this contract has its own tab
+        self.expanded_locator = None  # Expanded contract element, for element-only screenshots
+        self.last_screenshot_hash = None  # Digest of that element's innerHTML at the last screenshot
+        self.recent_shots = deque(maxlen=10)  # (path, png bytes) - written out only when extraction fails
+        self.push_sink = None  # (loop, asyncio.Queue) the page's DOM observer feeds this session
+        self.observer_installed = False  # pushContractData binding and observer init script are on the page
+        self.refresh_pending = False  # A GUI refresh for this contract is queued on Tk
+        self.chart_redraw_pending = False  # A deferred chart redraw is queued on Tk
+        self.last_chart_draw = 0.0  # time.monotonic() of the last chart redraw
+        self.last_drawn_update = None  # last_update the charts were last drawn for
+        self.db_written_count = 0  # Data points handed to the database this session
+        self.update_log_prefix = f"  🔄 {contract_key}: $"  # Constant head of the periodic update log line
         
         # Save contract to database
         self.db_manager.save_contract(contract_key, option_type, price_cents)
         
-    def add_data_point(self, data):
-        """Add timestamped data point."""
-        data['timestamp'] = datetime.now()
+    def add_data_point(self, data, now=None):
+        """Add timestamped data point; now is the caller's already-read clock, if any."""
+        now = now or datetime.now()
+        data['timestamp'] = now
         self.data_history.append(data)
+        
+        row = [self.safe_int(data.get(field, 0)) if name == 'volumes' else self.safe_float(data.get(field, 0))
+               for name, field in _CHART_FIELDS]
+        # Ring buffer - overwrite the oldest column in place rather than shifting the window
+        self.chart_values[:, self.chart_head] = row
+        self.chart_head = (self.chart_head + 1) % self.chart_values.shape[1]
+        if self.chart_count < self.chart_values.shape[1]:
+            self.chart_count += 1
+        
         self.current_data = data
-        self.last_update = datetime.now()
+        self.last_update = now
         
         # Save to database
         self.db_manager.save_data_point(self.contract_key, data)
+        self.db_written_count += 1
+    
+    def add_data_points_batch(self, columns, timestamps):
+        """Add several timestamped data points at once; columns maps data field -> array."""
+        n = len(timestamps)
+        if not n:
+            return
+        maxlen = self.chart_values.shape[1]
         
-        # Keep only last 200 data points for better graphs
-        if len(self.data_history) > 200:
-            self.data_history = self.data_history[-200:]
+        # Only the newest maxlen points can survive in the window - skip writing the rest
+        start = max(0, n - maxlen)
+        zeros = np.zeros(n)
+        rows = [np.asarray(columns.get(field, zeros), dtype=float)[start:] for _, field in _CHART_FIELDS]
+        rows = np.array([np.trunc(row) if name == 'volumes' else row
+                         for row, (name, _) in zip(rows, _CHART_FIELDS)])
+        slots = (self.chart_head + start + np.arange(n - start)) % maxlen
+        self.chart_values[:, slots] = rows
+        self.chart_head = (self.chart_head + n) % maxlen
+        self.chart_count = min(maxlen, self.chart_count + n)
+        
+        for i, timestamp in enumerate(timestamps):
+            data = {field: values[i].item() for field, values in columns.items()}
+            data['timestamp'] = timestamp
+            self.data_history.append(data)
+            self.db_manager.save_data_point(self.contract_key, data)
+            self.db_written_count += 1
+        
+        self.current_data = data
+        self.last_update = datetime.now()
     
     def get_chart_data(self):
         """Get data formatted for charts."""
         if not self.data_history:
             return None
         
-        return {
-            'timestamps': [d['timestamp'] for d in self.data_history],
-            'prices': [self.safe_float(d.get('current_price', 0)) for d in self.data_history],
-            'volumes': [self.safe_int(d.get('volume', 0)) for d in self.data_history],
-            'bids': [self.safe_float(d.get('bid', 0)) for d in self.data_history],
-            'asks': [self.safe_float(d.get('ask', 0)) for d in self.data_history],
-            'thetas': [self.safe_float(d.get('theta', 0)) for d in self.data_history],
-            'gammas': [self.safe_float(d.get('gamma', 0)) for d in self.data_history],
-            'highs': [self.safe_float(d.get('high', 0)) for d in self.data_history],
-            'lows': [self.safe_float(d.get('low', 0)) for d in self.data_history],
-        }
+        values = self.chart_values[:, :self.chart_count]
+        if self.chart_count == self.chart_values.shape[1] and self.chart_head:
+            # Wrapped - one concatenate puts every series back in oldest-first order
+            values = np.concatenate((values[:, self.chart_head:], values[:, :self.chart_head]), axis=1)
+        chart_data = {name: values[row] for row, (name, _) in enumerate(_CHART_FIELDS)}
+        chart_data['timestamps'] = [d['timestamp'] for d in self.data_history]
+        return chart_data
     
     def safe_float(self, value):
         """Safely convert value to float."""
@@ -243,23 +473,54 @@ class ExpandedContractTracker:
             return 0
 
 class SPYExpandedTerminal:
-    def __init__(self, option_type):
+    def __init__(self, option_type, master=None):
+        self.master = master  # Existing Tk/Toplevel window to build into; a new Tk() if None
         self.option_type = option_type.lower()  # 'call' or 'put'
         self.contracts = {}  # contract_key -> ExpandedContractTracker
+        self._contract_order = {}  # contract_key -> insertion index, kept in step with self.contracts
+        self._info_rendered = {}  # contract_key -> text currently shown in its info widget
+        self._active_tab_key = None  # Contract whose notebook tab is showing - the only one charted
         self.contract_tabs = {}
         self.browser = None
         self.playwright = None
         self.tracked_prices = set()  # Track prices we're already monitoring
+        self._monitor_loop = None  # Shared event loop for contract monitoring tasks
+        self._rng = np.random.default_rng()  # Test-data noise for the debug chart paths
+        
+        # Per-tick monitoring detail is only formatted and shown at LOG_LEVEL=DEBUG
+        self._logger = logging.getLogger(f"SPYExpandedTerminal.{self.option_type}")
+        # Case-insensitive level name; getLevelName returns a number only for known names, so typos fall back to INFO
+        level = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+        self._logger.setLevel(level if isinstance(level, int) else logging.INFO)
         
         # Initialize database manager
         self.db_manager = DatabaseManager()
         
+        # Log lines from every thread are batched into the terminal widget by _drain_log_queue
+        self._log_queue = queue.Queue()
+        self._log_drain_id = None  # Pending after() id of the next drain
+        
+        # Screenshots and debug files are written by a background thread so the
+        # monitoring event loops never block on disk
+        self._io_queue = queue.Queue()
+        threading.Thread(target=self._io_writer, daemon=True).start()
+        
         # Setup GUI
         self.setup_gui()
         
+    def _io_writer(self):
+        """Write queued (path, bytes) pairs to disk, forever."""
+        while True:
+            path, blob = self._io_queue.get()
+            try:
+                with open(path, 'wb') as f:
+                    f.write(blob)
+            except Exception as e:
+                self.log(f"⚠️ Failed to write {path}: {e}")
+        
     def setup_gui(self):
         """Setup GUI for this terminal."""
-        self.root = tk.Tk()
+        self.root = self.master if self.master is not None else tk.Tk()
         self.root.title(f"🚀 SPY {self.option_type.upper()} Expanded Contract Tracker")
         self.root.geometry("1800x1000")
         self.root.configure(bg='#0d1117')
@@ -316,6 +577,9 @@ class SPYExpandedTerminal:
                                                  bg='#0d1117', fg='#f0f6fc', 
                                                  font=('SF Mono', 9))
         self.terminal.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        # With both terminals in one interpreter, closing this window must not leave its drain running
+        self.terminal.bind('<Destroy>', self._stop_log_drain)
+        self._drain_log_queue()
         
         # Contract tabs (right side)
         tabs_frame = tk.LabelFrame(content_frame, text=f" 📈 EXPANDED {self.option_type.upper()} Contracts ",
@@ -329,6 +593,7 @@ class SPYExpandedTerminal:
         
         self.notebook = ttk.Notebook(tabs_frame, style='Expanded.TNotebook')
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Clear screenshots after GUI is set up
         self.clear_screenshots()
@@ -344,9 +609,6 @@ class SPYExpandedTerminal:
     def clear_screenshots(self):
         """Clear screenshots for this option type."""
         try:
-            import os
-            import glob
-            
             pattern = f"screenshots/expanded_{self.option_type}_*"
             old_files = glob.glob(pattern)
             for f in old_files:
@@ -362,12 +624,34 @@ class SPYExpandedTerminal:
         except Exception as e:
             self.log(f"❌ Error clearing screenshots: {e}")
     
-    def log(self, message):
-        """Add message to terminal."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.terminal.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.terminal.see(tk.END)
-        self.root.update()
+    def log(self, message, timestamp=None):
+        """Queue a message for the terminal; safe to call from any thread."""
+        timestamp = (timestamp or datetime.now()).strftime("%H:%M:%S")
+        self._log_queue.put(f"[{timestamp}] {message}\n")
+    
+    def _drain_log_queue(self):
+        """Tk-thread: append every queued log line in one insert, then reschedule."""
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self.terminal.insert(tk.END, ''.join(lines))
+            self.terminal.see(tk.END)
+        self._log_drain_id = self.root.after(_LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
+    
+    def _stop_log_drain(self, event=None):
+        """Cancel the pending log drain once the terminal widget is destroyed."""
+        if self._log_drain_id is not None:
+            self.root.after_cancel(self._log_drain_id)
+            self._log_drain_id = None
+    
+    def _log_debug(self, message, *args):
+        """Lazily %-format and log message only when debug logging is enabled."""
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self.log(message % args)
     
     def update_status(self, status):
         """Update status display."""
@@ -559,7 +843,6 @@ class SPYExpandedTerminal:
             
         except Exception as e:
             self.log(f"❌ Error in find_and_expand_contracts: {e}")
-            import traceback
             self.log(f"📋 Full error traceback: {traceback.format_exc()}")
     
     async def find_contracts_in_range(self, page):
@@ -740,6 +1023,9 @@ class SPYExpandedTerminal:
             
             # Try to click and expand the contract
             expanded = False
+            # HTML fetched while verifying the click - reused by the first extraction if still fresh
+            last_content = None
+            last_content_at = 0.0
             for i in range(min(count, 3)):
                 try:
                     element = price_elements.nth(i)
@@ -798,6 +1084,7 @@ class SPYExpandedTerminal:
                                 # Also check for specific text content that indicates expansion
                                 try:
                                     page_content = await page.content()
+                                    last_content, last_content_at = page_content, time.monotonic()
                                     expansion_text_indicators = [
                                         'theta', 'gamma', 'delta', 'vega', 
                                         'volume', 'open interest', 'implied volatility',
@@ -881,6 +1168,7 @@ class SPYExpandedTerminal:
                         # Check if it worked
                         try:
                             page_content = await page.content()
+                            last_content, last_content_at = page_content, time.monotonic()
                             expansion_text_indicators = [
                                 'theta', 'gamma', 'delta', 'vega', 
                                 'volume', 'open interest', 'implied volatility'
@@ -922,7 +1210,11 @@ class SPYExpandedTerminal:
             
             max_attempts = 5
             for attempt in range(max_attempts):
-                initial_data = await self.extract_expanded_contract_data(page, price_cents)
+                # Skip a second DOM serialization if the click-verification HTML is under a second old
+                cached_content = None
+                if attempt == 0 and last_content and time.monotonic() - last_content_at < 1.0:
+                    cached_content = last_content
+                initial_data = await self.extract_expanded_contract_data(page, price_cents, cached_content)
                 
                 if initial_data and len(initial_data) > 5:  # Need at least 5 fields
                     tracker.add_data_point(initial_data)
@@ -930,6 +1222,7 @@ class SPYExpandedTerminal:
                     
                     # Store tracker
                     self.contracts[contract_key] = tracker
+                    self._contract_order.setdefault(contract_key, len(self._contract_order))
                     
                     # Create GUI tab
                     self.create_contract_tab(contract_key)
@@ -958,644 +1251,166 @@ class SPYExpandedTerminal:
             
         except Exception as e:
             self.log(f"❌ Error creating expanded context: {e}")
-            import traceback
             self.log(f"📋 Full error traceback: {traceback.format_exc()}")
             return False
     
-    async def extract_expanded_contract_data(self, page, price_cents):
+    async def extract_expanded_contract_data(self, page, price_cents, cached_content=None):
         """Extract data from expanded contract view."""
         try:
-            await asyncio.sleep(3)  # Wait for data to load
-            
-            # Scroll down to see all expanded contract details
-            self.log(f"  📜 Scrolling to view expanded contract details...")
-            
-            # Take a screenshot before scrolling to see the expanded state
-            try:
-                await page.screenshot(path=f"screenshots/before_scroll_{self.option_type}_{price_cents:02d}.png")
-            except:
-                pass
-            
-            # Gentle scroll down just a little to see the expanded details
-            try:
-                await page.evaluate("window.scrollBy(0, 100)")
-                await asyncio.sleep(1)
-            except Exception as scroll_error:
-                self.log(f"  ⚠️ Initial scroll failed: {scroll_error}")
-            
-            # Try to find the expanded contract area without excessive scrolling
-            try:
-                # Look for the expanded contract container with more specific selectors
-                expanded_selectors = [
-                    '[class*="expanded"]',
-                    '[class*="details"]', 
-                    '[class*="contract"]',
-                    '[class*="option"]',
-                    '[data-testid*="expanded"]',
-                    '[data-testid*="details"]'
-                ]
-                
-                found_element = False
-                for selector in expanded_selectors:
-                    try:
-                        elements = page.locator(selector)
-                        count = await elements.count()
-                        if count > 0:
-                            # Just scroll the element into view, don't move too much
-                            await elements.first.scroll_into_view_if_needed()
-                            self.log(f"  📜 Found and scrolled to expanded contract element")
-                            found_element = True
-                            break
-                    except:
-                        continue
-                
-                if not found_element:
-                    # If no specific elements found, just scroll a tiny bit more
-                    self.log(f"  📜 No specific elements found, gentle scroll...")
-                    try:
-                        await page.evaluate("window.scrollBy(0, 50)")
-                        await asyncio.sleep(1)
-                    except:
-                        pass
-                        
-            except Exception as scroll_error:
-                self.log(f"  ⚠️ Scroll error: {scroll_error}")
-            
-            # Take a screenshot after scrolling to see what we have
-            try:
-                await page.screenshot(path=f"screenshots/after_scroll_{self.option_type}_{price_cents:02d}.png")
-            except:
-                pass
-            
-            await asyncio.sleep(2)  # Wait for scroll to complete
-            
-            # Get page content with retry
-            content = None
-            max_content_attempts = 3
-            for content_attempt in range(max_content_attempts):
-                try:
-                    content = await page.content()
-                    break
-                except Exception as content_error:
-                    self.log(f"  ⚠️ Content extraction attempt {content_attempt + 1} failed: {content_error}")
-                    if content_attempt < max_content_attempts - 1:
-                        await asyncio.sleep(2)
-                    else:
-                        self.log(f"  ❌ Failed to get page content after {max_content_attempts} attempts")
-                        return None
-            
-            if not content:
-                return None
-            
-            # Check if contract is actually expanded
-            expansion_indicators = ['theta', 'gamma', 'delta', 'vega', 'volume', 'open interest', 'implied volatility']
-            found_indicators = sum(1 for indicator in expansion_indicators if indicator.lower() in content.lower())
-            
-            self.log(f"  🔍 Found {found_indicators}/{len(expansion_indicators)} expansion indicators in page content")
-            
-            # Check if we're still on the right contract
-            price_text = f"$0.{price_cents:02d}"
-            if price_text not in content:
-                self.log(f"  ⚠️ WARNING: {price_text} not found in page content - may have scrolled too far!")
-                # Try to scroll back up to find our contract
-                try:
-                    await page.evaluate("window.scrollBy(0, -200)")
-                    await asyncio.sleep(1)
-                    content = await page.content()
-                except:
-                    pass
-            
-            if found_indicators < 2:
-                self.log(f"  ⚠️ Contract may not be properly expanded - only {found_indicators} indicators found")
-                self.log(f"  🔍 Looking for: {expansion_indicators}")
-                self.log(f"  📜 Page contains: {[ind for ind in expansion_indicators if ind.lower() in content.lower()]}")
-            
-            data = {
-                'type': self.option_type,
-                'price_cents': price_cents,
-                'price_text': f"$0.{price_cents:02d}",
-                'symbol': 'SPY',
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            # DEBUG: Log specific text we're looking for
-            # Save debug HTML for analysis
-            try:
-                debug_html_path = f"screenshots/debug_extraction_{price_cents}.html"
-                with open(debug_html_path, 'w') as f:
-                    f.write(content)
-                self.log(f"  💾 Saved debug HTML to {debug_html_path}")
-            except:
-                pass
-                
-            if "Last trade" in content:
-                # Find all occurrences of "Last trade" with context
-                last_trade_contexts = []
-                for match in re.finditer(r'Last trade', content, re.IGNORECASE):
-                    start = max(0, match.start() - 50)
-                    end = min(len(content), match.end() + 100)
-                    context = content[start:end]
-                    last_trade_contexts.append(context)
-                    
-                if last_trade_contexts:
-                    self.log(f"  🔍 DEBUG: Found {len(last_trade_contexts)} 'Last trade' occurrences:")
-                    for i, ctx in enumerate(last_trade_contexts[:3]):
-                        # Clean up HTML tags for readability
-                        clean_ctx = re.sub(r'<[^>]+>', ' ', ctx)
-                        clean_ctx = re.sub(r'\s+', ' ', clean_ctx)
-                        self.log(f"    Context {i+1}: {clean_ctx.strip()}")
-                        
-            # Also look for any text containing prices
-            price_patterns = re.findall(r'\$?0\.\d{2}', content)
-            if price_patterns:
-                self.log(f"  🔍 DEBUG: Found {len(price_patterns)} option prices: {price_patterns[:10]}")
+            # Read the labelled fields straight from the DOM first - a small JSON result over CDP
+            # instead of serializing the whole page and regex-scanning it
+            data, extracted_fields = await self._extract_dom(page, price_cents)
+            
+            if extracted_fields <= 3:
+                # Fall back to regex over the full HTML. Callers that just fetched it pass it in
+                # to skip the scroll + page.content() round-trip
+                content = cached_content or await self._get_expanded_html(page, price_cents)
+                if not content:
+                    return None
                 
-            # Look for Low specifically
-            if "Low" in content:
-                low_contexts = []
-                for match in re.finditer(r'\bLow\b', content, re.IGNORECASE):
-                    start = max(0, match.start() - 50)
-                    end = min(len(content), match.end() + 100)
-                    context = content[start:end]
-                    low_contexts.append(context)
-                    
-                if low_contexts:
-                    self.log(f"  🔍 DEBUG: Found {len(low_contexts)} 'Low' occurrences:")
-                    for i, ctx in enumerate(low_contexts[:3]):
-                        # Clean up HTML tags for readability
-                        clean_ctx = re.sub(r'<[^>]+>', ' ', ctx)
-                        clean_ctx = re.sub(r'\s+', ' ', clean_ctx)
-                        self.log(f"    Low context {i+1}: {clean_ctx.strip()}")
-            
-            # Special pattern for Robinhood's HTML structure where label and value are separated
-            # Pattern: <label>Last trade</label>...<value>$0.08</value>
-            special_patterns = [
-                (r'Last trade</div></span><div[^>]*></div><span[^>]*><div[^>]*>\$?(\d+\.\d{2})</div>', 'current_price'),
-                (r'Low</div></span><div[^>]*></div><span[^>]*><div[^>]*>\$?(\d+\.\d{2})</div>', 'low'),
-                (r'Implied volatility</div></span><div[^>]*></div><span[^>]*><div[^>]*>(\d+\.\d{2})%</div>', 'iv'),
-            ]
-            
-            # Try special patterns first
-            for pattern, field in special_patterns:
-                if field not in data:
-                    match = re.search(pattern, content)
-                    if match:
-                        data[field] = match.group(1)
-                        self.log(f"    ✅ {field}: {match.group(1)} (special HTML pattern)")
-            
-            # Enhanced extraction patterns for expanded view with Robinhood-specific patterns
-            patterns = {
-                'current_price': [
-                    r'Last trade[:\s]*\$?(0?\.\d{2})',  # Last trade with 2 decimal places
-                    r'Last trade[:\s]*\$?(\d{1,2}\.\d{2})',  # Allow up to 2 digits
-                    r'Mark[:\s]*\$?(0?\.\d{2,4})',  # Mark price for options
-                    r'(?:Last|Price|Mark|Current)[:\s]+\$?(0?\.\d{2,4})',  # Option prices < $1
-                    r'Premium[:\s]+\$?(0?\.\d{2,4})', 
-                    r'\$(0?\.\d{2,4})\s*(?:Last|Current)',
-                ],
-                'bid': [
-                    r'Bid[:\s]+\$?(\d+\.\d{2,4})',
-                    r'Bid\s*\$?(\d+\.\d{2,4})',
-                    r'Bid[:\s]*\$?(\d+\.\d{2,4})',
-                    r'\$(\d+\.\d{2,4})\s*×\s*\d+',  # $0.07 × 1,062 format
-                    r'Bid[:\s]*(\d+\.\d{2,4})',  # Robinhood format
-                    r'Bid.*?\$(\d+\.\d{2,4})',  # Match Bid followed by $price
-                ],
-                'ask': [
-                    r'Ask[:\s]+\$?(\d+\.\d{2,4})',
-                    r'Ask\s*\$?(\d+\.\d{2,4})',
-                    r'Ask[:\s]*\$?(\d+\.\d{2,4})',
-                    r'\$(\d+\.\d{2,4})\s*×\s*\d+',  # $0.08 × 1,501 format
-                    r'Ask[:\s]*(\d+\.\d{2,4})',  # Robinhood format
-                    r'Ask.*?\$(\d+\.\d{2,4})',  # Match Ask followed by $price
-                ],
-                'volume': [
-                    r'Volume[:\s]+(\d+(?:,\d+)*)',
-                    r'Vol[:\s]+(\d+(?:,\d+)*)',
-                    r'Volume[:\s]*(\d+(?:,\d+)*)',
-                    r'Volume[:\s]*(\d{1,3}(?:,\d{3})*)',  # 14,029 format
-                    r'Volume[:\s]*(\d+)',  # Simple format
-                    r'Volume.*?(\d{1,3}(?:,\d{3})*)',  # Match Volume followed by number
-                ],
-                'open_interest': [
-                    r'Open Interest[:\s]+(\d+(?:,\d+)*)',
-                    r'OI[:\s]+(\d+(?:,\d+)*)',
-                    r'Open Interest[:\s]*(\d+(?:,\d+)*)',
-                    r'Open interest[:\s]*(\d{1,3}(?:,\d{3})*)',  # 3,726 format
-                    r'Open Interest[:\s]*(\d+)',  # Simple format
-                    r'Open interest.*?(\d+)',  # Match Open interest followed by number
-                ],
-                'theta': [
-                    r'Theta[:\s]+(-?\d+\.\d{2,4})',
-                    r'θ[:\s]+(-?\d+\.\d{2,4})',
-                    r'Theta[:\s]*(-?\d+\.\d+)',  # More flexible
-                    r'θ[:\s]*(-?\d+\.\d+)',
-                    r'Theta[:\s]*(-?\d+\.\d{4})',  # 4 decimal places
-                    r'Theta[:\s]*(\d+\.\d{4})',  # Positive format
-                    r'Theta[:\s]*(-?\d+\.\d{4})',  # -0.1305 format
-                    r'Theta[:\s]*(-?\d+\.\d{2,4})',  # Robinhood format
-                    r'Theta.*?(-?\d+\.\d{4})',  # Match Theta followed by number
-                ],
-                'gamma': [
-                    r'Gamma[:\s]+(\d+\.\d{2,4})',
-                    r'Γ[:\s]+(\d+\.\d{2,4})',
-                    r'Gamma[:\s]*(\d+\.\d+)',  # More flexible
-                    r'Γ[:\s]*(\d+\.\d+)',
-                    r'Gamma[:\s]*(\d+\.\d{4})',  # 4 decimal places
-                    r'Gamma[:\s]*(\d+\.\d{2,4})',  # Robinhood format
-                    r'Gamma.*?(\d+\.\d{4})',  # Match Gamma followed by number
-                ],
-                'delta': [
-                    r'Delta[:\s]+(-?\d+\.\d{2,4})',
-                    r'Δ[:\s]+(-?\d+\.\d{2,4})',
-                    r'Delta[:\s]*(-?\d+\.\d+)',  # More flexible
-                    r'Δ[:\s]*(-?\d+\.\d+)',
-                    r'Delta[:\s]*(-?\d+\.\d{4})',  # 4 decimal places
-                    r'Delta[:\s]*(-?\d+\.\d{2,4})',  # Robinhood format
-                    r'Delta.*?(\d+\.\d{4})',  # Match Delta followed by number
-                ],
-                'vega': [
-                    r'Vega[:\s]*(\d+\.\d{4})',
-                    r'Vega[:\s]*\$?(\d+\.\d{4})',
-                    r'Vega\s*(\d+\.\d{4})',
-                    r'Vega.*?(\d+\.\d{4})',
-                ],
-                'high': [
-                    r'High[:\s]*\$?(\d+\.\d{2,4})',
-                    r'High\s*\$?(\d+\.\d{2,4})',
-                    r'Day High[:\s]*\$?(\d+\.\d{2,4})',
-                    r'Daily High[:\s]*\$?(\d+\.\d{2,4})',
-                    r'High.*?\$(\d+\.\d{2,4})',
-                    r'(\d+\.\d{2,4})\s*High',  # Price followed by "High"
-                ],
-                'low': [
-                    r'Low[\s\n]*\$?(0?\.\d{2})',  # Low with newline/space then price
-                    r'Low[:\s]*\$?(0?\.\d{2})',  # Look for prices starting with 0. or just .
-                    r'Low\s*\$?(0?\.\d{2})',
-                    r'Day Low[:\s]*\$?(0?\.\d{2,4})',
-                    r'Daily Low[:\s]*\$?(0?\.\d{2,4})',
-                    r'Low.*?\$(0?\.\d{2})',
-                    r'(0?\.\d{2})\s*Low',  # Price followed by "Low"
-                    # Special pattern to get the second price after High (which should be Low)
-                    r'High[:\s]*\$?0?\.\d{2,4}[^\d]+(0?\.\d{2})',
-                    # Look for Low in a table/list structure after High
-                    r'High.*?</?\w+>.*?Low.*?(0?\.\d{2})',
-                    # Look for pattern where Low value might be in next element/line
-                    r'Low[^0-9\$]{0,20}(0?\.\d{2})',
-                    # Fallback patterns that look for any decimal under 10
-                    r'Low[:\s]*\$?(\d{1}\.\d{2})',  # Single digit prices
-                    r'Low.*?\$(\d{1}\.\d{2})',
-                    # Last resort - any price after High that's under 10
-                    r'High[:\s]*\$?\d+\.\d{2,4}[^\d]+(\d{1,2}\.\d{2})',
-                ],
-                'iv': [
-                    r'Implied volatility[\s\n]*(\d+\.\d+)%',  # Implied volatility with newline
-                    r'Implied volatility[:\s]*(\d+\.\d+)%?',
-                    r'Implied volatility[:\s]*(\d{2}\.\d{2})%?',  # XX.XX format specifically
-                    r'(?:Implied\s+)?(?:Vol|Volatility)[:\s]+(\d+\.\d+)%?',
-                    r'IV[:\s]+(\d+\.\d+)%?',
-                    r'(\d{2}\.\d{2})%',  # XX.XX format specifically
-                ],
-                'strike': [
-                    r'\$(\d{3,4})\s+Call',  # $635 Call format
-                    r'\$(\d{3,4})\s+Put',   # $635 Put format
-                    r'SPY\s+\$(\d{3,4})',   # SPY $635 format
-                    r'Strike[:\s]+\$?(\d+)',
-                    r'Strike\s+Price[:\s]+\$?(\d+)',
-                    r'Strike[:\s]*\$?(\d+)',  # Robinhood format
-                ],
-                'expiration': [
-                    r'Call\s+(\d{1,2}/\d{1,2})',  # Call 8/4 format
-                    r'Put\s+(\d{1,2}/\d{1,2})',   # Put 8/4 format
-                    r'(\d{1,2}/\d{1,2})$',         # Date at end of title
-                    r'(?:Exp|Expires?)[:\s]+(\d{1,2}/\d{1,2}(?:/\d{2,4})?)',
-                    r'Expiration[:\s]+(\d{1,2}/\d{1,2}(?:/\d{2,4})?)',
-                    r'Expires[:\s]*(\d{1,2}/\d{1,2}(?:/\d{2,4})?)',  # Robinhood format
-                ]
-            }
-            
-            extracted_fields = 0
-            for field, pattern_list in patterns.items():
-                # Skip if we already have this field from special patterns
-                if field in data:
-                    extracted_fields += 1
-                    continue
-                    
-                for pattern in pattern_list:
-                    try:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            value = matches[0].replace(',', '').strip()
-                            data[field] = value
-                            extracted_fields += 1
-                            self.log(f"    ✅ {field}: {value} (pattern: {pattern[:30]}...)")
-                            break  # Found match, move to next field
-                    except Exception as pattern_error:
-                        continue
-            
-            # If we didn't extract enough data, try direct text matching
-            if extracted_fields < 5:
-                self.log(f"    🔍 Trying direct text matching...")
-                
-                # Look for specific text patterns in the HTML
-                try:
-                    if "Bid" in content and "×" in content:
-                        bid_match = re.search(r'\$(\d+\.\d{2,4})\s*×', content)
-                        if bid_match and 'bid' not in data:
-                            data['bid'] = bid_match.group(1)
-                            extracted_fields += 1
-                            self.log(f"    ✅ bid: {bid_match.group(1)} (direct match)")
-                    
-                    if "Ask" in content and "×" in content:
-                        ask_match = re.search(r'\$(\d+\.\d{2,4})\s*×', content)
-                        if ask_match and 'ask' not in data:
-                            data['ask'] = ask_match.group(1)
-                            extracted_fields += 1
-                            self.log(f"    ✅ ask: {ask_match.group(1)} (direct match)")
-                    
-                    if "Volume" in content:
-                        vol_match = re.search(r'Volume[:\s]*(\d{1,3}(?:,\d{3})*)', content)
-                        if vol_match and 'volume' not in data:
-                            data['volume'] = vol_match.group(1).replace(',', '')
-                            extracted_fields += 1
-                            self.log(f"    ✅ volume: {vol_match.group(1)} (direct match)")
-                    
-                    if "Open interest" in content:
-                        oi_match = re.search(r'Open interest[:\s]*(\d{1,3}(?:,\d{3})*)', content)
-                        if oi_match and 'open_interest' not in data:
-                            data['open_interest'] = oi_match.group(1).replace(',', '')
-                            extracted_fields += 1
-                            self.log(f"    ✅ open_interest: {oi_match.group(1)} (direct match)")
-                    
-                    # Look for High/Low data
-                    if "High" in content:
-                        high_match = re.search(r'High[:\s]*\$?(\d+\.\d{2,4})', content)
-                        if high_match and 'high' not in data:
-                            data['high'] = high_match.group(1)
-                            extracted_fields += 1
-                            self.log(f"    ✅ high: {high_match.group(1)} (direct match)")
-                        else:
-                            # Try alternative patterns
-                            high_patterns = [
-                                r'Day High[:\s]*\$?(\d+\.\d{2,4})',
-                                r'Daily High[:\s]*\$?(\d+\.\d{2,4})',
-                                r'High.*?\$(\d+\.\d{2,4})',
-                                r'(\d+\.\d{2,4})\s*High'
-                            ]
-                            for pattern in high_patterns:
-                                high_match = re.search(pattern, content)
-                                if high_match and 'high' not in data:
-                                    data['high'] = high_match.group(1)
-                                    extracted_fields += 1
-                                    self.log(f"    ✅ high: {high_match.group(1)} (pattern: {pattern})")
-                                    break
-                    
-                    # Try to extract High and Low together since they appear in proximity
-                    high_low_match = re.search(r'High[:\s]*\$?(\d+\.\d{2,4}).*?Low[:\s]*\$?(\d+\.\d{2,4})', content, re.IGNORECASE | re.DOTALL)
-                    if high_low_match:
-                        if 'high' not in data:
-                            data['high'] = high_low_match.group(1)
-                            extracted_fields += 1
-                            self.log(f"    ✅ high: {high_low_match.group(1)} (high-low pair)")
-                        if 'low' not in data:
-                            data['low'] = high_low_match.group(2)
-                            extracted_fields += 1
-                            self.log(f"    ✅ low: {high_low_match.group(2)} (high-low pair)")
-                    
-                    # Also try reverse pattern (Low before High)
-                    low_high_match = re.search(r'Low[:\s]*\$?(\d+\.\d{2,4}).*?High[:\s]*\$?(\d+\.\d{2,4})', content, re.IGNORECASE | re.DOTALL)
-                    if low_high_match:
-                        if 'low' not in data:
-                            data['low'] = low_high_match.group(1)
-                            extracted_fields += 1
-                            self.log(f"    ✅ low: {low_high_match.group(1)} (low-high pair)")
-                        if 'high' not in data:
-                            data['high'] = low_high_match.group(2)
-                            extracted_fields += 1
-                            self.log(f"    ✅ high: {low_high_match.group(2)} (low-high pair)")
-                    
-                    if "Low" in content:
-                        low_match = re.search(r'Low[:\s]*\$?(\d+\.\d{2,4})', content)
-                        if low_match and 'low' not in data:
-                            data['low'] = low_match.group(1)
-                            extracted_fields += 1
-                            self.log(f"    ✅ low: {low_match.group(1)} (direct match)")
-                        else:
-                            # Try alternative patterns
-                            low_patterns = [
-                                r'Day Low[:\s]*\$?(\d+\.\d{2,4})',
-                                r'Daily Low[:\s]*\$?(\d+\.\d{2,4})',
-                                r'Low.*?\$(\d+\.\d{2,4})',
-                                r'(\d+\.\d{2,4})\s*Low',
-                                # Look for low value that appears after high in the same context
-                                r'High.*?(\d+\.\d{2,4}).*?Low.*?(\d+\.\d{2,4})',
-                                r'High[:\s]*\$?(\d+\.\d{2,4}).*?Low[:\s]*\$?(\d+\.\d{2,4})',
-                                # Look for any price near "Low" text
-                                r'Low[:\s]*(\d+\.\d{2,4})',
-                                r'(\d+\.\d{2,4})[^0-9]*Low',
-                                # Look for low in expanded contract context
-                                r'expanded.*?Low[:\s]*\$?(\d+\.\d{2,4})',
-                                r'contract.*?Low[:\s]*\$?(\d+\.\d{2,4})',
-                                # Look for low value in the same section as other data
-                                r'(?:Volume|Open interest|Theta|Gamma).*?Low[:\s]*\$?(\d+\.\d{2,4})'
-                            ]
-                            for pattern in low_patterns:
-                                low_match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-                                if low_match and 'low' not in data:
-                                    # If pattern has multiple groups, take the last one (usually the low value)
-                                    if len(low_match.groups()) > 1:
-                                        data['low'] = low_match.group(-1)  # Last group
-                                    else:
-                                        data['low'] = low_match.group(1)
-                                    extracted_fields += 1
-                                    self.log(f"    ✅ low: {data['low']} (pattern: {pattern[:50]}...)")
-                                    break
-                    
-                    # Look for Greeks with more flexible patterns
-                    greek_patterns = {
-                        'delta': r'Delta[:\s]*(-?\d+\.\d{4})',
-                        'gamma': r'Gamma[:\s]*(\d+\.\d{4})',
-                        'theta': r'Theta[:\s]*(-?\d+\.\d{4})',
-                        'vega': r'Vega[:\s]*(\d+\.\d{4})'
-                    }
-                    
-                    for greek, pattern in greek_patterns.items():
-                        if greek not in data:
-                            greek_match = re.search(pattern, content)
-                            if greek_match:
-                                data[greek] = greek_match.group(1)
-                                extracted_fields += 1
-                                self.log(f"    ✅ {greek}: {greek_match.group(1)} (direct match)")
-                except Exception as direct_error:
-                    self.log(f"    ⚠️ Direct matching failed: {direct_error}")
+                # Regex extraction is CPU-bound - keep it off the event loop so CDP traffic for the
+                # other contract pages keeps flowing; only large pages are worth a worker process
+                executor = _get_extract_pool() if len(content) >= _EXTRACT_POOL_MIN_CHARS else None
+                data, extracted_fields, log_lines = await asyncio.get_running_loop().run_in_executor(
+                    executor, extract_from_content, content, price_cents, self.option_type)
+                for line in log_lines:
+                    self.log(line)
             
             # Take screenshot of the expanded contract
             try:
                 screenshot_path = f"screenshots/expanded_{self.option_type}_{price_cents:02d}_initial.png"
-                await page.screenshot(path=screenshot_path)
+                self._io_queue.put_nowait((screenshot_path, await page.screenshot()))
             except:
                 pass
             
-            self.log(f"  📊 Extracted {extracted_fields} data fields from expanded contract")
-            
-            # Debug: Show what was extracted
-            if extracted_fields > 0:
-                self.log(f"  🔍 Extracted data: {list(data.keys())}")
-                for key, value in data.items():
-                    if key not in ['type', 'price_cents', 'price_text', 'symbol', 'timestamp']:
-                        self.log(f"    {key}: {value}")
-            else:
-                self.log(f"  ❌ No data fields extracted!")
-                self.log(f"  🔍 Page content sample: {content[:1000]}...")
-                
-                # Look for any numbers that might be our data
-                self.log(f"  🔍 Searching for potential data patterns...")
-                try:
-                    all_numbers = re.findall(r'\d+\.\d+', content)
-                    self.log(f"  📊 Found {len(all_numbers)} decimal numbers: {all_numbers[:10]}")
-                    
-                    # Look for Greek letters or words
-                    greek_words = re.findall(r'(?:theta|gamma|delta|vega|volume|open interest|implied volatility)', content, re.IGNORECASE)
-                    self.log(f"  📊 Found {len(greek_words)} Greek/data words: {greek_words[:10]}")
-                    
-                    # Look for high/low specific content
-                    high_low_content = re.findall(r'(?:high|low|day high|day low|daily high|daily low)', content, re.IGNORECASE)
-                    self.log(f"  📊 Found {len(high_low_content)} high/low references: {high_low_content[:10]}")
-                    
-                    # Look for specific values we know should be there
-                    self.log(f"  🔍 Looking for specific known values...")
-                    if "0.08" in content:
-                        self.log(f"    ✅ Found bid price: 0.08")
-                    if "0.09" in content:
-                        self.log(f"    ✅ Found ask price: 0.09")
-                    if "9778" in content or "9,778" in content:
-                        self.log(f"    ✅ Found volume: 9,778")
-                    if "1863" in content or "1,863" in content:
-                        self.log(f"    ✅ Found open interest: 1,863")
-                    if "0.1401" in content:
-                        self.log(f"    ✅ Found theta: 0.1401")
-                    if "0.0116" in content:
-                        self.log(f"    ✅ Found gamma: 0.0116")
-                    if "0.0347" in content:
-                        self.log(f"    ✅ Found delta: 0.0347")
-                    if "0.0339" in content:
-                        self.log(f"    ✅ Found vega: 0.0339")
-                    
-                    # Special debugging for Low extraction since it's failing
-                    if 'low' not in data:
-                        self.log(f"  🔍 DEBUG: Low value not found, investigating...")
-                        
-                        # Find all occurrences of "low" in the content
-                        low_indices = []
-                        for match in re.finditer(r'low', content, re.IGNORECASE):
-                            low_indices.append(match.start())
-                        
-                        self.log(f"  📍 Found {len(low_indices)} occurrences of 'low' in content")
-                        
-                        # Look at context around each "low" occurrence
-                        for idx, pos in enumerate(low_indices[:5]):  # Check first 5 occurrences
-                            context_start = max(0, pos - 50)
-                            context_end = min(len(content), pos + 50)
-                            context = content[context_start:context_end]
-                            self.log(f"  📍 Low context {idx + 1}: ...{context}...")
-                            
-                            # Try to extract any numbers near this "low"
-                            numbers_near = re.findall(r'\d+\.\d{2,4}', context)
-                            if numbers_near:
-                                self.log(f"    💡 Numbers near 'low': {numbers_near}")
-                        
-                        # Try more aggressive patterns
-                        aggressive_patterns = [
-                            # Look for any number within 100 chars after "low"
-                            r'low.{0,100}?(\d+\.\d{2,4})',
-                            # Look for any number within 100 chars before "low"
-                            r'(\d+\.\d{2,4}).{0,100}?low',
-                            # Look for "Low" followed by any non-digit chars then a number
-                            r'Low[^\d]{0,50}(\d+\.\d{2,4})',
-                            # Look for numbers between High and next section
-                            r'High[:\s]*\$?(\d+\.\d{2,4})[^0-9]+(\d+\.\d{2,4})',
-                            # Look for second number after High
-                            r'High.*?(\d+\.\d{2,4}).*?(\d+\.\d{2,4})',
-                        ]
-                        
-                        for pattern in aggressive_patterns:
-                            matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
-                            if matches:
-                                self.log(f"  🎯 Aggressive pattern '{pattern[:30]}...' found: {matches}")
-                                if isinstance(matches[0], tuple) and len(matches[0]) > 1:
-                                    # For patterns with multiple groups, try the second one as low
-                                    potential_low = matches[0][1]
-                                    self.log(f"  💡 Potential low value from tuple: {potential_low}")
-                                elif isinstance(matches[0], str):
-                                    potential_low = matches[0]
-                                    self.log(f"  💡 Potential low value: {potential_low}")
-                    
-                    # Look for high/low values specifically
-                    high_low_numbers = re.findall(r'(\d+\.\d{2,4})\s*(?:high|low)', content, re.IGNORECASE)
-                    if high_low_numbers:
-                        self.log(f"    ✅ Found high/low numbers: {high_low_numbers}")
-                    
-                    # Look for any price-like numbers near "high" or "low" words
-                    high_low_context = re.findall(r'(?:high|low)[:\s]*\$?(\d+\.\d{2,4})', content, re.IGNORECASE)
-                    if high_low_context:
-                        self.log(f"    ✅ Found high/low context: {high_low_context}")
-                        
-                except Exception as debug_error:
-                    self.log(f"  ⚠️ Debug search failed: {debug_error}")
-                
+            if extracted_fields == 0:
                 # Take a debug screenshot to see what the page looks like
                 try:
                     debug_screenshot = f"screenshots/debug_extraction_{self.option_type}_{price_cents:02d}.png"
-                    await page.screenshot(path=debug_screenshot)
+                    self._io_queue.put_nowait((debug_screenshot, await page.screenshot()))
                     self.log(f"  📸 Debug screenshot: {debug_screenshot}")
                 except:
                     pass
-                
-                # Save the HTML content for debugging
+            
+            return data if extracted_fields > 3 else None
+            
+        except Exception as e:
+            self.log(f"❌ Error extracting expanded data: {e}")
+            self.log(f"📋 Full error traceback: {traceback.format_exc()}")
+            return None
+    
+    async def _extract_dom(self, page, price_cents):
+        """Read labelled fields from the live DOM in one evaluate call. Returns (data, extracted_fields)."""
+        try:
+            result = await page.evaluate(_DOM_EXTRACT_JS, DOM_LABELS)
+        except Exception as dom_error:
+            self.log(f"  ⚠️ DOM extraction failed: {dom_error}")
+            return None, 0
+        return dom_result_to_data(result, price_cents, self.option_type, self.log)
+    
+    async def _find_expanded_locator(self, page):
+        """First element matching the expanded contract selectors, or None."""
+        for selector in _EXPANDED_SELECTORS:
+            try:
+                elements = page.locator(selector)
+                if await elements.count() > 0:
+                    return elements.first
+            except:
+                continue
+        return None
+    
+    async def _get_expanded_html(self, page, price_cents):
+        """Bring the expanded contract into view and fetch the page HTML."""
+        await asyncio.sleep(3)  # Wait for data to load
+        
+        # Scroll down to see all expanded contract details
+        self.log(f"  📜 Scrolling to view expanded contract details...")
+        
+        # Take a screenshot before scrolling to see the expanded state
+        try:
+            self._io_queue.put_nowait((f"screenshots/before_scroll_{self.option_type}_{price_cents:02d}.png",
+                                       await page.screenshot()))
+        except:
+            pass
+        
+        # Gentle scroll down just a little to see the expanded details
+        try:
+            await page.evaluate("window.scrollBy(0, 100)")
+            await asyncio.sleep(1)
+        except Exception as scroll_error:
+            self.log(f"  ⚠️ Initial scroll failed: {scroll_error}")
+        
+        # Try to find the expanded contract area without excessive scrolling
+        expanded_locator = None
+        try:
+            # Look for the expanded contract container with more specific selectors
+            for selector in _EXPANDED_SELECTORS:
                 try:
-                    html_debug_file = f"screenshots/debug_html_{self.option_type}_{price_cents:02d}.html"
-                    with open(html_debug_file, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    self.log(f"  📄 HTML content saved to: {html_debug_file}")
+                    elements = page.locator(selector)
+                    count = await elements.count()
+                    if count > 0:
+                        # Just scroll the element into view, don't move too much
+                        await elements.first.scroll_into_view_if_needed()
+                        self.log(f"  📜 Found and scrolled to expanded contract element")
+                        expanded_locator = elements.first
+                        break
                 except:
-                    pass
+                    continue
             
-            # Validate high/low values before returning
-            if 'high' in data:
+            if expanded_locator is None:
+                # If no specific elements found, just scroll a tiny bit more
+                self.log(f"  📜 No specific elements found, gentle scroll...")
                 try:
-                    high_val = float(data['high'])
-                    # If high is > 50, it's probably a stock price, not option price
-                    if high_val > 50:
-                        self.log(f"  ⚠️ High value {high_val} seems like stock price, removing")
-                        del data['high']
-                        extracted_fields -= 1
+                    await page.evaluate("window.scrollBy(0, 50)")
+                    await asyncio.sleep(1)
                 except:
                     pass
-            
-            if 'low' in data:
+                    
+        except Exception as scroll_error:
+            self.log(f"  ⚠️ Scroll error: {scroll_error}")
+        
+        # Take a screenshot after scrolling to see what we have
+        try:
+            self._io_queue.put_nowait((f"screenshots/after_scroll_{self.option_type}_{price_cents:02d}.png",
+                                       await page.screenshot()))
+        except:
+            pass
+        
+        await asyncio.sleep(2)  # Wait for scroll to complete
+        
+        # Get page content with retry
+        content = None
+        max_content_attempts = 3
+        for content_attempt in range(max_content_attempts):
+            try:
+                content = await page.content()
+                break
+            except Exception as content_error:
+                self.log(f"  ⚠️ Content extraction attempt {content_attempt + 1} failed: {content_error}")
+                if content_attempt < max_content_attempts - 1:
+                    await asyncio.sleep(2)
+                else:
+                    self.log(f"  ❌ Failed to get page content after {max_content_attempts} attempts")
+                    return None
+        
+        # Check if we're still on the right contract
+        price_text = f"$0.{price_cents:02d}"
+        if price_text not in content:
+            self.log(f"  ⚠️ WARNING: {price_text} not found in page content - may have scrolled too far!")
+            # page.content() serializes the whole DOM regardless of scroll position, so just
+            # bring the expanded contract back into view instead of dumping the HTML again
+            if expanded_locator is not None:
                 try:
-                    low_val = float(data['low'])
-                    # If low is > 50, it's probably a stock price, not option price
-                    if low_val > 50:
-                        self.log(f"  ⚠️ Low value {low_val} seems like stock price, removing")
-                        del data['low']
-                        extracted_fields -= 1
-                    # Also check if low is greater than high (if we have both)
-                    elif 'high' in data:
-                        high_val = float(data.get('high', 0))
-                        if low_val > high_val and high_val > 0:
-                            self.log(f"  ⚠️ Low {low_val} > High {high_val}, swapping")
-                            data['high'], data['low'] = data['low'], data['high']
+                    in_viewport = await expanded_locator.evaluate(
+                        "e => { const r = e.getBoundingClientRect();"
+                        " return r.bottom > 0 && r.right > 0 && r.top < innerHeight && r.left < innerWidth; }"
+                    )
+                    if not in_viewport:
+                        await expanded_locator.scroll_into_view_if_needed()
                 except:
                     pass
-            
-            return data if extracted_fields > 3 else None
-            
-        except Exception as e:
-            self.log(f"❌ Error extracting expanded data: {e}")
-            import traceback
-            self.log(f"📋 Full error traceback: {traceback.format_exc()}")
-            return None
+        
+        return content
     
     def create_contract_tab(self, contract_key):
         """Create GUI tab for expanded contract."""
@@ -1684,40 +1499,87 @@ class SPYExpandedTerminal:
             ax5 = fig.add_subplot(2, 3, 5, facecolor='#161b22')  # Gamma
             ax6 = fig.add_subplot(2, 3, 6, facecolor='#161b22')  # High/Low
             
-            axes = [ax1, ax2, ax3, ax4, ax5, ax6]
-            
-            # Style all axes
-            for ax in axes:
-                ax.tick_params(colors='white', labelsize=8)
-                for spine in ax.spines.values():
-                    spine.set_color('white')
-                ax.grid(True, alpha=0.3, color='white')
-            
-            # Set titles
-            titles = ['Price Over Time', 'Volume', 'Bid/Ask Spread', 'Theta Decay', 'Gamma', 'Daily High/Low']
-            for ax, title in zip(axes, titles):
-                ax.set_title(title, color='white', fontsize=10, pad=10)
-            
-            # Initial placeholder
-            for ax in axes:
-                ax.text(0.5, 0.5, 'Collecting live data...', ha='center', va='center',
-                       transform=ax.transAxes, color='white', fontsize=9)
-            
-            fig.tight_layout(pad=2.0)
-            
             # Embed in tkinter
             canvas = FigureCanvasTkAgg(fig, parent_frame)
             canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
             
             # Store references for live updates
             tracker.figure = fig
-            tracker.axes = axes
+            tracker.axes = [ax1, ax2, ax3, ax4, ax5, ax6]
             tracker.canvas = canvas
+            self._style_axes_once(tracker)
+            self._init_chart_artists(tracker)
+            
+            fig.tight_layout(pad=2.0)
             self.log(f"✅ Created chart widgets for {contract_key}")
             
         except Exception as e:
             self.log(f"❌ Error creating live charts: {e}")
     
+    def _style_axes_once(self, tracker):
+        """Apply the static colours, grid, titles and labels - never repeated on updates."""
+        titles = ['Price Over Time', 'Volume', 'Bid/Ask Spread', 'Theta Decay', 'Gamma', 'Daily High/Low']
+        ylabels = ['Premium ($)', 'Volume', 'Price ($)', 'Theta', 'Gamma', 'Price ($)']
+        for ax, title, ylabel in zip(tracker.axes, titles, ylabels):
+            ax.set_facecolor('#161b22')
+            ax.tick_params(colors='white', labelsize=8)
+            for spine in ax.spines.values():
+                spine.set_color('white')
+            ax.grid(True, alpha=0.3, color='white')
+            ax.set_title(title, color='white', fontsize=10, pad=10)
+            ax.set_ylabel(ylabel, color='white', fontsize=8)
+            ax.set_ymargin(0.15)  # Headroom so small moves blit instead of rescaling
+    
+    def _init_chart_artists(self, tracker):
+        """Build the persistent chart artists once per contract."""
+        ax1, ax2, ax3, ax4, ax5, ax6 = tracker.axes
+        maxlen = tracker.data_history.maxlen
+        
+        # One artist per series, updated in place with set_data() on every refresh.
+        # Volume gets a bar per history slot; unused bars stay hidden
+        tracker.lines = {
+            'price': ax1.plot([], [], color='#7ee787', linewidth=2, marker='o', markersize=3)[0],
+            'volume_bars': ax2.bar(range(maxlen), np.zeros(maxlen), color='#58a6ff', alpha=0.7),
+            'bid': ax3.plot([], [], color='#7ee787', label='Bid', linewidth=2)[0],
+            'ask': ax3.plot([], [], color='#fbb6ce', label='Ask', linewidth=2)[0],
+            'theta': ax4.plot([], [], color='#ffa657', linewidth=2, marker='s', markersize=3)[0],
+            'gamma': ax5.plot([], [], color='#f85149', linewidth=2, marker='^', markersize=3)[0],
+            'high': ax6.plot([], [], color='#7ee787', label='High', linewidth=2)[0],
+            'low': ax6.plot([], [], color='#f85149', label='Low', linewidth=2)[0],
+        }
+        # Legends are built once from explicit handles; updates never touch them
+        lines = tracker.lines
+        ax3.legend(handles=[lines['bid'], lines['ask']], labels=['Bid', 'Ask'], fontsize=8)
+        ax6.legend(handles=[lines['high'], lines['low']], labels=['High', 'Low'], fontsize=8)
+        ax3.get_legend().set_visible(False)  # Shown once there is something to label
+        ax6.get_legend().set_visible(False)
+        
+        # Series start hidden (after the legends copy their style); update_live_charts
+        # shows them as data arrives
+        for key, artist in tracker.lines.items():
+            if key != 'volume_bars':
+                artist.set_visible(False)
+        for bar in tracker.lines['volume_bars']:
+            bar.set_visible(False)
+        
+        # Initial placeholder
+        tracker.placeholders = [
+            ax.text(0.5, 0.5, 'Collecting live data...', ha='center', va='center',
+                    transform=ax.transAxes, color='white', fontsize=9)
+            for ax in tracker.axes
+        ]
+        
+        artists = [artist for key, artist in tracker.lines.items() if key != 'volume_bars']
+        artists.extend(tracker.lines['volume_bars'])
+        tracker.blit_manager = BlitManager(tracker.canvas, artists)
+    
+    def _get_monitor_loop(self):
+        """Event loop, running on one background thread, shared by all contract monitors."""
+        if self._monitor_loop is None:
+            self._monitor_loop = asyncio.new_event_loop()
+            threading.Thread(target=self._monitor_loop.run_forever, daemon=True).start()
+        return self._monitor_loop
+    
     def start_contract_monitoring(self, contract_key):
         """Start continuous monitoring for specific expanded contract."""
         try:
@@ -1729,141 +1591,175 @@ class SPYExpandedTerminal:
             # Start timer-based chart updates
             self.start_chart_update_timer(contract_key)
             
-            def monitor_expanded_contract():
+            async def monitoring_loop():
                 """Monitor expanded contract continuously."""
-                import asyncio
+                screenshot_count = 0
                 
-                async def monitoring_loop():
-                    screenshot_count = 0
-                    
-                    while tracker.monitoring_active and tracker.page:
+                # Have the page push field values whenever its DOM changes, instead of
+                # re-serializing the whole page over CDP every second
+                updates = asyncio.Queue()
+                tracker.push_sink = (asyncio.get_running_loop(), updates)
+                
+                def push_contract_data(source, result):
+                    # Bound once per page; always feeds the current monitoring session
+                    monitor_loop, sink = tracker.push_sink
+                    monitor_loop.call_soon_threadsafe(sink.put_nowait, result)
+                
+                try:
+                    if not tracker.observer_installed:
                         try:
-                            screenshot_count += 1
-                            timestamp = datetime.now().strftime("%H%M%S")
+                            await tracker.page.expose_binding('pushContractData', push_contract_data)
+                        except Exception as bind_error:
+                            # Left over from an earlier session on this page - it already routes via push_sink
+                            if 'already registered' not in str(bind_error):
+                                raise
+                        await tracker.page.add_init_script(_DOM_OBSERVE_INIT_JS)
+                        tracker.observer_installed = True
+                    # The init script covers later loads; install on the current document now
+                    await tracker.page.evaluate(_DOM_OBSERVE_JS, DOM_LABELS)
+                    push_driven = True
+                except Exception as observe_error:
+                    self.log(f"⚠️ DOM observer unavailable for {contract_key}, polling instead: {observe_error}")
+                    push_driven = False
+                silent_ticks = 0
+                
+                while tracker.monitoring_active and tracker.page:
+                    try:
+                        screenshot_count += 1
+                        timestamp = datetime.now().strftime("%H%M%S")
+                        
+                        # Take screenshot of EXPANDED contract - just the element, and only when
+                        # its markup changed, since PNG-encoding the full page dominates the tick.
+                        # Frames stay in memory and only reach disk when an extraction fails
+                        screenshot_path = f"screenshots/expanded_{contract_key}_live_{timestamp}_{screenshot_count:03d}.png"
+                        if tracker.expanded_locator is None:
+                            tracker.expanded_locator = await self._find_expanded_locator(tracker.page)
+                        if tracker.expanded_locator is not None:
+                            try:
+                                html = await tracker.expanded_locator.evaluate('e => e.innerHTML')
+                                digest = hashlib.blake2b(html.encode(), digest_size=8).digest()
+                                if digest != tracker.last_screenshot_hash:
+                                    tracker.recent_shots.append((screenshot_path, await tracker.expanded_locator.screenshot()))
+                                    tracker.last_screenshot_hash = digest
+                            except Exception as screenshot_error:
+                                # Element went away (re-render) - look it up again next tick
+                                self.log(f"⚠️ Expanded element screenshot failed: {screenshot_error}")
+                                tracker.expanded_locator = None
+                        else:
+                            tracker.recent_shots.append((screenshot_path, await tracker.page.screenshot()))
+                        
+                        # Extract current data from EXPANDED view
+                        if push_driven:
+                            try:
+                                result = await asyncio.wait_for(updates.get(), timeout=1)
+                                silent_ticks = 0
+                            except asyncio.TimeoutError:
+                                silent_ticks += 1
+                                if silent_ticks >= _PUSH_STALL_TICKS:
+                                    # Observer lost (or page frozen) - don't go quiet, poll instead
+                                    self.log(f"⚠️ No DOM updates for {contract_key} in {silent_ticks}s, polling instead")
+                                    push_driven = False
+                                continue  # Nothing changed this second
+                            # Only the newest snapshot matters if several queued up
+                            while not updates.empty():
+                                result = updates.get_nowait()
+                            # Per-tick - extraction chatter only shows at LOG_LEVEL=DEBUG
+                            current_data, extracted_fields = dom_result_to_data(
+                                result, tracker.price_cents, self.option_type, lambda line: self._log_debug("%s", line))
+                            if extracted_fields <= 3:
+                                current_data = None
+                        else:
+                            current_data = await self.extract_expanded_contract_data(tracker.page, tracker.price_cents)
+                        if current_data:
+                            self._log_debug("🔍 Data extraction #%s: SUCCESS - Price:$%s Bid:$%s Ask:$%s Vol:%s Θ:%s",
+                                            screenshot_count, current_data.get('current_price', 'N/A'),
+                                            current_data.get('bid', 'N/A'), current_data.get('ask', 'N/A'),
+                                            current_data.get('volume', 'N/A'), current_data.get('theta', 'N/A'))
                             
-                            # Take screenshot of EXPANDED contract
-                            screenshot_path = f"screenshots/expanded_{contract_key}_live_{timestamp}_{screenshot_count:03d}.png"
-                            await tracker.page.screenshot(path=screenshot_path)
-                            self.log(f"📸 Screenshot #{screenshot_count} saved: {screenshot_path}")
+                            # Log high/low data specifically
+                            self._log_debug("📊 High/Low data: High=$%s Low=$%s",
+                                            current_data.get('high', 'N/A'), current_data.get('low', 'N/A'))
                             
-                            # Extract current data from EXPANDED view
-                            current_data = await self.extract_expanded_contract_data(tracker.page, tracker.price_cents)
-                            if current_data:
-                                self.log(f"🔍 Data extraction #{screenshot_count}: SUCCESS - Price:${current_data.get('current_price', 'N/A')} Bid:${current_data.get('bid', 'N/A')} Ask:${current_data.get('ask', 'N/A')} Vol:{current_data.get('volume', 'N/A')} Θ:{current_data.get('theta', 'N/A')}")
-                                
-                                # Log high/low data specifically
-                                high = current_data.get('high', 'N/A')
-                                low = current_data.get('low', 'N/A')
-                                self.log(f"📊 High/Low data: High=${high} Low=${low}")
-                                
-                                # Enhanced debug logging for specific values
-                                try:
-                                    page_content = await tracker.page.content()
-                                    
-                                    # Look for "Last trade" specifically
-                                    last_trade_matches = re.findall(r'Last trade[:\s]*\$?(\d+\.\d{2})', page_content)
-                                    if last_trade_matches:
-                                        self.log(f"    ✅ Found Last trade values: {last_trade_matches}")
-                                    
-                                    # Look for implied volatility specifically
-                                    iv_matches = re.findall(r'Implied volatility[:\s]*(\d+\.\d{2})%', page_content)
-                                    if iv_matches:
-                                        self.log(f"    ✅ Found Implied volatility values: {iv_matches}")
-                                    
-                                    # Look for Low value specifically
-                                    low_matches = re.findall(r'Low[:\s]*\$?(\d+\.\d{2})', page_content)
-                                    if low_matches:
-                                        self.log(f"    ✅ Found Low values: {low_matches}")
-                                        
-                                except Exception as debug_error:
-                                    self.log(f"    ⚠️ Debug logging error: {debug_error}")
-                                
-                            else:
-                                self.log(f"🔍 Data extraction #{screenshot_count}: FAILED - No data extracted")
-                                # Try to get page content for debugging
-                                try:
-                                    page_content = await tracker.page.content()
-                                    self.log(f"🔍 Page content length: {len(page_content)} characters")
-                                except Exception as content_error:
-                                    self.log(f"🔍 Could not get page content: {content_error}")
+                        else:
+                            self.log(f"🔍 Data extraction #{screenshot_count}: FAILED - No data extracted")
+                            # Flush the recent frames plus the page HTML for post-mortem
+                            while tracker.recent_shots:
+                                self._io_queue.put_nowait(tracker.recent_shots.popleft())
+                            try:
+                                html_path = f"screenshots/expanded_{contract_key}_failed_{timestamp}_{screenshot_count:03d}.html"
+                                self._io_queue.put_nowait((html_path, (await tracker.page.content()).encode()))
+                                self.log(f"📸 Saved recent screenshots and HTML for failed extraction #{screenshot_count}")
+                            except Exception as content_error:
+                                self.log(f"🔍 Could not get page content: {content_error}")
+                        
+                        if current_data:
+                            # Add data point to tracker
+                            tracker.add_data_point(current_data)
+                            self._log_debug("💾 Data point #%s added to tracker - Total points: %s",
+                                            screenshot_count, len(tracker.data_history))
                             
-                            if current_data:
-                                # Add data point to tracker
-                                tracker.add_data_point(current_data)
-                                self.log(f"💾 Data point #{screenshot_count} added to tracker - Total points: {len(tracker.data_history)}")
-                                
-                                # Update GUI displays immediately with proper error handling
-                                try:
-                                    self.root.after(0, lambda ck=contract_key: self.update_contract_info_display(ck))
-                                    self.log(f"🔄 GUI info display updated for {contract_key}")
-                                    
-                                    # Update charts with more detailed logging
-                                    self.root.after(0, lambda ck=contract_key: self.update_live_charts(ck))
-                                    self.log(f"📊 Chart update triggered for {contract_key}")
-                                    
-                                except Exception as gui_error:
-                                    self.log(f"⚠️ GUI update error for {contract_key}: {gui_error}")
+                            # Update GUI displays with proper error handling - at most one refresh per
+                            # contract queued on Tk at a time, so slow redraws can't flood the event queue
+                            try:
+                                if not tracker.refresh_pending:
+                                    tracker.refresh_pending = True
+                                    self.root.after(0, lambda ck=contract_key: self._refresh_contract(ck))
+                                    self._log_debug("🔄 GUI refresh scheduled for %s", contract_key)
                                 
-                                # Log every 5 seconds to show progress
-                                if screenshot_count % 5 == 0:
-                                    price = current_data.get('current_price', 'N/A')
-                                    volume = current_data.get('volume', 'N/A')
-                                    theta = current_data.get('theta', 'N/A')
-                                    bid = current_data.get('bid', 'N/A')
-                                    ask = current_data.get('ask', 'N/A')
-                                    tab_num = list(self.contracts.keys()).index(contract_key) + 1
-                                    self.log(f"  📊 Tab#{tab_num} {contract_key}: ${price} (Bid:${bid} Ask:${ask}), Vol={volume}, Θ={theta} | Data points: {len(tracker.data_history)}")
-                                    
-                                    # Show data stream summary
-                                    self.log(f"  📈 Data Stream Summary: {len(tracker.data_history)} points collected, {screenshot_count} screenshots taken")
-                                    
-                                    # Show continuous monitoring status
-                                    self.log(f"  📊 Continuous Monitoring: Screenshots every 1s, Data extraction every 1s, Chart updates every 1s")
-                                    
-                                    # Debug widgets every 30 seconds
-                                    if screenshot_count % 30 == 0:
-                                        self.debug_widgets(contract_key)
+                            except Exception as gui_error:
+                                self.log(f"⚠️ GUI update error for {contract_key}: {gui_error}")
+                            
+                            # Log every 5 seconds to show progress
+                            if screenshot_count % 5 == 0:
+                                price = current_data.get('current_price', 'N/A')
+                                volume = current_data.get('volume', 'N/A')
+                                theta = current_data.get('theta', 'N/A')
+                                bid = current_data.get('bid', 'N/A')
+                                ask = current_data.get('ask', 'N/A')
+                                tab_num = self._contract_order[contract_key] + 1
+                                self.log(f"  📊 Tab#{tab_num} {contract_key}: ${price} (Bid:${bid} Ask:${ask}), Vol={volume}, Θ={theta} | Data points: {len(tracker.data_history)}")
                                 
-                                # Log every second for first 10 seconds to show it's working
-                                if screenshot_count <= 10:
-                                    price = current_data.get('current_price', 'N/A')
-                                    bid = current_data.get('bid', 'N/A')
-                                    ask = current_data.get('ask', 'N/A')
-                                    volume = current_data.get('volume', 'N/A')
-                                    theta = current_data.get('theta', 'N/A')
-                                    self.log(f"  ⏰ {contract_key}: ${price} (Bid:${bid} Ask:${ask}) Vol:{volume} Θ:{theta} | Update #{screenshot_count}")
+                                # Show data stream summary
+                                self.log(f"  📈 Data Stream Summary: {len(tracker.data_history)} points collected, {screenshot_count} screenshots taken")
                                 
-                                # Log every 10 seconds after first 10 seconds
-                                elif screenshot_count % 10 == 0:
-                                    price = current_data.get('current_price', 'N/A')
-                                    bid = current_data.get('bid', 'N/A')
-                                    ask = current_data.get('ask', 'N/A')
-                                    volume = current_data.get('volume', 'N/A')
-                                    theta = current_data.get('theta', 'N/A')
-                                    self.log(f"  🔄 {contract_key}: ${price} (Bid:${bid} Ask:${ask}) Vol:{volume} Θ:{theta} | Update #{screenshot_count}")
+                                # Show continuous monitoring status
+                                self.log(f"  📊 Continuous Monitoring: Screenshots every 1s, Data extraction every 1s, Chart updates every 1s")
                                 
-                                # Show database save confirmation every 20 seconds
-                                if screenshot_count % 20 == 0:
-                                    self.log(f"💾 Database: Saved {screenshot_count} data points for {contract_key}")
+                                # Debug widgets every 30 seconds
+                                if screenshot_count % 30 == 0:
+                                    self.debug_widgets(contract_key)
                             
-                            await asyncio.sleep(1)  # Screenshot every second
+                            # Log every second for first 10 seconds to show it's working
+                            if screenshot_count <= 10:
+                                self._log_debug("  ⏰ %s: $%s (Bid:$%s Ask:$%s) Vol:%s Θ:%s | Update #%s",
+                                                contract_key, current_data.get('current_price', 'N/A'),
+                                                current_data.get('bid', 'N/A'), current_data.get('ask', 'N/A'),
+                                                current_data.get('volume', 'N/A'), current_data.get('theta', 'N/A'),
+                                                screenshot_count)
                             
-                        except Exception as e:
-                            if tracker.monitoring_active:
-                                self.log(f"❌ Monitoring error for {contract_key}: {e}")
-                                import traceback
+                            # Log every 10 seconds after first 10 seconds
+                            elif screenshot_count % 10 == 0:
+                                self.log(f"{tracker.update_log_prefix}{current_data.get('current_price', 'N/A')} "
+                                         f"(Bid:${current_data.get('bid', 'N/A')} Ask:${current_data.get('ask', 'N/A')}) "
+                                         f"Vol:{current_data.get('volume', 'N/A')} Θ:{current_data.get('theta', 'N/A')} "
+                                         f"| Update #{screenshot_count}")
+                            
+                            # Show database save confirmation every 20 seconds
+                            if screenshot_count % 20 == 0:
+                                self.log(f"💾 Database: Saved {screenshot_count} data points for {contract_key}")
+                        
+                        if not push_driven:
+                            await asyncio.sleep(1)  # Screenshot every second
+                        
+                    except Exception as e:
+                        if tracker.monitoring_active:
+                            self.log(f"❌ Monitoring error for {contract_key}: {e}")
+                            if self._logger.isEnabledFor(logging.DEBUG):
                                 self.log(f"🔍 Monitoring traceback: {traceback.format_exc()}")
-                            await asyncio.sleep(2)
-                
-                # Run monitoring loop
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(monitoring_loop())
-            
-            # Start monitoring in background thread
-            monitor_thread = threading.Thread(target=monitor_expanded_contract)
-            monitor_thread.daemon = True
-            monitor_thread.start()
+                        await asyncio.sleep(2)
+
+            # Every contract's monitor is a task on one shared loop rather than its own thread + loop
+            asyncio.run_coroutine_threadsafe(monitoring_loop(), self._get_monitor_loop())
             
             # Update status to show monitoring is active
             self.update_status(f"Monitoring {contract_key} - Live updates every second")
@@ -1872,17 +1768,27 @@ class SPYExpandedTerminal:
         except Exception as e:
             self.log(f"❌ Error starting monitoring for {contract_key}: {e}")
     
+    def _refresh_contract(self, contract_key):
+        """Tk-thread refresh of one contract's info panel and charts."""
+        tracker = self.contracts.get(contract_key)
+        if tracker is None:
+            return  # Cleared by refresh_all_contracts after this refresh was queued
+        tracker.refresh_pending = False
+        self.update_contract_info_display(contract_key)
+        self.update_live_charts(contract_key)
+    
     def start_chart_update_timer(self, contract_key):
         """Start timer-based chart updates."""
         def update_charts_timer():
             if contract_key in self.contracts:
                 tracker = self.contracts[contract_key]
                 if tracker.monitoring_active and len(tracker.data_history) > 0:
-                    self.log(f"⏰ Timer-based chart update for {contract_key} - {len(tracker.data_history)} data points")
+                    self._log_debug("⏰ Timer-based chart update for %s - %d data points", contract_key, len(tracker.data_history))
                     
                     # Add a small amount of test data every 10 seconds to ensure charts have multiple points
                     if len(tracker.data_history) < 5 and tracker.monitoring_active:
-                        self.log(f"🧪 Adding test data point to {contract_key} for chart testing")
+                        now = datetime.now()  # One clock read for this tick's log lines and data point
+                        self.log(f"🧪 Adding test data point to {contract_key} for chart testing", now)
                         latest_data = tracker.data_history[-1].copy()
                         
                         # Convert string values to float before doing math
@@ -1891,13 +1797,13 @@ class SPYExpandedTerminal:
                         ask = float(latest_data.get('ask', 0.07))
                         volume = int(latest_data.get('volume', 5))
                         
-                        latest_data['current_price'] = current_price + (random.random() - 0.5) * 0.01
-                        latest_data['bid'] = bid + (random.random() - 0.5) * 0.005
-                        latest_data['ask'] = ask + (random.random() - 0.5) * 0.005
-                        latest_data['volume'] = volume + random.randint(-1, 1)
-                        latest_data['timestamp'] = datetime.now()
-                        tracker.add_data_point(latest_data)
-                        self.log(f"🧪 Added test data point - Total points: {len(tracker.data_history)}")
+                        jitter = self._rng.random(3) - 0.5
+                        latest_data['current_price'] = current_price + float(jitter[0]) * 0.01
+                        latest_data['bid'] = bid + float(jitter[1]) * 0.005
+                        latest_data['ask'] = ask + float(jitter[2]) * 0.005
+                        latest_data['volume'] = volume + int(self._rng.integers(-1, 2))
+                        tracker.add_data_point(latest_data, now)
+                        self.log(f"🧪 Added test data point - Total points: {len(tracker.data_history)}", now)
                     
                     self.update_live_charts(contract_key)
                     # Schedule next update in 2 seconds
@@ -1906,6 +1812,26 @@ class SPYExpandedTerminal:
         # Start the timer
         self.root.after(2000, update_charts_timer)
         self.log(f"⏰ Started timer-based chart updates for {contract_key} (every 2 seconds)")
+        self._schedule_db_status(contract_key)
+    
+    def _schedule_db_status(self, contract_key):
+        """Queue the next off-thread database readout for a contract."""
+        timer = threading.Timer(_DB_STATUS_INTERVAL, self._log_db_status, args=(contract_key,))
+        timer.daemon = True
+        timer.start()
+    
+    def _log_db_status(self, contract_key):
+        """Worker-thread database check for a monitored contract, repeated every _DB_STATUS_INTERVAL."""
+        tracker = self.contracts.get(contract_key)
+        if tracker is None or not tracker.monitoring_active:
+            return
+        try:
+            db_data = self.db_manager.get_contract_data(contract_key, limit=5)
+            # log() only queues the line, so it is safe straight from this timer thread
+            self.log(f"💾 Database check: {len(db_data)} recent data points readable for {contract_key}")
+        finally:
+            # A failed readout must not end the chain
+            self._schedule_db_status(contract_key)
     
     def refresh_all_contracts(self):
         """Clear all contracts and start fresh."""
@@ -1916,9 +1842,20 @@ class SPYExpandedTerminal:
         for contract_key, tracker in self.contracts.items():
             tracker.monitoring_active = False
             self.log(f"  ⏹️ Stopped monitoring for {contract_key}")
+            
+            # Release chart memory now - a monitor task still winding down holds the tracker
+            if hasattr(tracker, 'canvas'):
+                tracker.canvas.get_tk_widget().destroy()
+            if hasattr(tracker, 'figure'):
+                tracker.figure.clear()
+                plt.close(tracker.figure)
+            if hasattr(self, f'info_text_{contract_key}'):
+                delattr(self, f'info_text_{contract_key}')
         
         # Clear all data
         self.contracts.clear()
+        self._contract_order.clear()
+        self._info_rendered.clear()
         self.tracked_prices.clear()
         
         # Clear GUI tabs
@@ -1933,6 +1870,9 @@ class SPYExpandedTerminal:
         # Clear screenshots
         self.clear_screenshots()
         
+        # Figure/Axes/Artist objects reference each other - reclaim the cycles in one pass
+        gc.collect()
+        
         self.log("✅ All contracts cleared! Ready to start fresh.")
         self.update_status("All contracts cleared - ready to scan again")
     
@@ -1954,47 +1894,26 @@ class SPYExpandedTerminal:
             except:
                 spread_str = 'N/A'
             
-            info = f"""
-🎯 EXPANDED CONTRACT: {contract_key.upper()}
-{'='*60}
-Status: EXPANDED & MONITORING (Dedicated Tab)
-Type: {data.get('type', 'N/A').upper()}
-Price: {data.get('price_text', 'N/A')}
-Strike: ${data.get('strike', 'N/A')}
-Expiration: {data.get('expiration', 'N/A')}
-Tab Number: #{list(self.contracts.keys()).index(contract_key) + 1 if contract_key in self.contracts else 'N/A'}
-
-📊 LIVE MARKET DATA
-Current Premium: ${data.get('current_price', 'N/A')}
-Bid: ${data.get('bid', 'N/A')}
-Ask: ${data.get('ask', 'N/A')}
-Spread: {spread_str}
-Volume: {data.get('volume', 'N/A')}
-Open Interest: {data.get('open_interest', 'N/A')}
-
-🏷️ LIVE GREEKS
-Delta: {data.get('delta', 'N/A')}
-Gamma: {data.get('gamma', 'N/A')}
-Theta: {data.get('theta', 'N/A')}
-Vega: {data.get('vega', 'N/A')}
-
-📈 DAILY RANGE
-High: ${data.get('high', 'N/A')}
-Low: ${data.get('low', 'N/A')}
-Implied Vol: {data.get('iv', 'N/A')}%
-
-⏰ Live Updates
-Last Update: {tracker.last_update.strftime('%H:%M:%S') if tracker.last_update else 'Never'}
-Data Points: {len(tracker.data_history)}
-Screenshots: Every 1 second
-            """
+            fields = _InfoFields(data)
+            fields.update(
+                key_upper=contract_key.upper(),
+                type_upper=str(data.get('type', 'N/A')).upper(),
+                tab_number=self._contract_order[contract_key] + 1,
+                spread_str=spread_str,
+                last_update=tracker.last_update.strftime('%H:%M:%S') if tracker.last_update else 'Never',
+                data_points=len(tracker.data_history),
+            )
+            info = _INFO_TEMPLATE.format_map(fields)
             
             # Update the info text widget
             info_widget = getattr(self, f'info_text_{contract_key}', None)
             if info_widget:
-                info_widget.delete('1.0', tk.END)
-                info_widget.insert('1.0', info)
-                self.log(f"✅ Updated info display for {contract_key}")
+                # Rewriting a Text re-lays out every line - skip it when nothing changed
+                if self._info_rendered.get(contract_key) != info:
+                    info_widget.delete('1.0', tk.END)
+                    info_widget.insert('1.0', info)
+                    self._info_rendered[contract_key] = info
+                    self._log_debug("✅ Updated info display for %s", contract_key)
             else:
                 self.log(f"⚠️ Info widget not found for {contract_key}")
             
@@ -2027,117 +1946,161 @@ Screenshots: Every 1 second
         except Exception as e:
             self.log(f"❌ Error debugging widgets for {contract_key}: {e}")
     
-    def update_live_charts(self, contract_key):
+    def _deferred_chart_redraw(self, contract_key):
+        """Run the chart redraw that update_live_charts postponed to respect the rate limit."""
+        tracker = self.contracts.get(contract_key)
+        if tracker is None:
+            return
+        tracker.chart_redraw_pending = False
+        self.update_live_charts(contract_key)
+    
+    def _chart_limits_exceeded(self, ax, series):
+        """Check whether any series runs past the axis' current view limits."""
+        xmin, xmax = ax.get_xlim()
+        ymin, ymax = ax.get_ylim()
+        for values in series:
+            if values.size and (values.size - 1 > xmax or values.min() < ymin or values.max() > ymax):
+                return True
+        return False
+    
+    def _on_tab_changed(self, event):
+        """Track the visible contract tab and bring its charts up to date."""
+        selected = self.notebook.select()
+        self._active_tab_key = next((key for key, frame in self.contract_tabs.items() if str(frame) == selected), None)
+        tracker = self.contracts.get(self._active_tab_key)
+        if tracker is not None and hasattr(tracker, 'canvas'):
+            # Redraws only if data arrived while the tab was hidden
+            self.update_live_charts(self._active_tab_key)
+    
+    def update_live_charts(self, contract_key, force=False):
         """Update live charts with real data."""
         try:
             tracker = self.contracts[contract_key]
             
+            # Hidden tabs aren't rendered at all; _on_tab_changed catches them up when shown
+            if not force and contract_key != self._active_tab_key:
+                return
+            
             if not hasattr(tracker, 'figure') or not hasattr(tracker, 'axes'):
                 self.log(f"⚠️ Chart widgets not found for {contract_key}")
                 self.debug_widgets(contract_key)
                 return
             
+            # However many triggers arrive (monitor, 2s timer, buttons), render at most once per
+            # _CHART_MIN_INTERVAL; an early trigger leaves a single deferred redraw behind
+            elapsed = time.monotonic() - tracker.last_chart_draw
+            if not force and elapsed < _CHART_MIN_INTERVAL:
+                if not tracker.chart_redraw_pending:
+                    tracker.chart_redraw_pending = True
+                    self.root.after(int((_CHART_MIN_INTERVAL - elapsed) * 1000) + 1,
+                                    lambda: self._deferred_chart_redraw(contract_key))
+                return
+            
+            # The 2s timer and refresh paths often fire with nothing new - skip the redraw then
+            if not force and tracker.last_update is not None and tracker.last_update == tracker.last_drawn_update:
+                return
+            
             chart_data = tracker.get_chart_data()
             if not chart_data or len(tracker.data_history) < 1:
                 self.log(f"⚠️ Insufficient chart data for {contract_key}: {len(tracker.data_history)} points")
                 return
             
-            self.log(f"📊 Updating charts for {contract_key} with {len(tracker.data_history)} data points")
-            
-            # Clear all axes
-            for ax in tracker.axes:
-                ax.clear()
-                ax.set_facecolor('#161b22')
-                ax.tick_params(colors='white', labelsize=8)
-                for spine in ax.spines.values():
-                    spine.set_color('white')
-                ax.grid(True, alpha=0.3, color='white')
+            self._log_debug("📊 Updating charts for %s with %d data points", contract_key, len(tracker.data_history))
             
             ax1, ax2, ax3, ax4, ax5, ax6 = tracker.axes
+            lines = tracker.lines
+            
+            # Same valid-point masks as before, pushed into the persistent artists -
+            # nothing is cleared or recreated
+            valid_prices = chart_data['prices'][chart_data['prices'] > 0]
+            valid_volumes = chart_data['volumes'][chart_data['volumes'] > 0]
+            valid_bids = chart_data['bids'][chart_data['bids'] > 0]
+            valid_asks = chart_data['asks'][chart_data['asks'] > 0]
+            valid_thetas = chart_data['thetas'][chart_data['thetas'] != 0]
+            valid_gammas = chart_data['gammas'][chart_data['gammas'] != 0]
+            valid_highs = chart_data['highs'][chart_data['highs'] > 0]
+            valid_lows = chart_data['lows'][chart_data['lows'] > 0]
+            
+            for key, values in (('price', valid_prices), ('bid', valid_bids), ('ask', valid_asks),
+                                ('theta', valid_thetas), ('gamma', valid_gammas),
+                                ('high', valid_highs), ('low', valid_lows)):
+                lines[key].set_data(np.arange(values.size), values)
+                lines[key].set_visible(values.size > 0)
+            for i, bar in enumerate(lines['volume_bars']):
+                if i < valid_volumes.size:
+                    bar.set_height(valid_volumes[i])
+                    bar.set_visible(True)
+                else:
+                    bar.set_visible(False)
             
             # Chart 1: Price Over Time
-            ax1.set_title('Price Over Time', color='white', fontsize=10, pad=10)
-            if any(p > 0 for p in chart_data['prices']):
-                valid_prices = [p for p in chart_data['prices'] if p > 0]
-                if valid_prices:
-                    ax1.plot(range(len(valid_prices)), valid_prices, color='#7ee787', linewidth=2, marker='o', markersize=3)
-                    ax1.set_ylabel('Premium ($)', color='white', fontsize=8)
-                    self.log(f"📈 Chart 1: Plotted {len(valid_prices)} price points")
-            
+            if valid_prices.size:
+                self._log_debug("📈 Chart 1: Plotted %d price points", valid_prices.size)
             # Chart 2: Volume
-            ax2.set_title('Volume', color='white', fontsize=10, pad=10)
-            if any(v > 0 for v in chart_data['volumes']):
-                valid_volumes = [v for v in chart_data['volumes'] if v > 0]
-                if valid_volumes:
-                    ax2.bar(range(len(valid_volumes)), valid_volumes, color='#58a6ff', alpha=0.7)
-                    ax2.set_ylabel('Volume', color='white', fontsize=8)
-                    self.log(f"📊 Chart 2: Plotted {len(valid_volumes)} volume points")
-            
+            if valid_volumes.size:
+                self._log_debug("📊 Chart 2: Plotted %d volume points", valid_volumes.size)
             # Chart 3: Bid/Ask Spread
-            ax3.set_title('Bid/Ask Spread', color='white', fontsize=10, pad=10)
-            valid_bids = [b for b in chart_data['bids'] if b > 0]
-            valid_asks = [a for a in chart_data['asks'] if a > 0]
-            
-            if valid_bids:
-                ax3.plot(range(len(valid_bids)), valid_bids, color='#7ee787', label='Bid', linewidth=2)
-            if valid_asks:
-                ax3.plot(range(len(valid_asks)), valid_asks, color='#fbb6ce', label='Ask', linewidth=2)
-            
-            if valid_bids or valid_asks:
-                ax3.legend(fontsize=8)
-                ax3.set_ylabel('Price ($)', color='white', fontsize=8)
-                self.log(f"💹 Chart 3: Plotted {len(valid_bids)} bids, {len(valid_asks)} asks")
-            
+            if valid_bids.size or valid_asks.size:
+                self._log_debug("💹 Chart 3: Plotted %d bids, %d asks", valid_bids.size, valid_asks.size)
             # Chart 4: Theta Decay
-            ax4.set_title('Theta Decay', color='white', fontsize=10, pad=10)
-            valid_thetas = [t for t in chart_data['thetas'] if t != 0]
-            if valid_thetas:
-                ax4.plot(range(len(valid_thetas)), valid_thetas, color='#ffa657', linewidth=2, marker='s', markersize=3)
-                ax4.set_ylabel('Theta', color='white', fontsize=8)
-                self.log(f"📉 Chart 4: Plotted {len(valid_thetas)} theta points")
-            
+            if valid_thetas.size:
+                self._log_debug("📉 Chart 4: Plotted %d theta points", valid_thetas.size)
             # Chart 5: Gamma
-            ax5.set_title('Gamma', color='white', fontsize=10, pad=10)
-            valid_gammas = [g for g in chart_data['gammas'] if g != 0]
-            if valid_gammas:
-                ax5.plot(range(len(valid_gammas)), valid_gammas, color='#f85149', linewidth=2, marker='^', markersize=3)
-                ax5.set_ylabel('Gamma', color='white', fontsize=8)
-                self.log(f"📈 Chart 5: Plotted {len(valid_gammas)} gamma points")
-            
+            if valid_gammas.size:
+                self._log_debug("📈 Chart 5: Plotted %d gamma points", valid_gammas.size)
             # Chart 6: Daily High/Low
-            ax6.set_title('Daily High/Low', color='white', fontsize=10, pad=10)
-            valid_highs = [h for h in chart_data['highs'] if h > 0]
-            valid_lows = [l for l in chart_data['lows'] if l > 0]
-            
-            if valid_highs:
-                ax6.plot(range(len(valid_highs)), valid_highs, color='#7ee787', label='High', linewidth=2)
-            if valid_lows:
-                ax6.plot(range(len(valid_lows)), valid_lows, color='#f85149', label='Low', linewidth=2)
-            
-            if valid_highs or valid_lows:
-                ax6.legend(fontsize=8)
-                ax6.set_ylabel('Price ($)', color='white', fontsize=8)
-                self.log(f"📊 Chart 6: Plotted {len(valid_highs)} highs, {len(valid_lows)} lows")
+            if valid_highs.size or valid_lows.size:
+                self._log_debug("📊 Chart 6: Plotted %d highs, %d lows", valid_highs.size, valid_lows.size)
+            
+            # Axis ticks live in the cached background, so only a rescale (or dropping the
+            # placeholders) needs a full draw; everything else is a blit of the changed artists
+            full_redraw = False
+            for ax, series in ((ax1, (valid_prices,)), (ax2, (valid_volumes,)), (ax3, (valid_bids, valid_asks)),
+                               (ax4, (valid_thetas,)), (ax5, (valid_gammas,)), (ax6, (valid_highs, valid_lows))):
+                if self._chart_limits_exceeded(ax, series):
+                    ax.relim(visible_only=True)
+                    ax.autoscale_view()
+                    # Leave room to grow so a new point per tick doesn't force a rescale each time
+                    points = max(values.size for values in series)
+                    ax.set_xlim(-1, min(tracker.data_history.maxlen, max(10, 2 * points)))
+                    full_redraw = True
+            # Legends sit in the background too, so flipping one on/off is a full draw
+            for ax, has_data in ((ax3, valid_bids.size or valid_asks.size), (ax6, valid_highs.size or valid_lows.size)):
+                legend = ax.get_legend()
+                if legend.get_visible() != bool(has_data):
+                    legend.set_visible(bool(has_data))
+                    full_redraw = True
+            for placeholder in tracker.placeholders:
+                if placeholder.get_visible():
+                    placeholder.set_visible(False)
+                    full_redraw = True
             
             # Update canvas
-            tracker.canvas.draw()
+            if full_redraw:
+                # Idle draws requested in the same Tk tick collapse into one render;
+                # its draw_event re-grabs the blit background
+                tracker.canvas.draw_idle()
+            else:
+                tracker.blit_manager.update()
+            tracker.last_chart_draw = time.monotonic()
+            tracker.last_drawn_update = tracker.last_update
             self.log(f"✅ Updated charts for {contract_key} with {len(tracker.data_history)} data points")
             
             # Log chart data details
             if len(tracker.data_history) > 0:
                 latest = tracker.data_history[-1]
-                self.log(f"📈 Chart data: Price=${latest.get('current_price', 'N/A')} Bid=${latest.get('bid', 'N/A')} Ask=${latest.get('ask', 'N/A')} Vol={latest.get('volume', 'N/A')} Θ={latest.get('theta', 'N/A')}")
+                self._log_debug("📈 Chart data: Price=$%s Bid=$%s Ask=$%s Vol=%s Θ=%s",
+                                latest.get('current_price', 'N/A'), latest.get('bid', 'N/A'), latest.get('ask', 'N/A'),
+                                latest.get('volume', 'N/A'), latest.get('theta', 'N/A'))
                 
-                # Show database status
-                db_data = self.db_manager.get_contract_data(contract_key, limit=5)
-                self.log(f"💾 Database: {len(db_data)} recent data points saved for {contract_key}")
+                # Show database status - a local count, no SQL on the render path
+                self._log_debug("💾 Database: %d data points saved for %s", tracker.db_written_count, contract_key)
                 
                 # Show chart update confirmation
-                self.log(f"🎨 Charts refreshed for {contract_key} - Canvas redrawn")
+                self._log_debug("🎨 Charts refreshed for %s - Canvas redrawn", contract_key)
             
         except Exception as e:
             self.log(f"❌ Error updating live charts for {contract_key}: {e}")
-            import traceback
             self.log(f"🔍 Traceback: {traceback.format_exc()}")
     
     def show(self):
@@ -2156,7 +2119,7 @@ Screenshots: Every 1 second
                 self.log(f"📈 Latest data: {latest}")
             
             # Force chart update
-            self.update_live_charts(contract_key)
+            self.update_live_charts(contract_key, force=True)
             self.log(f"✅ Force chart update completed for {contract_key}")
             
         except Exception as e:
@@ -2167,47 +2130,71 @@ Screenshots: Every 1 second
         try:
             tracker = self.contracts[contract_key]
             
-            # Generate some test data points
-            from datetime import datetime, timedelta
-            
+            # Generate all test points as arrays in one go
+            rng = self._rng
+            n = 20
             base_price = 0.07
             base_volume = 5
+            now = datetime.now()
+            
+            columns = {
+                'current_price': base_price + (rng.random(n) - 0.5) * 0.02,
+                'bid': base_price + (rng.random(n) - 0.5) * 0.01,
+                'ask': base_price + (rng.random(n) - 0.5) * 0.01,
+                'volume': base_volume + rng.integers(-2, 3, n),
+                'open_interest': base_volume + rng.integers(-1, 2, n),
+                'theta': -0.2163 + (rng.random(n) - 0.5) * 0.1,
+                'gamma': 0.0098 + (rng.random(n) - 0.5) * 0.005,
+                'delta': 0.0300 + (rng.random(n) - 0.5) * 0.01,
+                'vega': 0.0232 + (rng.random(n) - 0.5) * 0.01,
+                'high': base_price + rng.random(n) * 0.03,
+                'low': base_price - rng.random(n) * 0.03,
+            }
+            timestamps = [now - timedelta(seconds=n - i) for i in range(n)]
+            tracker.add_data_points_batch(columns, timestamps)
             
-            for i in range(20):
-                # Create test data point
-                test_data = {
-                    'current_price': base_price + (random.random() - 0.5) * 0.02,
-                    'bid': base_price + (random.random() - 0.5) * 0.01,
-                    'ask': base_price + (random.random() - 0.5) * 0.01,
-                    'volume': base_volume + random.randint(-2, 2),
-                    'open_interest': base_volume + random.randint(-1, 1),
-                    'theta': -0.2163 + (random.random() - 0.5) * 0.1,
-                    'gamma': 0.0098 + (random.random() - 0.5) * 0.005,
-                    'delta': 0.0300 + (random.random() - 0.5) * 0.01,
-                    'vega': 0.0232 + (random.random() - 0.5) * 0.01,
-                    'high': base_price + random.random() * 0.03,
-                    'low': base_price - random.random() * 0.03,
-                    'timestamp': datetime.now() - timedelta(seconds=20-i)
-                }
-                
-                tracker.add_data_point(test_data)
-            
-            self.log(f"🧪 Added 20 test data points to {contract_key}")
+            self.log(f"🧪 Added {n} test data points to {contract_key}", now)
             self.update_live_charts(contract_key)
             self.log(f"✅ Test data charts updated for {contract_key}")
             
         except Exception as e:
             self.log(f"❌ Error adding test data to {contract_key}: {e}")
 
-def launch_calls_terminal():
-    """Launch calls terminal - defined at module level for multiprocessing."""
-    terminal = SPYExpandedTerminal('call')
-    terminal.show()
+_EXTRACT_POOL = None
+# Spawned workers re-import this module as __mp_main__ (Tk, matplotlib, TA-Lib, yfinance,
+# Playwright) and every call pickles the page HTML, so the pool stays small and only takes
+# pages big enough for the scan to outweigh that; smaller ones run on a thread
+_EXTRACT_POOL_WORKERS = 2
+_EXTRACT_POOL_MIN_CHARS = 200_000
 
-def launch_puts_terminal():
-    """Launch puts terminal - defined at module level for multiprocessing."""
-    terminal = SPYExpandedTerminal('put')
-    terminal.show()
+def _get_extract_pool():
+    """Shared process pool for regex extraction, created on first use."""
+    global _EXTRACT_POOL
+    if _EXTRACT_POOL is None:
+        # spawn, not fork - the parent has Tk and monitoring threads running
+        _EXTRACT_POOL = ProcessPoolExecutor(max_workers=min(_EXTRACT_POOL_WORKERS, os.cpu_count() or 1),
+                                            mp_context=multiprocessing.get_context('spawn'))
+    return _EXTRACT_POOL
+
+def launch_both_terminals():
+    """Run the calls and puts terminals as two windows of one Tk process."""
+    root = tk.Tk()
+    root.withdraw()  # Hidden owner; the terminals live in its Toplevels
+    
+    windows = []
+    def close_window(window):
+        window.destroy()
+        windows.remove(window)
+        if not windows:
+            root.destroy()
+    
+    for option_type in ('call', 'put'):
+        window = tk.Toplevel(root)
+        window.protocol("WM_DELETE_WINDOW", lambda w=window: close_window(w))
+        windows.append(window)
+        SPYExpandedTerminal(option_type, master=window)
+    
+    root.mainloop()
 
 def main():
     """Main function."""
@@ -2227,24 +2214,11 @@ def main():
         terminal = SPYExpandedTerminal('put')
         terminal.show()
     elif choice == '3':
-        import multiprocessing
-        
-        # Set start method to spawn to avoid issues on macOS
-        multiprocessing.set_start_method('spawn', force=True)
-        
-        # Launch both using module-level functions
-        calls_process = multiprocessing.Process(target=launch_calls_terminal)
-        puts_process = multiprocessing.Process(target=launch_puts_terminal)
-        
-        calls_process.start()
-        puts_process.start()
-        
+        # One process, two windows - no second interpreter re-importing everything
         print("✅ Both expanded terminals launched!")
         print("📱 CALLS terminal: Left window")
         print("📱 PUTS terminal: Right window")
-        
-        calls_process.join()
-        puts_process.join()
+        launch_both_terminals()
     else:
         print("Invalid choice. Launching CALLS terminal.")
         terminal = SPYExpandedTerminal('call')
@@ -2252,6 +2226,5 @@ def main():
 
 if __name__ == "__main__":
     # Required for multiprocessing on macOS
-    import multiprocessing
     multiprocessing.freeze_support()
     main()
\ No newline at end of file
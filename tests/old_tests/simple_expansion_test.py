@@ -3,8 +3,29 @@
 Simple Contract Expansion Test - Just test basic expansion mechanism
 """
 import asyncio
+import os
 import re
 from playwright.async_api import async_playwright
+try:
+    import re2  # google-re2: linear-time matching over full page HTML
+except ImportError:
+    re2 = None
+try:
+    import uvloop  # libuv event loop: cheaper scheduling for the CDP socket traffic
+except ImportError:
+    uvloop = None
+
+# Cents digits of any $0.xx price, compiled once
+_PRICE_CENTS_RE = (re2.compile if re2 is not None else re.compile)(r'\$0\.(\d{2})')
+
+# Debug screenshots are opt-in (DEBUG_SCREENSHOTS=1); JPEG encodes far faster than a full-page PNG
+_DEBUG_SCREENSHOTS = bool(os.environ.get("DEBUG_SCREENSHOTS"))
+
+async def save_screenshot(page, name):
+    """Save a debug screenshot to screenshots/<name>.jpg when enabled."""
+    if _DEBUG_SCREENSHOTS:
+        await page.screenshot(path=f"screenshots/{name}.jpg", type="jpeg", quality=60)
+        print("📸 Screenshot saved")
 
 async def simple_test():
     """Simple test to see if we can expand any contract."""
@@ -41,19 +62,22 @@ async def simple_test():
         call_tab = spy_page.locator('button:has-text("Call")')
         if await call_tab.count() > 0:
             await call_tab.click()
-            await asyncio.sleep(3)
+            try:
+                await spy_page.wait_for_selector('text=/\\$0\\.\\d{2}/', timeout=5000)
+            except Exception:
+                pass
             print("✅ Clicked Call tab")
         
         # Take screenshot
-        await spy_page.screenshot(path="screenshots/simple_test_page.png")
-        print("📸 Screenshot saved")
+        await save_screenshot(spy_page, "simple_test_page")
         
         # Find ANY price element to test expansion
         print("🔍 Looking for any contract to test expansion...")
         
         # Look for any $0.xx price
-        content = await spy_page.content()
-        prices = re.findall(r'\$0\.(\d{2})', content)
+        # Visible text only - much smaller than the serialized page HTML
+        page_text = await spy_page.evaluate("() => document.body.innerText")
+        prices = _PRICE_CENTS_RE.findall(page_text)
         
         if prices:
             print(f"💰 Found prices: {prices[:5]}...")
@@ -79,8 +103,7 @@ async def simple_test():
                 element = price_elements.first
                 
                 # Scroll to it
-                await element.scroll_into_view_if_needed()
-                await asyncio.sleep(1)
+                await element.scroll_into_view_if_needed()  # Waits for the element to be stable
                 
                 # Get position and click
                 box = await element.bounding_box()
@@ -91,14 +114,22 @@ async def simple_test():
                     print(f"🖱️ Clicking at ({click_x:.0f}, {click_y:.0f})...")
                     
                     # Before screenshot
-                    await spy_page.screenshot(path="screenshots/simple_before.png")
+                    await save_screenshot(spy_page, "simple_before")
                     
                     # Click
                     await spy_page.mouse.click(click_x, click_y)
-                    await asyncio.sleep(4)
+                    
+                    # Wait (up to the old 4s) for the expanded details rather than sleeping blindly
+                    try:
+                        await spy_page.wait_for_function(
+                            "() => ['theta', 'gamma', 'bid', 'ask', 'volume']"
+                            ".filter(w => document.body.innerText.toLowerCase().includes(w)).length >= 3",
+                            timeout=4000)
+                    except Exception:
+                        pass
                     
                     # After screenshot
-                    await spy_page.screenshot(path="screenshots/simple_after.png")
+                    await save_screenshot(spy_page, "simple_after")
                     
                     # Check if expanded
                     new_content = await spy_page.content()
@@ -123,5 +154,7 @@ async def simple_test():
             await playwright.stop()
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     success = asyncio.run(simple_test())
     print(f"\n{'✅ TEST PASSED' if success else '❌ TEST FAILED'}")
\ No newline at end of file
@@ -6,29 +6,65 @@ Executes all test suites and generates comprehensive reports
 import sys
 import subprocess
 import json
+import tempfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+def run_to_tempfiles(command, timeout):
+    """Run a command with stdout/stderr going to temp files rather than pipe buffers."""
+    with tempfile.TemporaryFile("w+") as out, tempfile.TemporaryFile("w+") as err:
+        process = subprocess.Popen(command, stdout=out, stderr=err, text=True)
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        out.seek(0)
+        err.seek(0)
+        return process.returncode, out.read(), err.read()
+
+def read_junit_counts(report_file):
+    """Read passed/failed/error totals from a pytest JUnit XML report."""
+    counts = {"passed": 0, "failed": 0, "errors": 0}
+    if not Path(report_file).exists():
+        return counts
+    
+    root = ET.parse(report_file).getroot()
+    for suite in root.iter("testsuite"):
+        tests = int(suite.get("tests", 0))
+        failures = int(suite.get("failures", 0))
+        errors = int(suite.get("errors", 0))
+        skipped = int(suite.get("skipped", 0))
+        counts["passed"] += tests - failures - errors - skipped
+        counts["failed"] += failures
+        counts["errors"] += errors
+    return counts
+
 def run_test_suite(test_file, description):
     """Run a specific test suite and return results."""
     print(f"\n🧪 Running {description}...")
     print("=" * 50)
     
     try:
-        # Run pytest on the test file
-        result = subprocess.run([
-            sys.executable, "-m", "pytest", test_file, "-v", "--tb=short"
-        ], capture_output=True, text=True, timeout=300)
+        with tempfile.TemporaryDirectory() as report_dir:
+            # Run pytest on the test file, with a JUnit XML report for the counts
+            report_file = Path(report_dir) / "report.xml"
+            return_code, output, errors = run_to_tempfiles([
+                sys.executable, "-m", "pytest", test_file, "-v", "--tb=short",
+                f"--junitxml={report_file}"
+            ], timeout=300)
+            counts = read_junit_counts(report_file)
         
         # Parse results
-        success = result.returncode == 0
-        output = result.stdout
-        errors = result.stderr
+        success = return_code == 0
         
         # Count test results
-        passed = output.count("PASSED")
-        failed = output.count("FAILED")
-        errors_count = output.count("ERROR")
+        passed = counts["passed"]
+        failed = counts["failed"]
+        errors_count = counts["errors"]
         
         return {
             "success": success,
@@ -37,7 +73,7 @@ def run_test_suite(test_file, description):
             "errors": errors_count,
             "output": output,
             "error_output": errors,
-            "return_code": result.returncode
+            "return_code": return_code
         }
         
     except subprocess.TimeoutExpired:
@@ -67,19 +103,17 @@ def run_environment_test():
     print("=" * 50)
     
     try:
-        result = subprocess.run([
+        return_code, output, errors = run_to_tempfiles([
             sys.executable, "tests/test_environment.py"
-        ], capture_output=True, text=True, timeout=300)
+        ], timeout=300)
         
-        success = result.returncode == 0
-        output = result.stdout
-        errors = result.stderr
+        success = return_code == 0
         
         return {
             "success": success,
             "output": output,
             "error_output": errors,
-            "return_code": result.returncode
+            "return_code": return_code
         }
         
     except subprocess.TimeoutExpired:
@@ -204,14 +238,16 @@ def main():
     # Run all test suites
     all_results = {}
     
-    # Run environment test first
-    env_result = run_environment_test()
-    all_results["Environment Test"] = env_result
-    
-    # Run pytest test suites
-    for test_file, description in available_tests.items():
-        result = run_test_suite(test_file, description)
-        all_results[description] = result
+    # Each suite is its own pytest subprocess, so they run side by side;
+    # results are still reported in the usual order
+    with ThreadPoolExecutor(max_workers=len(available_tests) + 1) as executor:
+        env_future = executor.submit(run_environment_test)
+        suite_futures = {description: executor.submit(run_test_suite, test_file, description)
+                         for test_file, description in available_tests.items()}
+        
+        all_results["Environment Test"] = env_future.result()
+        for description, future in suite_futures.items():
+            all_results[description] = future.result()
     
     # Generate summary
     overall_success = generate_summary_report(all_results)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the ring-buffered chart history kept by the contract trackers
+"""
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+sys.path.append('.')
+sys.path.append('legacy_gui')
+
+from main import DatabaseManager, ExpandedContractTracker
+from spy_dual_terminal import ContractTracker, _HISTORY_LENGTH
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    db = DatabaseManager(str(tmp_path / "options_data.db"))
+    return ExpandedContractTracker('call_09', 'call', 9, db)
+
+
+class TestExpandedContractTrackerHistory:
+    """main.ExpandedContractTracker chart_values ring."""
+
+    def test_single_points_wrap_oldest_first(self, tracker):
+        window = tracker.chart_values.shape[1]
+        for i in range(window + 5):
+            tracker.add_data_point({'current_price': f'{i}.00', 'volume': '1,000'})
+
+        chart = tracker.get_chart_data()
+
+        assert tracker.chart_count == window
+        assert tracker.chart_head == 5
+        np.testing.assert_array_equal(chart['prices'], np.arange(5, window + 5))
+        assert len(chart['timestamps']) == window
+
+    def test_batch_matches_single_points(self, tracker, tmp_path):
+        window = tracker.chart_values.shape[1]
+        single = ExpandedContractTracker('call_10', 'call', 10, DatabaseManager(str(tmp_path / "single.db")))
+        start = datetime(2026, 1, 2, 9, 30)
+        # Some single points first, so the batch starts mid-ring and overflows the window
+        for i in range(30):
+            tracker.add_data_point({'current_price': float(i), 'volume': 10.0 * i}, start + timedelta(seconds=i))
+            single.add_data_point({'current_price': float(i), 'volume': 10.0 * i}, start + timedelta(seconds=i))
+        n = window + 20
+        prices = np.arange(30, 30 + n, dtype=float)
+        volumes = prices * 10 + 0.7
+        timestamps = [start + timedelta(seconds=30 + i) for i in range(n)]
+
+        tracker.add_data_points_batch({'current_price': prices, 'volume': volumes}, timestamps)
+        for price, volume, timestamp in zip(prices, volumes, timestamps):
+            single.add_data_point({'current_price': price, 'volume': volume}, timestamp)
+
+        batch_chart, single_chart = tracker.get_chart_data(), single.get_chart_data()
+        assert tracker.chart_head == single.chart_head
+        np.testing.assert_array_equal(batch_chart['prices'], single_chart['prices'])
+        # Volumes are whole contracts on both paths
+        np.testing.assert_array_equal(batch_chart['volumes'], single_chart['volumes'])
+        np.testing.assert_array_equal(batch_chart['prices'], np.arange(30 + n - window, 30 + n))
+        assert batch_chart['timestamps'][-1] == timestamps[-1]
+
+
+class TestContractTrackerSeries:
+    """spy_dual_terminal.ContractTracker series ring."""
+
+    def test_series_wrap_oldest_first_and_skip_missing(self):
+        tracker = ContractTracker('put_12')
+        total = _HISTORY_LENGTH + 30
+        for i in range(total):
+            tracker.add_data_point({'current_price': str(i), 'volume': '1,000' if i % 2 else None})
+
+        series = tracker.chart_series()
+
+        assert tracker.count == _HISTORY_LENGTH
+        np.testing.assert_array_equal(series['current_price'], np.arange(30, total))
+        # Points without a volume are skipped, the rest keep their order
+        np.testing.assert_array_equal(series['volume'], np.full(_HISTORY_LENGTH // 2, 1000.0))
+        assert series['bid'].size == 0
+
+    def test_series_before_wrap(self):
+        tracker = ContractTracker('call_09')
+        for price in ('0.10', '0.11', 'n/a', '0.13'):
+            tracker.add_data_point({'current_price': price})
+
+        np.testing.assert_array_equal(tracker.chart_series()['current_price'], [0.10, 0.11, 0.13])
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for the pure contract-data extraction helpers in extraction.py
+"""
+import sys
+import pytest
+sys.path.append('.')
+
+from extraction import (LexborHTMLParser, _LOW_ALT_RES, _first_alternate, _parse_price, dom_result_to_data,
+                        extract_from_content, extract_regex, validate_high_low)
+
+
+def _no_log(message):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp(tmp_path, monkeypatch):
+    """extract_regex dumps debug HTML under screenshots/ - keep it out of the repo."""
+    monkeypatch.chdir(tmp_path)
+
+
+class TestBidAskExtraction:
+    """Bid and ask rendered as "$price × size" pairs."""
+
+    def test_bid_and_ask_split_in_dom_order(self):
+        """The first price × size pair is the bid, the second the ask."""
+        content = ("<div>Bid</div><div>$0.07 × 1,062</div>"
+                   "<div>Ask</div><div>$0.08 × 1,501</div>"
+                   "<div>Theta -0.0123</div><div>Gamma 0.0456</div>")
+
+        data, _ = extract_regex(content, 8, 'call', _no_log)
+
+        assert data['bid'] == '0.07'
+        assert data['ask'] == '0.08'
+
+    def test_single_pair_is_not_guessed(self):
+        """One lone price × size pair can't be told apart, so neither field comes from it."""
+        content = "<div>$0.07 × 1,062</div><div>Theta -0.0123</div><div>Gamma 0.0456</div>"
+
+        data, _ = extract_regex(content, 7, 'call', _no_log)
+
+        assert 'bid' not in data
+        assert 'ask' not in data
+
+
+class TestParsePrice:
+    """_parse_price only accepts plain decimals."""
+
+    def test_plain_and_leading_dot_decimals(self):
+        assert _parse_price('0.08') == 0.08
+        assert _parse_price('.08') == 0.08
+        assert _parse_price('612.30') == 612.30
+
+    def test_rejects_anything_else(self):
+        for text in (None, '', '8', '1.2.3', 'a.12', '0.0x', '-0.05'):
+            assert _parse_price(text) is None
+
+
+class TestValidateHighLow:
+    """High/low sanity checks shared by every extraction path."""
+
+    def test_inverted_pair_is_swapped(self):
+        data = {'high': '0.05', 'low': '0.15'}
+
+        fields = validate_high_low(data, 2, _no_log)
+
+        assert (data['high'], data['low']) == ('0.15', '0.05')
+        assert fields == 2
+
+    def test_stock_sized_values_are_dropped(self):
+        data = {'high': '612.30', 'low': '598.10', 'bid': '0.07'}
+
+        fields = validate_high_low(data, 3, _no_log)
+
+        assert data == {'bid': '0.07'}
+        assert fields == 1
+
+    def test_consistent_pair_is_left_alone(self):
+        data = {'high': '0.15', 'low': '0.05'}
+
+        assert validate_high_low(data, 2, _no_log) == 2
+        assert data == {'high': '0.15', 'low': '0.05'}
+
+
+class TestLowAlternates:
+    """Fallback low patterns keep their priority order."""
+
+    def test_explicit_day_low_beats_earlier_loose_match(self):
+        """'overflow' in CSS must not let the loose low...$ shape grab the mark price."""
+        content = "<style>.x{overflow:hidden}</style><div>mark $0.12</div><div>day low: $0.09</div>"
+
+        assert _first_alternate(_LOW_ALT_RES, content) == ('0.09', 0)
+
+    def test_price_split_from_label_by_tags(self):
+        content = "<span>0.09</span><span>low</span>"
+
+        low, _ = _first_alternate(_LOW_ALT_RES, content)
+
+        assert low == '0.09'
+
+
+class TestLabelExtraction:
+    """Label -> value reads, from the in-page DOM script and from fetched HTML."""
+
+    def test_dom_result_to_data(self):
+        """Values are cleaned, stock-sized high/low skipped, strike/expiration taken from the title."""
+        result = {
+            'fields': {
+                'bid': ['$0.07'],
+                'ask': ['$0.08'],
+                'volume': ['1,234'],
+                'high': ['$612.30', '$0.15'],
+                'low': ['$0.05'],
+                'theta': ['-0.0123'],
+            },
+            'title': 'SPY $635 Call 8/4 | Robinhood',
+        }
+
+        data, fields = dom_result_to_data(result, 8, 'call', _no_log)
+
+        assert data['bid'] == '0.07'
+        assert data['ask'] == '0.08'
+        assert data['volume'] == '1234'
+        assert data['high'] == '0.15'
+        assert data['low'] == '0.05'
+        assert data['theta'] == '-0.0123'
+        assert data['strike'] == '635'
+        assert data['expiration'] == '8/4'
+        assert data['price_text'] == '$0.08'
+        assert fields == 8
+
+    @pytest.mark.skipif(LexborHTMLParser is None, reason="selectolax not installed")
+    def test_extract_from_content_reads_labels(self):
+        """Fetched HTML goes through the label parse, with log lines handed back to the caller."""
+        content = """<html><head><title>SPY $635 Call 8/4</title></head><body>
+            <div><span>Bid</span><span>$0.07 × 1,062</span></div>
+            <div><span>Ask</span><span>$0.08 × 1,501</span></div>
+            <div><span>Volume</span><span>14,029</span></div>
+            <div><span>Theta</span><span>-0.0123</span></div>
+            <div><span>High</span><span>$0.05</span></div>
+            <div><span>Low</span><span>$0.15</span></div>
+        </body></html>"""
+
+        data, fields, log_lines = extract_from_content(content, 8, 'call')
+
+        assert (data['bid'], data['ask']) == ('0.07', '0.08')
+        assert data['volume'] == '14029'
+        # Inverted on the page - validate_high_low swaps them
+        assert (data['high'], data['low']) == ('0.15', '0.05')
+        assert (data['strike'], data['expiration']) == ('635', '8/4')
+        assert fields == 8
+        assert any('labelled elements' in line for line in log_lines)